@@ -1,17 +1,41 @@
 import streamlit as st
 from streamlit_option_menu import option_menu
 from streamlit_extras.add_vertical_space import add_vertical_space
-import PyPDF2
 import os
-import google.generativeai as genai
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+import hashlib
 import pandas as pd
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from dotenv import load_dotenv
+from pdf_text import extract_text, get_pdf_text_cache
+from gemini_client import call_stats
+from llm_backends import default_provider, get_backend
+from llm_cache import cached_generate, cached_stream, get_response_cache
+from driver_pool import configured_pool_size, get_driver_pool
+from job_details import get_description_fetcher
+from job_dedupe import collapse_duplicates, find_duplicate_clusters
+from job_store import get_job_store, job_key
+from job_search import get_job_index, sync_job_index, top_jobs_for_resume
+from score_schema import ATS_SCHEMA, JOB_MATCH_SCHEMA, generation_config_for, job_match_batch_schema, parse_structured_response
+from linkedin_scraper import iter_search_pages, readiness_stats, scrape_many, scrape_search_page
+from resume_parser import local_match_scores, parse_resume
+from skill_taxonomy import get_skill_taxonomy
+from token_budget import count_tokens, fit_job_description
+from prompts import (
+    PROMPT_VERSIONS,
+    build_resume_analysis_prompt,
+    build_job_match_prompt,
+    build_job_match_json_prompt,
+    build_job_match_batch_prompt,
+    build_tailored_resume_prompt,
+    build_skill_gap_prompt,
+    build_interview_questions_prompt,
+    build_ats_compatibility_prompt,
+    build_ats_compatibility_json_prompt,
+    build_career_recommendations_prompt,
+)
 
 # Load environment variables
 load_dotenv()
@@ -177,410 +201,479 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# LLM provider selected by LLM_BACKEND and the API key each provider reads from the environment
+LLM_PROVIDER = default_provider()
+PROVIDER_KEYS = {
+    "gemini": ("Google Gemini", "GEMINI_API_KEY"),
+    "openai": ("OpenAI", "OPENAI_API_KEY"),
+}
+
+# Maximum number of concurrent Gemini requests for the full report
+FULL_REPORT_MAX_WORKERS = int(os.getenv("FULL_REPORT_MAX_WORKERS", "6"))
+
+# Minimum seconds between page loads on the same domain when scraping in parallel
+SCRAPER_MIN_INTERVAL = float(os.getenv("SCRAPER_MIN_INTERVAL", "1.0"))
+
+# Maximum seconds to wait for search results to render before giving up on a page
+SCRAPER_PAGE_TIMEOUT = float(os.getenv("SCRAPER_PAGE_TIMEOUT", "10"))
+
+# Job descriptions packed into one matrix-scoring request (count and total prompt tokens)
+MATRIX_JOBS_PER_REQUEST = int(os.getenv("MATRIX_JOBS_PER_REQUEST", "5"))
+MATRIX_BATCH_TOKENS = int(os.getenv("MATRIX_BATCH_TOKENS", "3750"))
+
+# Job match skips the LLM when the local skill check already rules the job out:
+# at least this many known skills required, and at most this share (%) covered directly or by related skills
+LOCAL_MISMATCH_MIN_SKILLS = int(os.getenv("LOCAL_MISMATCH_MIN_SKILLS", "5"))
+LOCAL_MISMATCH_MAX_COVERAGE = int(os.getenv("LOCAL_MISMATCH_MAX_COVERAGE", "20"))
+
+# Standard resume analysis queries shared by the analyzer buttons and the full report
+RESUME_QUERIES = {
+    "summary": "provide a comprehensive summary highlighting the candidate's qualifications, key experience, skills, projects, and major achievements. Make it concise but informative.",
+    "strengths": "identify the key strengths, competitive advantages, and standout qualifications that make this candidate attractive to employers. Focus on what makes them unique.",
+    "weaknesses": "identify potential weaknesses, gaps, or areas for improvement in this resume. Provide constructive feedback and specific suggestions for enhancement.",
+    "job_titles": "suggest the most suitable job titles and career positions that align with the candidate's profile. Based on their qualifications, experience, and skills, what roles would be the best fit?",
+}
+
+def generate_with_cache(template, inputs, prompt, api_key, bypass_cache=False, generation_config=None, stream=False):
+    """Generate a response from the configured LLM backend through the shared response cache
+
+    With ``stream=True`` this returns a generator of text chunks instead of
+    the full response text.
+    """
+    backend = get_backend(api_key)
+    version = PROMPT_VERSIONS[template]
+    if stream:
+        return cached_stream(lambda: backend.stream(prompt, generation_config), backend.name,
+                             template, version, inputs, bypass=bypass_cache)
+    return cached_generate(lambda: backend.generate(prompt, generation_config), backend.name,
+                           template, version, inputs, bypass=bypass_cache)
+
+def render_streamed_result(title, chunks, box_class="result-box", waiting_text="Generating..."):
+    """Render a streamed response into a result box as it arrives and return the full text"""
+    if chunks is None:
+        return None
+    
+    status = st.empty()
+    status.info(f"⏳ {waiting_text}")
+    start = time.perf_counter()
+    first_token = None
+    
+    def timed_chunks():
+        nonlocal first_token
+        try:
+            for chunk in chunks:
+                if first_token is None:
+                    first_token = time.perf_counter() - start
+                    status.empty()
+                yield chunk
+        except Exception as e:
+            st.error(f"Error generating response: {str(e)}")
+    
+    st.markdown(f'<div class="{box_class}">', unsafe_allow_html=True)
+    st.markdown(f"### {title}")
+    text = st.write_stream(timed_chunks())
+    st.markdown('</div>', unsafe_allow_html=True)
+    status.empty()
+    
+    if first_token is not None:
+        st.caption(f"⚡ First token after {first_token:.2f}s · complete in {time.perf_counter() - start:.2f}s")
+    return text if isinstance(text, str) and text else None
+
 def extract_text_from_pdf(pdf_file):
-    """Extract text from uploaded PDF file"""
+    """Extract text from uploaded PDF file (cached by content hash)"""
     try:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
+        return extract_text(pdf_file)
     except Exception as e:
         st.error(f"Error extracting text from PDF: {str(e)}")
         return None
 
-def analyze_resume_with_gemini(resume_text, query, api_key):
+def analyze_resume_with_gemini(resume_text, query, api_key, bypass_cache=False, stream=False):
     """Analyze resume using Google Gemini API"""
     try:
-        # Configure the Gemini API
-        genai.configure(api_key=api_key)
-        
-        # Initialize the model
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        prompt = f"""
-        You are an expert career counselor and resume analyst. Provide detailed, actionable feedback.
+        prompt = build_resume_analysis_prompt(resume_text, query)
         
-        Based on the following resume content, please {query}
-        
-        Resume Content:
-        {resume_text[:6000]}  # Gemini can handle more text than GPT-3.5
-        
-        Please provide a detailed and helpful response.
-        """
-        
-        # Generate response
-        response = model.generate_content(prompt)
-        
-        return response.text
+        # Generate response (served from cache for identical inputs)
+        return generate_with_cache("resume_analysis", {"resume_text": resume_text, "query": query}, prompt, api_key, bypass_cache, stream=stream)
     except Exception as e:
         st.error(f"Error analyzing resume: {str(e)}")
         return None
 
-def setup_selenium_driver():
-    """Setup Selenium WebDriver for LinkedIn scraping"""
+def scrape_linkedin_jobs(job_title, location="", num_jobs=10):
+    """Scrape LinkedIn jobs using Selenium"""
     try:
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
-        
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        return driver
+        # Reuse a warm browser from the pool instead of starting Chrome per search
+        with get_driver_pool().driver() as driver:
+            return scrape_search_page(driver, job_title, location, num_jobs, timeout=SCRAPER_PAGE_TIMEOUT)
     except Exception as e:
-        st.error(f"Error setting up web driver: {str(e)}")
+        st.error(f"Error scraping LinkedIn jobs: {str(e)}")
         return None
 
-def scrape_linkedin_jobs(job_title, location="", num_jobs=10):
-    """Scrape LinkedIn jobs using Selenium"""
+def stream_linkedin_jobs(job_title, location="", num_jobs=100):
+    """Yield lists of LinkedIn jobs, one per result page, scrolling until num_jobs"""
     try:
-        driver = setup_selenium_driver()
-        if not driver:
-            return None
-        
-        # Construct LinkedIn job search URL
-        base_url = "https://www.linkedin.com/jobs/search"
-        search_url = f"{base_url}?keywords={job_title.replace(' ', '%20')}"
-        if location:
-            search_url += f"&location={location.replace(' ', '%20')}"
-        
-        driver.get(search_url)
-        time.sleep(3)
-        
-        jobs_data = []
-        
-        # Find job listings
-        job_cards = driver.find_elements(By.CSS_SELECTOR, ".job-search-card")
-        
-        for i, card in enumerate(job_cards[:num_jobs]):
-            try:
-                # Extract job details
-                title_element = card.find_element(By.CSS_SELECTOR, ".base-search-card__title")
-                company_element = card.find_element(By.CSS_SELECTOR, ".base-search-card__subtitle")
-                location_element = card.find_element(By.CSS_SELECTOR, ".job-search-card__location")
-                link_element = card.find_element(By.CSS_SELECTOR, "a")
-                
-                job_data = {
-                    "Title": title_element.text.strip(),
-                    "Company": company_element.text.strip(),
-                    "Location": location_element.text.strip(),
-                    "URL": link_element.get_attribute("href")
-                }
-                
-                # Get job description (simplified)
-                job_data["Description"] = "Click the URL to view full job description"
-                
-                jobs_data.append(job_data)
-                
-            except Exception:
-                continue
-        
-        driver.quit()
-        return jobs_data
-        
+        with get_driver_pool().driver() as driver:
+            yield from iter_search_pages(driver, job_title, location, num_jobs, timeout=SCRAPER_PAGE_TIMEOUT)
+    except Exception as e:
+        st.error(f"Error scraping LinkedIn jobs: {str(e)}")
+
+def scrape_linkedin_jobs_batch(queries, num_jobs=10, max_workers=None):
+    """Scrape many (job_title, location) searches concurrently into one deduplicated DataFrame"""
+    try:
+        jobs_df, errors = scrape_many(queries, num_jobs, get_driver_pool(), max_workers=max_workers,
+                                      min_interval=SCRAPER_MIN_INTERVAL, timeout=SCRAPER_PAGE_TIMEOUT)
+        for query, error in errors.items():
+            st.warning(f"⚠️ Search '{query}' failed: {error}")
+        return jobs_df
     except Exception as e:
         st.error(f"Error scraping LinkedIn jobs: {str(e)}")
         return None
 
-def get_resume_job_match_score(resume_text, job_description, api_key):
+def enrich_job_descriptions(jobs_data):
+    """Replace placeholder descriptions with the full text from each job page"""
+    try:
+        return get_description_fetcher().enrich(jobs_data)
+    except Exception as e:
+        st.error(f"Error fetching job descriptions: {str(e)}")
+        return jobs_data
+
+def save_scraped_jobs(jobs_data, query, fetch_details=False):
+    """Upsert scraped jobs into the local store, fetching descriptions only for unknown postings
+
+    Returns (jobs with descriptions filled in, number of postings not seen before).
+    """
+    try:
+        store = get_job_store()
+        new_keys = store.upsert_jobs(jobs_data, query=query)
+        jobs_data = store.fill_descriptions(jobs_data)
+        if fetch_details:
+            jobs_data = enrich_job_descriptions(jobs_data)
+            store.upsert_jobs(jobs_data, query=query)
+        return jobs_data, len(new_keys)
+    except Exception as e:
+        st.error(f"Error saving jobs to the local store: {str(e)}")
+        return jobs_data, None
+
+def merge_stored_duplicates(jobs_df):
+    """Collapse scraped jobs to one row per near-duplicate cluster recorded in the job store"""
+    try:
+        keys = [job_key(url) for url in jobs_df["URL"]] if not jobs_df.empty else []
+        clusters = get_job_store().cluster_ids(keys)
+        return collapse_duplicates(jobs_df, cluster_ids=[clusters.get(key, key) for key in keys])
+    except Exception as e:
+        st.error(f"Error merging duplicate jobs: {str(e)}")
+        return jobs_df
+
+def load_saved_jobs(limit=200):
+    """Return stored jobs that have a full description, most recent first"""
+    try:
+        return get_job_store().search(with_description=True, limit=limit)
+    except Exception as e:
+        st.error(f"Error loading saved jobs: {str(e)}")
+        return pd.DataFrame()
+
+def index_saved_jobs(api_key, only_if_empty=False):
+    """Embed saved jobs that are new or changed so semantic search can find them"""
+    try:
+        if only_if_empty and len(get_job_index(api_key)):
+            return 0
+        return sync_job_index(api_key)
+    except Exception as e:
+        st.error(f"Error indexing saved jobs: {str(e)}")
+        return 0
+
+def find_matching_jobs(resume_text, api_key, k=50):
+    """Return the indexed saved jobs most similar to the resume"""
+    try:
+        return top_jobs_for_resume(resume_text, k, api_key=api_key)
+    except Exception as e:
+        st.error(f"Error searching saved jobs: {str(e)}")
+        return pd.DataFrame()
+
+def get_resume_job_match_score(resume_text, job_description, api_key, bypass_cache=False, stream=False):
     """Generate semantic AI matching score between resume and job description"""
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        prompt = f"""
-        You are an AI recruitment expert. Perform a semantic analysis to match this resume with the job description.
-        
-        RESUME CONTENT:
-        {resume_text[:4000]}
-        
-        JOB DESCRIPTION:
-        {job_description[:3000]}
-        
-        Provide a detailed analysis in the following format:
-        
-        OVERALL MATCH SCORE: [X]%
+        prompt = build_job_match_prompt(resume_text, job_description)
         
-        SKILL MATCH ANALYSIS:
-        - Direct Skills Match: [X]% (skills that exactly match)
-        - Related Skills Match: [X]% (similar/transferable skills)
-        - Missing Critical Skills: [list key missing skills]
-        
-        EXPERIENCE RELEVANCE:
-        - Years of Experience Match: [X]%
-        - Domain Experience: [X]%
-        - Role Suitability: [X]%
-        
-        STRENGTHS FOR THIS ROLE:
-        - [List 3-4 key strengths from resume that match this job]
-        
-        IMPROVEMENT AREAS:
-        - [List specific skills/experience to develop for this role]
-        
-        RECOMMENDATIONS:
-        - [3-4 specific actionable recommendations to improve match]
-        """
-        
-        response = model.generate_content(prompt)
-        return response.text
+        return generate_with_cache("job_match", {"resume_text": resume_text, "job_description": job_description}, prompt, api_key, bypass_cache, stream=stream)
     except Exception as e:
         st.error(f"Error in job matching analysis: {str(e)}")
         return None
 
-def generate_tailored_resume(resume_text, job_description, api_key):
+def generate_tailored_resume(resume_text, job_description, api_key, bypass_cache=False, stream=False):
     """Generate job-specific tailored resume content"""
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        prompt = f"""
-        You are an expert resume writer. Create a tailored version of this resume for the specific job.
-        
-        ORIGINAL RESUME:
-        {resume_text[:4000]}
-        
-        TARGET JOB:
-        {job_description[:3000]}
-        
-        Generate optimized sections:
+        prompt = build_tailored_resume_prompt(resume_text, job_description)
         
-        TAILORED PROFESSIONAL SUMMARY:
-        [Write a 3-4 line summary optimized for this job, highlighting most relevant skills and experience]
-        
-        OPTIMIZED SKILLS SECTION:
-        [Reorder and enhance skills to match job requirements. Add related skills if missing.]
-        
-        ENHANCED PROJECT/EXPERIENCE DESCRIPTIONS:
-        [Rewrite 2-3 key experiences/projects with job-relevant keywords and metrics]
-        
-        ATS OPTIMIZATION KEYWORDS:
-        [List 10-15 keywords from job description to incorporate]
-        
-        SUGGESTED ADDITIONS:
-        [Recommend any certifications, skills, or experiences to add for better job fit]
-        """
-        
-        response = model.generate_content(prompt)
-        return response.text
+        return generate_with_cache("tailored_resume", {"resume_text": resume_text, "job_description": job_description}, prompt, api_key, bypass_cache, stream=stream)
     except Exception as e:
         st.error(f"Error in resume tailoring: {str(e)}")
         return None
 
-def generate_skill_gap_analysis(resume_text, job_description, api_key):
+def generate_skill_gap_analysis(resume_text, job_description, api_key, bypass_cache=False, stream=False):
     """Analyze skill gaps and generate learning path"""
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        prompt = f"""
-        You are a career development expert. Analyze skill gaps and create a learning roadmap.
-        
-        CURRENT RESUME:
-        {resume_text[:4000]}
-        
-        TARGET JOB:
-        {job_description[:3000]}
-        
-        Provide analysis in this format:
+        prompt = build_skill_gap_prompt(resume_text, job_description)
         
-        SKILL GAP ANALYSIS:
-        
-        MISSING CRITICAL SKILLS:
-        - [List 3-5 most important missing skills]
-        
-        WEAK AREAS TO STRENGTHEN:
-        - [List 2-3 skills present but need improvement]
-        
-        PERSONALIZED LEARNING PATH:
-        
-        PRIORITY 1 (Next 4 weeks):
-        - Week 1: [Specific skill/topic to learn]
-        - Week 2: [Next skill/topic]
-        - Week 3: [Continue with next priority]
-        - Week 4: [Practice/project week]
-        
-        PRIORITY 2 (Next 2 months):
-        - Month 1: [Advanced topics]
-        - Month 2: [Certification/project]
-        
-        RECOMMENDED RESOURCES:
-        - Online Courses: [Suggest 2-3 specific courses]
-        - Certifications: [Relevant certifications to pursue]
-        - Practice Projects: [2-3 project ideas to build skills]
-        
-        SKILL DEVELOPMENT TIMELINE:
-        - 30 days: [Expected skill level]
-        - 60 days: [Expected skill level]
-        - 90 days: [Job-ready assessment]
-        """
-        
-        response = model.generate_content(prompt)
-        return response.text
+        return generate_with_cache("skill_gap", {"resume_text": resume_text, "job_description": job_description}, prompt, api_key, bypass_cache, stream=stream)
     except Exception as e:
         st.error(f"Error in skill gap analysis: {str(e)}")
         return None
 
-def generate_interview_questions(resume_text, job_description, api_key):
+def generate_interview_questions(resume_text, job_description, api_key, bypass_cache=False, stream=False):
     """Generate job-specific interview questions based on resume and job"""
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        prompt = f"""
-        You are an experienced interviewer. Generate interview questions for this candidate based on their resume and the target job.
-        
-        CANDIDATE RESUME:
-        {resume_text[:4000]}
-        
-        TARGET JOB:
-        {job_description[:3000]}
-        
-        Generate questions in these categories:
-        
-        TECHNICAL QUESTIONS (Based on Resume Experience):
-        1. [Question about specific technology mentioned in resume]
-        2. [Question about project details from resume]
-        3. [Question about technical skills listed]
-        4. [Scenario-based technical question]
-        5. [Problem-solving question related to job requirements]
-        
-        BEHAVIORAL QUESTIONS (STAR Method):
-        1. [Question about leadership/teamwork from resume]
-        2. [Question about challenges/achievements mentioned]
-        3. [Question about learning/adaptation]
-        4. [Question about conflict resolution]
-        
-        JOB-SPECIFIC QUESTIONS:
-        1. [Question about specific job requirement]
-        2. [Question about company/industry knowledge needed]
-        3. [Question about future goals in this role]
-        
-        SUGGESTED STAR METHOD ANSWERS:
-        [Provide framework answers for 2-3 behavioral questions based on resume content]
-        
-        TECHNICAL PREPARATION AREAS:
-        [List 5-7 technical topics to review based on job requirements]
-        """
+        prompt = build_interview_questions_prompt(resume_text, job_description)
         
-        response = model.generate_content(prompt)
-        return response.text
+        return generate_with_cache("interview_questions", {"resume_text": resume_text, "job_description": job_description}, prompt, api_key, bypass_cache, stream=stream)
     except Exception as e:
         st.error(f"Error generating interview questions: {str(e)}")
         return None
 
-def check_ats_compatibility(resume_text, api_key):
+def check_ats_compatibility(resume_text, api_key, bypass_cache=False, stream=False):
     """Check ATS compatibility and suggest improvements"""
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
+        prompt = build_ats_compatibility_prompt(resume_text)
         
-        prompt = f"""
-        You are an ATS (Applicant Tracking System) expert. Analyze this resume for ATS compatibility.
-        
-        RESUME CONTENT:
-        {resume_text[:5000]}
-        
-        Provide analysis in this format:
-        
-        ATS COMPATIBILITY SCORE: [X]/100
-        
-        SECTION ANALYSIS:
-        
-        ✅ GOOD PRACTICES FOUND:
-        - [List what's working well]
-        
-        ❌ ATS ISSUES DETECTED:
-        - [List specific formatting/content issues]
-        
-        KEYWORD OPTIMIZATION:
-        - Keyword Density: [Assessment]
-        - Missing Industry Keywords: [List important missing keywords]
-        - Overused Keywords: [List if any]
-        
-        FORMATTING RECOMMENDATIONS:
-        - [Specific formatting improvements needed]
-        
-        SECTION IMPROVEMENTS:
-        - Contact Information: [Issues/suggestions]
-        - Professional Summary: [Issues/suggestions]
-        - Skills Section: [Issues/suggestions]
-        - Experience Section: [Issues/suggestions]
-        
-        ATS-OPTIMIZED SUGGESTIONS:
-        - [3-5 specific actionable improvements]
-        
-        REWRITTEN SECTIONS (if needed):
-        [Provide ATS-friendly rewrites of problematic sections]
-        """
-        
-        response = model.generate_content(prompt)
-        return response.text
+        return generate_with_cache("ats_compatibility", {"resume_text": resume_text}, prompt, api_key, bypass_cache, stream=stream)
     except Exception as e:
         st.error(f"Error in ATS compatibility check: {str(e)}")
         return None
 
-def generate_career_recommendations(resume_text, api_key):
+def score_job_match(resume_text, job_description, api_key, bypass_cache=False):
+    """Score resume-job compatibility as a validated JSON object (see JOB_MATCH_SCHEMA)"""
+    try:
+        prompt = build_job_match_json_prompt(resume_text, job_description)
+        inputs = {"resume_text": resume_text, "job_description": job_description}
+        response = generate_with_cache("job_match_json", inputs, prompt, api_key, bypass_cache,
+                                       generation_config=generation_config_for(JOB_MATCH_SCHEMA))
+        return parse_structured_response(response, JOB_MATCH_SCHEMA)
+    except Exception as e:
+        st.error(f"Error in job matching analysis: {str(e)}")
+        return None
+
+def score_ats_compatibility(resume_text, api_key, bypass_cache=False):
+    """Check ATS compatibility as a validated JSON object (see ATS_SCHEMA)"""
+    try:
+        prompt = build_ats_compatibility_json_prompt(resume_text)
+        response = generate_with_cache("ats_compatibility_json", {"resume_text": resume_text}, prompt, api_key, bypass_cache,
+                                       generation_config=generation_config_for(ATS_SCHEMA))
+        return parse_structured_response(response, ATS_SCHEMA)
+    except Exception as e:
+        st.error(f"Error in ATS compatibility check: {str(e)}")
+        return None
+
+def render_bullet_lists(result, sections):
+    """Render the non-empty list fields of a structured result as bullet lists"""
+    for title, field in sections:
+        if result.get(field):
+            st.markdown(f"**{title}**")
+            st.markdown("\n".join(f"- {item}" for item in result[field]))
+
+def render_job_match_scores(scores):
+    """Render structured job match scores as metrics and lists"""
+    st.markdown('<div class="success-box">', unsafe_allow_html=True)
+    st.markdown("### 🎯 Job Match Scores")
+    metrics = [
+        ("Overall Match", "overall_match"),
+        ("Direct Skills", "direct_skills_match"),
+        ("Related Skills", "related_skills_match"),
+        ("Experience", "experience_match"),
+        ("Domain", "domain_experience"),
+        ("Role Suitability", "role_suitability"),
+    ]
+    cols = st.columns(3)
+    for i, (label, field) in enumerate(metrics):
+        cols[i % 3].metric(label, f"{scores[field]:.0f}%")
+    render_bullet_lists(scores, [
+        ("❌ Missing Critical Skills", "missing_skills"),
+        ("💪 Strengths for This Role", "strengths"),
+        ("📈 Improvement Areas", "improvement_areas"),
+        ("💡 Recommendations", "recommendations"),
+    ])
+    st.markdown('</div>', unsafe_allow_html=True)
+    with st.expander("🧾 Raw JSON"):
+        st.json(scores)
+
+def render_resume_profile(resume_text):
+    """Show the locally parsed resume profile"""
+    profile = parse_resume(resume_text)
+    cols = st.columns(3)
+    cols[0].metric("Experience", f"{profile.years_of_experience:g} yrs")
+    cols[1].metric("Roles", len(profile.roles))
+    cols[2].metric("Skills", len(profile.skills))
+    if profile.roles:
+        st.dataframe(pd.DataFrame([role.to_dict() for role in profile.roles]).drop(columns=["highlights"]),
+                     use_container_width=True, hide_index=True)
+    if profile.skills:
+        st.markdown("**Skills:** " + ", ".join(profile.skills))
+    with st.expander("🧾 Raw JSON"):
+        st.json(profile.to_dict())
+
+def is_clear_mismatch(scores):
+    """True when local match scores show the resume covers too few of the job's skills to be worth an LLM call
+
+    Skills named by everyday words ("Go", "Excel") may be misreads of the
+    job text, so they do not count either way.
+    """
+    taxonomy = get_skill_taxonomy()
+    covered = [skill for skill in scores["matched_skills"] + list(scores["related_skills"]) if not taxonomy.is_ambiguous(skill)]
+    missing = [skill for skill in scores["missing_skills"] if not taxonomy.is_ambiguous(skill)]
+    required = len(covered) + len(missing)
+    return required >= LOCAL_MISMATCH_MIN_SKILLS and 100 * len(covered) <= LOCAL_MISMATCH_MAX_COVERAGE * required
+
+def render_local_match(resume_text, job_description):
+    """Show instant skill and experience scores computed without the LLM and return them"""
+    scores = local_match_scores(resume_text, job_description)
+    st.markdown("#### ⚡ Instant Local Match")
+    cols = st.columns(4)
+    for col, label, field in ((cols[0], "Direct Skills", "direct_skills_match"),
+                              (cols[1], "Related Skills", "related_skills_match"),
+                              (cols[3], "Experience Match", "experience_match")):
+        col.metric(label, "—" if scores[field] is None else f"{scores[field]}%")
+    cols[2].metric("Experience", f"{scores['years_of_experience']:g} yrs",
+                   None if scores["required_years"] is None else f"{scores['required_years']}+ required",
+                   delta_color="off")
+    if scores["matched_skills"]:
+        st.markdown("✅ " + ", ".join(scores["matched_skills"]))
+    if scores["related_skills"]:
+        st.markdown("≈ " + "; ".join(f"{skill} ← {', '.join(have)}" for skill, have in scores["related_skills"].items()))
+    if scores["missing_skills"]:
+        st.markdown("❌ " + ", ".join(scores["missing_skills"]))
+    return scores
+
+def render_ats_report(report):
+    """Render a structured ATS report as a score, lists and section feedback"""
+    st.markdown('<div class="success-box">', unsafe_allow_html=True)
+    st.markdown("### 🤖 ATS Compatibility Report")
+    st.metric("ATS Compatibility Score", f"{report['ats_score']:.0f}/100")
+    st.progress(report["ats_score"] / 100)
+    render_bullet_lists(report, [
+        ("✅ Good Practices Found", "good_practices"),
+        ("❌ ATS Issues Detected", "issues"),
+        ("🔑 Missing Industry Keywords", "missing_keywords"),
+        ("🔁 Overused Keywords", "overused_keywords"),
+        ("📐 Formatting Recommendations", "formatting_recommendations"),
+        ("🚀 ATS-Optimized Suggestions", "suggestions"),
+    ])
+    feedback = {name.replace("_", " ").title(): text for name, text in report["section_feedback"].items() if text}
+    if feedback:
+        st.markdown("**📋 Section Improvements**")
+        st.markdown("\n".join(f"- **{name}:** {text}" for name, text in feedback.items()))
+    st.markdown('</div>', unsafe_allow_html=True)
+    with st.expander("🧾 Raw JSON"):
+        st.json(report)
+
+def generate_career_recommendations(resume_text, api_key, bypass_cache=False, stream=False):
     """Generate alternative career path recommendations"""
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        prompt = f"""
-        You are a career counselor. Analyze this resume and suggest alternative career paths and roles.
-        
-        RESUME CONTENT:
-        {resume_text[:4000]}
-        
-        Provide recommendations in this format:
-        
-        CURRENT PROFILE ANALYSIS:
-        - Primary Skills: [Top 5 skills]
-        - Experience Level: [Assessment]
-        - Industry Background: [Current industry/domain]
-        
-        RECOMMENDED CAREER PATHS:
-        
-        PATH 1: [Similar Role Progression]
-        - Suggested Role: [Job title]
-        - Why it fits: [Reasoning based on skills/experience]
-        - Skills to develop: [2-3 skills needed]
-        - Salary range: [Estimate if possible]
+        prompt = build_career_recommendations_prompt(resume_text)
         
-        PATH 2: [Lateral Move]
-        - Suggested Role: [Job title]
-        - Why it fits: [Reasoning]
-        - Skills to develop: [2-3 skills needed]
-        - Transition timeline: [Estimated time]
-        
-        PATH 3: [Growth/Advancement]
-        - Suggested Role: [Senior/lead position]
-        - Why it fits: [Reasoning]
-        - Skills to develop: [Leadership/advanced skills]
-        - Experience needed: [Additional requirements]
-        
-        EMERGING OPPORTUNITIES:
-        - [2-3 trending roles that match profile]
-        
-        SKILL TRANSFERABILITY:
-        - [How current skills apply to different industries]
-        
-        NEXT STEPS:
-        - Immediate (30 days): [Action items]
-        - Short-term (3 months): [Development goals]
-        - Long-term (1 year): [Career milestone]
-        """
-        
-        response = model.generate_content(prompt)
-        return response.text
+        return generate_with_cache("career_recommendations", {"resume_text": resume_text}, prompt, api_key, bypass_cache, stream=stream)
     except Exception as e:
         st.error(f"Error generating career recommendations: {str(e)}")
         return None
 
+def build_full_report_tasks(resume_text, job_description, api_key, bypass_cache=False):
+    """Return (section title, callable) pairs for every analysis in the full report"""
+    tasks = [
+        ("📋 Resume Summary", lambda: analyze_resume_with_gemini(resume_text, RESUME_QUERIES["summary"], api_key, bypass_cache)),
+        ("💪 Key Strengths", lambda: analyze_resume_with_gemini(resume_text, RESUME_QUERIES["strengths"], api_key, bypass_cache)),
+        ("⚠️ Areas for Improvement", lambda: analyze_resume_with_gemini(resume_text, RESUME_QUERIES["weaknesses"], api_key, bypass_cache)),
+        ("🎯 Recommended Job Titles", lambda: analyze_resume_with_gemini(resume_text, RESUME_QUERIES["job_titles"], api_key, bypass_cache)),
+        ("🤖 ATS Compatibility Report", lambda: check_ats_compatibility(resume_text, api_key, bypass_cache)),
+        ("🚀 Career Roadmap & Opportunities", lambda: generate_career_recommendations(resume_text, api_key, bypass_cache)),
+    ]
+    
+    # Job-specific analyses need a target job description
+    if job_description:
+        tasks += [
+            ("🎯 Job Match Analysis", lambda: get_resume_job_match_score(resume_text, job_description, api_key, bypass_cache)),
+            ("✨ Tailored Resume Content", lambda: generate_tailored_resume(resume_text, job_description, api_key, bypass_cache)),
+            ("📈 Skill Gap & Learning Roadmap", lambda: generate_skill_gap_analysis(resume_text, job_description, api_key, bypass_cache)),
+            ("🎪 Interview Preparation", lambda: generate_interview_questions(resume_text, job_description, api_key, bypass_cache)),
+        ]
+    
+    return tasks
+
+def run_concurrently(tasks, max_workers=FULL_REPORT_MAX_WORKERS):
+    """Run (title, callable) tasks concurrently and yield (title, result) as each one finishes"""
+    # Worker threads need the script context so st.error calls inside the analyses still render
+    ctx = get_script_run_ctx()
+    
+    def run_task(func):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return func()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(run_task, func): title for title, func in tasks}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+def pack_job_batches(jobs, max_jobs=MATRIX_JOBS_PER_REQUEST, max_tokens=MATRIX_BATCH_TOKENS):
+    """Split (job_id, description) pairs into request-sized groups by the tokens each adds to the prompt"""
+    batches, current, current_tokens = [], [], 0
+    for job_id, description in jobs:
+        size = count_tokens(fit_job_description(description))
+        if current and (len(current) >= max_jobs or current_tokens + size > max_tokens):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append((job_id, description))
+        current_tokens += size
+    if current:
+        batches.append(current)
+    return batches
+
+def score_job_batch(resume_text, jobs, api_key, bypass_cache=False):
+    """Score one resume against a packed group of jobs with a single JSON-mode request"""
+    try:
+        prompt = build_job_match_batch_prompt(resume_text, jobs)
+        inputs = {"resume_text": resume_text, "jobs": [list(job) for job in jobs]}
+        schema = job_match_batch_schema([job_id for job_id, _ in jobs])
+        response = generate_with_cache("job_match_batch", inputs, prompt, api_key, bypass_cache,
+                                       generation_config=generation_config_for(schema))
+        if not response:
+            return {}
+        results = parse_structured_response(response, schema)
+        return {
+            job_id: {**scores, "missing_skills": ", ".join(scores["missing_skills"])}
+            for job_id, scores in results.items()
+            if scores["overall_match"] is not None
+        }
+    except Exception as e:
+        st.error(f"Error in batched job matching: {str(e)}")
+        return {}
+
+def build_match_matrix(resumes, jobs, api_key, bypass_cache=False, max_workers=FULL_REPORT_MAX_WORKERS,
+                       progress_callback=None, duplicate_of=None):
+    """Score every resume against every job, packing several jobs into each request
+
+    ``resumes`` and ``jobs`` are lists of (name, text) pairs. ``duplicate_of``
+    maps the names of jobs left out of ``jobs`` as near-duplicates to the job
+    scored in their place, whose scores they receive. Returns a long
+    DataFrame with one row per resume/job pair.
+    """
+    job_ids = {f"J{i + 1}": name for i, (name, _) in enumerate(jobs)}
+    batches = pack_job_batches([(f"J{i + 1}", text) for i, (_, text) in enumerate(jobs)])
+    
+    tasks = []
+    for resume_name, resume_text in resumes:
+        for batch in batches:
+            tasks.append((resume_name, lambda text=resume_text, batch=batch: score_job_batch(text, batch, api_key, bypass_cache)))
+    
+    rows = []
+    for completed, (resume_name, scores) in enumerate(run_concurrently(tasks, max_workers), start=1):
+        for job_id, job_scores in scores.items():
+            if job_id in job_ids:
+                rows.append({"Resume": resume_name, "Job": job_ids[job_id], **job_scores})
+        if progress_callback:
+            progress_callback(completed, len(tasks))
+    
+    for duplicate, representative in (duplicate_of or {}).items():
+        rows.extend({**row, "Job": duplicate} for row in list(rows) if row["Job"] == representative)
+    
+    return pd.DataFrame(rows, columns=["Resume", "Job", "overall_match", "direct_skills_match",
+                                       "related_skills_match", "experience_match", "missing_skills"])
+
 def main():
     """Main application function"""
     
@@ -592,9 +685,9 @@ def main():
         st.title("Navigation")
         selected = option_menu(
             menu_title=None,
-            options=["Resume Analyzer", "🚀 AI Job Matching", "🎨 Resume Tailoring", "📚 Skill Gap Analysis", 
+            options=["Resume Analyzer", "📊 Full Report", "🚀 AI Job Matching", "🧮 Match Matrix", "🎨 Resume Tailoring", "📚 Skill Gap Analysis", 
                     "🎯 Interview Prep", "🔍 ATS Checker", "📈 Career Paths", "LinkedIn Scraper", "About"],
-            icons=["file-earmark-text", "bullseye", "brush", "book", "chat-dots", 
+            icons=["file-earmark-text", "clipboard-data", "bullseye", "grid-3x3", "brush", "book", "chat-dots", 
                    "search", "graph-up", "linkedin", "info-circle"],
             menu_icon="cast",
             default_index=0,
@@ -603,20 +696,38 @@ def main():
         add_vertical_space(3)
         
         # API Key handling
-        st.markdown("### 🔑 Google Gemini API Key")
-        
-        # Check if API key is already in environment
-        env_api_key = os.getenv("GEMINI_API_KEY")
-        
-        if env_api_key:
-            st.success("✅ API Key loaded from environment file")
-            api_key = env_api_key
+        if LLM_PROVIDER == "fake":
+            # The offline backend needs no key; any non-empty value unlocks the tabs
+            st.markdown("### 🧪 Offline Mode")
+            st.info("💡 LLM_BACKEND=fake: answers are generated locally for testing")
+            api_key = "offline"
         else:
-            st.info("💡 Enter your API key below or add it to .env file")
-            api_key = st.text_input("Enter your Google Gemini API Key", type="password")
+            provider_label, key_env = PROVIDER_KEYS[LLM_PROVIDER]
+            st.markdown(f"### 🔑 {provider_label} API Key")
+            
+            # Check if API key is already in environment
+            env_api_key = os.getenv(key_env)
             
-            if api_key:
-                os.environ["GEMINI_API_KEY"] = api_key
+            if env_api_key:
+                st.success("✅ API Key loaded from environment file")
+                api_key = env_api_key
+            else:
+                st.info("💡 Enter your API key below or add it to .env file")
+                api_key = st.text_input(f"Enter your {provider_label} API Key", type="password")
+                
+                if api_key:
+                    os.environ[key_env] = api_key
+        
+        # Cache controls and statistics
+        bypass_cache = st.checkbox("🔄 Bypass response cache", help="Always request a fresh answer from Gemini")
+        pdf_stats = get_pdf_text_cache().stats()
+        llm_stats = get_response_cache().stats()
+        st.caption(f"📄 PDF cache: {pdf_stats['hits']} hits / {pdf_stats['misses']} misses")
+        st.caption(f"🤖 Response cache: {llm_stats['hits']} hits / {llm_stats['misses']} misses")
+        gemini_stats = call_stats.summary()
+        if gemini_stats["calls"]:
+            st.caption(f"⏱️ Gemini: {gemini_stats['calls']} calls, {gemini_stats['mean_seconds']:.1f}s avg, "
+                       f"{gemini_stats['errors']} errors")
     
     # Resume Analyzer Tab
     if selected == "Resume Analyzer":
@@ -641,58 +752,37 @@ def main():
                 with st.expander("📄 View Extracted Text (First 500 characters)"):
                     st.text(resume_text[:500] + "..." if len(resume_text) > 500 else resume_text)
                 
+                with st.expander("👤 Parsed Profile"):
+                    render_resume_profile(resume_text)
+                
                 # Analysis options
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     if st.button("📋 Generate Summary", use_container_width=True):
-                        query = "provide a comprehensive summary highlighting the candidate's qualifications, key experience, skills, projects, and major achievements. Make it concise but informative."
-                        
-                        with st.spinner("Analyzing resume..."):
-                            summary = analyze_resume_with_gemini(resume_text, query, api_key)
+                        query = RESUME_QUERIES["summary"]
                         
-                        if summary:
-                            st.markdown('<div class="result-box">', unsafe_allow_html=True)
-                            st.markdown("### 📋 Resume Summary")
-                            st.write(summary)
-                            st.markdown('</div>', unsafe_allow_html=True)
+                        chunks = analyze_resume_with_gemini(resume_text, query, api_key, bypass_cache, stream=True)
+                        render_streamed_result("📋 Resume Summary", chunks, "result-box", "Analyzing resume...")
                     
                     if st.button("💪 Identify Strengths", use_container_width=True):
-                        query = "identify the key strengths, competitive advantages, and standout qualifications that make this candidate attractive to employers. Focus on what makes them unique."
+                        query = RESUME_QUERIES["strengths"]
                         
-                        with st.spinner("Identifying strengths..."):
-                            strengths = analyze_resume_with_gemini(resume_text, query, api_key)
-                        
-                        if strengths:
-                            st.markdown('<div class="result-box">', unsafe_allow_html=True)
-                            st.markdown("### 💪 Key Strengths")
-                            st.write(strengths)
-                            st.markdown('</div>', unsafe_allow_html=True)
+                        chunks = analyze_resume_with_gemini(resume_text, query, api_key, bypass_cache, stream=True)
+                        render_streamed_result("💪 Key Strengths", chunks, "result-box", "Identifying strengths...")
                 
                 with col2:
                     if st.button("⚠️ Identify Weaknesses", use_container_width=True):
-                        query = "identify potential weaknesses, gaps, or areas for improvement in this resume. Provide constructive feedback and specific suggestions for enhancement."
-                        
-                        with st.spinner("Identifying areas for improvement..."):
-                            weaknesses = analyze_resume_with_gemini(resume_text, query, api_key)
+                        query = RESUME_QUERIES["weaknesses"]
                         
-                        if weaknesses:
-                            st.markdown('<div class="result-box">', unsafe_allow_html=True)
-                            st.markdown("### ⚠️ Areas for Improvement")
-                            st.write(weaknesses)
-                            st.markdown('</div>', unsafe_allow_html=True)
+                        chunks = analyze_resume_with_gemini(resume_text, query, api_key, bypass_cache, stream=True)
+                        render_streamed_result("⚠️ Areas for Improvement", chunks, "result-box", "Identifying areas for improvement...")
                     
                     if st.button("🎯 Job Title Suggestions", use_container_width=True):
-                        query = "suggest the most suitable job titles and career positions that align with the candidate's profile. Based on their qualifications, experience, and skills, what roles would be the best fit?"
+                        query = RESUME_QUERIES["job_titles"]
                         
-                        with st.spinner("Generating job suggestions..."):
-                            suggestions = analyze_resume_with_gemini(resume_text, query, api_key)
-                        
-                        if suggestions:
-                            st.markdown('<div class="result-box">', unsafe_allow_html=True)
-                            st.markdown("### 🎯 Recommended Job Titles")
-                            st.write(suggestions)
-                            st.markdown('</div>', unsafe_allow_html=True)
+                        chunks = analyze_resume_with_gemini(resume_text, query, api_key, bypass_cache, stream=True)
+                        render_streamed_result("🎯 Recommended Job Titles", chunks, "result-box", "Generating job suggestions...")
                 
                 # Custom query section
                 st.markdown("---")
@@ -700,14 +790,65 @@ def main():
                 custom_query = st.text_area("Ask any specific question about the resume:")
                 
                 if st.button("Get Answer") and custom_query:
-                    with st.spinner("Processing your question..."):
-                        custom_response = analyze_resume_with_gemini(resume_text, custom_query, api_key)
+                    chunks = analyze_resume_with_gemini(resume_text, custom_query, api_key, bypass_cache, stream=True)
+                    render_streamed_result("💬 Response", chunks, "result-box", "Processing your question...")
+    
+    # Full Report Tab
+    elif selected == "📊 Full Report":
+        st.markdown('<h2 class="sub-header">📊 Full Resume Report</h2>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="info-box">
+        <h4>⚡ Every Analysis in One Click</h4>
+        <p>Runs the summary, strengths, weaknesses, job titles, ATS check and career paths in parallel. 
+        Add a job description to also get match scoring, tailoring, skill gaps and interview questions. 
+        Sections appear as soon as each one is ready.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if not api_key:
+            st.markdown('<div class="warning-box">⚠️ Please enter your Google Gemini API Key in the sidebar to proceed.</div>', unsafe_allow_html=True)
+        else:
+            col1, col2 = st.columns([1, 1])
+            
+            with col1:
+                st.markdown("#### 📄 Your Resume")
+                uploaded_resume_report = st.file_uploader("Upload resume (PDF)", type="pdf", key="report_resume")
+                max_workers = st.slider("⚡ Parallel requests", min_value=1, max_value=10, value=min(FULL_REPORT_MAX_WORKERS, 10))
+                
+            with col2:
+                st.markdown("#### 📋 Job Description (Optional)")
+                report_job_desc = st.text_area(
+                    "Target job description:", 
+                    height=200,
+                    placeholder="Paste a job description to include job-specific sections..."
+                )
+            
+            if uploaded_resume_report and st.button("📊 Generate Full Report", use_container_width=True):
+                resume_text = extract_text_from_pdf(uploaded_resume_report)
+                if resume_text:
+                    tasks = build_full_report_tasks(resume_text, report_job_desc, api_key, bypass_cache)
+                    
+                    # Reserve a slot per section so results keep a stable order as they arrive
+                    placeholders = {}
+                    for title, _ in tasks:
+                        placeholders[title] = st.empty()
+                        placeholders[title].info(f"⏳ {title} - generating...")
                     
-                    if custom_response:
-                        st.markdown('<div class="result-box">', unsafe_allow_html=True)
-                        st.markdown("### 💬 Response")
-                        st.write(custom_response)
-                        st.markdown('</div>', unsafe_allow_html=True)
+                    progress = st.progress(0.0, text="Running analyses...")
+                    start_time = time.time()
+                    for completed, (title, result) in enumerate(run_concurrently(tasks, max_workers), start=1):
+                        with placeholders[title].container():
+                            if result:
+                                st.markdown('<div class="result-box">', unsafe_allow_html=True)
+                                st.markdown(f"### {title}")
+                                st.write(result)
+                                st.markdown('</div>', unsafe_allow_html=True)
+                            else:
+                                st.warning(f"⚠️ {title} could not be generated.")
+                        progress.progress(completed / len(tasks), text=f"{completed}/{len(tasks)} sections ready")
+                    
+                    st.success(f"✅ Full report generated in {time.time() - start_time:.1f}s")
     
     # AI Job Matching Tab
     elif selected == "🚀 AI Job Matching":
@@ -737,18 +878,183 @@ def main():
                     height=200,
                     placeholder="Paste the complete job description from LinkedIn or company website..."
                 )
+                
+                # Previously scraped jobs can be matched without pasting or re-scraping
+                saved_jobs = load_saved_jobs()
+                if not saved_jobs.empty and not job_description:
+                    saved_choice = st.selectbox(
+                        "💾 Or pick a saved job",
+                        options=[None] + list(saved_jobs.index),
+                        format_func=lambda i: "—" if i is None else f"{saved_jobs.at[i, 'title']} at {saved_jobs.at[i, 'company']}"
+                    )
+                    if saved_choice is not None:
+                        job_description = saved_jobs.at[saved_choice, "description"]
+            
+            # Semantic search ranks every saved job against the resume, so nothing has to be pasted
+            resume_key = hashlib.sha256(uploaded_resume.getvalue()).hexdigest() if uploaded_resume else None
+            if uploaded_resume and not saved_jobs.empty and st.button("🔎 Find Top 50 Saved Jobs for This Resume", use_container_width=True):
+                resume_text = extract_text_from_pdf(uploaded_resume)
+                if resume_text:
+                    # Jobs are indexed as they are scraped; only an index that was never built is filled here
+                    with st.spinner("Indexing saved jobs..."):
+                        index_saved_jobs(api_key, only_if_empty=True)
+                    with st.spinner("Searching saved jobs..."):
+                        start = time.perf_counter()
+                        st.session_state["semantic_job_matches"] = {
+                            "resume": resume_key,
+                            "jobs": find_matching_jobs(resume_text, api_key),
+                            "seconds": time.perf_counter() - start,
+                        }
+            
+            # Results belong to the resume they were searched for, not whatever is uploaded now
+            semantic = st.session_state.get("semantic_job_matches")
+            matches = semantic["jobs"] if semantic and semantic["resume"] == resume_key else None
+            if uploaded_resume and matches is not None and not matches.empty:
+                st.markdown("#### 🔎 Most Similar Saved Jobs")
+                st.caption(f"Found in {semantic['seconds']:.2f}s")
+                st.dataframe(
+                    matches[["similarity", "title", "company", "location", "url"]],
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={"url": st.column_config.LinkColumn("Job URL")}
+                )
+                if not job_description:
+                    match_choice = st.selectbox(
+                        "🎯 Analyze one of these jobs",
+                        options=[None] + list(matches.index),
+                        format_func=lambda i: "—" if i is None else f"{matches.at[i, 'title']} at {matches.at[i, 'company']} ({matches.at[i, 'similarity']:.2f})"
+                    )
+                    if match_choice is not None:
+                        job_description = matches.at[match_choice, "description"]
+            
+            # Structured mode returns typed JSON scores instead of a prose report
+            structured = st.toggle("📐 Structured scores (JSON)", key="job_match_structured",
+                                   help="Faster, compact output with scores and skill lists only")
+            always_run_ai = st.checkbox("🤖 Run the AI analysis even when the local match rules the job out",
+                                        key="job_match_always_ai")
             
             if uploaded_resume and job_description and st.button("🔍 Analyze Job Match", use_container_width=True):
-                with st.spinner("Analyzing resume-job compatibility..."):
-                    resume_text = extract_text_from_pdf(uploaded_resume)
+                resume_text = extract_text_from_pdf(uploaded_resume)
+                skip_ai = False
+                if resume_text:
+                    local_scores = render_local_match(resume_text, job_description)
+                    skip_ai = not always_run_ai and is_clear_mismatch(local_scores)
+                    if skip_ai:
+                        st.warning(f"⚡ The resume covers only {local_scores['related_skills_match']}% of the skills this job asks for, "
+                                   "so the AI analysis was skipped. Tick the option above to run it anyway.")
+                if resume_text and not skip_ai and structured:
+                    with st.spinner("Scoring resume-job compatibility..."):
+                        scores = score_job_match(resume_text, job_description, api_key, bypass_cache)
+                    if scores:
+                        render_job_match_scores(scores)
+                elif resume_text and not skip_ai:
+                    chunks = get_resume_job_match_score(resume_text, job_description, api_key, bypass_cache, stream=True)
+                    render_streamed_result("🎯 Job Match Analysis Results", chunks, "success-box", "Analyzing resume-job compatibility...")
+    
+    # Match Matrix Tab
+    elif selected == "🧮 Match Matrix":
+        st.markdown('<h2 class="sub-header">🧮 Resume × Job Match Matrix</h2>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="info-box">
+        <h4>📊 Score Many Resumes Against Many Jobs</h4>
+        <p>Upload several resumes and pick several jobs to get a sortable grid of match scores. 
+        Multiple job descriptions are packed into each AI request, and near-duplicate postings are scored only once.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if not api_key:
+            st.markdown('<div class="warning-box">⚠️ Please enter your Google Gemini API Key in the sidebar to proceed.</div>', unsafe_allow_html=True)
+        else:
+            col1, col2 = st.columns([1, 1])
+            
+            with col1:
+                st.markdown("#### 📄 Resumes")
+                matrix_resumes = st.file_uploader("Upload resumes (PDF)", type="pdf", accept_multiple_files=True, key="matrix_resumes")
+            
+            with col2:
+                st.markdown("#### 📋 Jobs")
+                job_source = st.radio("Job source", ["Paste", "Upload text files", "Saved jobs"], horizontal=True)
+                matrix_jobs = []
+                
+                if job_source == "Paste":
+                    pasted_jobs = st.text_area(
+                        "Job descriptions (separate jobs with a line containing ---):",
+                        height=200,
+                        placeholder="First job description...\n---\nSecond job description..."
+                    )
+                    chunks = [chunk.strip() for chunk in pasted_jobs.split("\n---") if chunk.strip()]
+                    matrix_jobs = [(f"Job {i + 1}", chunk.lstrip("-").strip()) for i, chunk in enumerate(chunks)]
+                elif job_source == "Upload text files":
+                    job_files = st.file_uploader("Upload job descriptions (.txt)", type="txt", accept_multiple_files=True, key="matrix_jobs")
+                    matrix_jobs = [(f.name, f.getvalue().decode("utf-8", errors="ignore")) for f in job_files or []]
+                else:
+                    saved_jobs = load_saved_jobs()
+                    if saved_jobs.empty:
+                        st.info("💡 No saved jobs with descriptions yet. Use the LinkedIn Scraper with 'Fetch full job descriptions'.")
+                    else:
+                        picked = st.multiselect(
+                            "Saved jobs",
+                            options=list(saved_jobs.index),
+                            format_func=lambda i: f"{saved_jobs.at[i, 'title']} at {saved_jobs.at[i, 'company']}"
+                        )
+                        matrix_jobs = [(f"{saved_jobs.at[i, 'title']} at {saved_jobs.at[i, 'company']}", saved_jobs.at[i, "description"]) for i in picked]
+                
+                # Saved jobs already come one per near-duplicate cluster from the job store
+                merge_matrix_duplicates = job_source != "Saved jobs" and st.checkbox("🧹 Score near-duplicate jobs only once", value=True)
+            
+            if matrix_resumes and matrix_jobs and st.button("🧮 Build Match Matrix", use_container_width=True):
+                resumes = []
+                for uploaded in matrix_resumes:
+                    resume_text = extract_text_from_pdf(uploaded)
                     if resume_text:
-                        match_analysis = get_resume_job_match_score(resume_text, job_description, api_key)
+                        resumes.append((uploaded.name, resume_text))
+                
+                # Make job names unique so they become distinct grid columns
+                name_counts = {}
+                unique_jobs = []
+                for name, text in matrix_jobs:
+                    name_counts[name] = name_counts.get(name, 0) + 1
+                    unique_jobs.append((name if name_counts[name] == 1 else f"{name} ({name_counts[name]})", text))
+                
+                # Near-duplicates are scored once and take their representative's scores in the grid
+                duplicate_of = {}
+                if merge_matrix_duplicates and len(unique_jobs) > 1:
+                    for cluster in find_duplicate_clusters([text for _, text in unique_jobs]):
+                        for i in cluster[1:]:
+                            duplicate_of[unique_jobs[i][0]] = unique_jobs[cluster[0]][0]
+                    if duplicate_of:
+                        st.info(f"🧹 {len(duplicate_of)} near-duplicate jobs share the scores of the job they duplicate")
+                scored_jobs = [(name, text) for name, text in unique_jobs if name not in duplicate_of]
+                
+                if resumes:
+                    request_count = len(resumes) * len(pack_job_batches(scored_jobs))
+                    st.caption(f"⚡ {len(resumes)} resumes × {len(unique_jobs)} jobs in {request_count} requests "
+                               f"(instead of {len(resumes) * len(unique_jobs)})")
+                    
+                    progress = st.progress(0.0, text="Scoring...")
+                    matrix_df = build_match_matrix(
+                        resumes, scored_jobs, api_key, bypass_cache,
+                        progress_callback=lambda done, total: progress.progress(done / total, text=f"{done}/{total} requests complete"),
+                        duplicate_of=duplicate_of
+                    )
+                    
+                    if not matrix_df.empty:
+                        st.markdown("### 📊 Overall Match Scores (%)")
+                        grid = matrix_df.pivot_table(index="Resume", columns="Job", values="overall_match")
+                        st.dataframe(grid, use_container_width=True)
+                        
+                        st.markdown("### 🔍 Detailed Scores")
+                        st.dataframe(matrix_df.sort_values("overall_match", ascending=False), use_container_width=True)
                         
-                        if match_analysis:
-                            st.markdown('<div class="success-box">', unsafe_allow_html=True)
-                            st.markdown("### 🎯 Job Match Analysis Results")
-                            st.write(match_analysis)
-                            st.markdown('</div>', unsafe_allow_html=True)
+                        st.download_button(
+                            label="📥 Download Match Matrix as CSV",
+                            data=matrix_df.to_csv(index=False),
+                            file_name="match_matrix.csv",
+                            mime="text/csv"
+                        )
+                    else:
+                        st.error("❌ No match scores were returned. Please try again.")
     
     # Resume Tailoring Tab
     elif selected == "🎨 Resume Tailoring":
@@ -780,24 +1086,19 @@ def main():
                 )
             
             if uploaded_resume_tailor and target_job_desc and st.button("🎨 Generate Tailored Resume", use_container_width=True):
-                with st.spinner("Tailoring your resume for this specific job..."):
-                    resume_text = extract_text_from_pdf(uploaded_resume_tailor)
-                    if resume_text:
-                        tailored_content = generate_tailored_resume(resume_text, target_job_desc, api_key)
-                        
-                        if tailored_content:
-                            st.markdown('<div class="success-box">', unsafe_allow_html=True)
-                            st.markdown("### ✨ Your Tailored Resume Content")
-                            st.write(tailored_content)
-                            st.markdown('</div>', unsafe_allow_html=True)
-                            
-                            # Download option
-                            st.download_button(
-                                label="📥 Download Tailored Resume Content",
-                                data=tailored_content,
-                                file_name="tailored_resume_content.txt",
-                                mime="text/plain"
-                            )
+                resume_text = extract_text_from_pdf(uploaded_resume_tailor)
+                if resume_text:
+                    chunks = generate_tailored_resume(resume_text, target_job_desc, api_key, bypass_cache, stream=True)
+                    tailored_content = render_streamed_result("✨ Your Tailored Resume Content", chunks, "success-box", "Tailoring your resume for this specific job...")
+                    
+                    if tailored_content:
+                        # Download option
+                        st.download_button(
+                            label="📥 Download Tailored Resume Content",
+                            data=tailored_content,
+                            file_name="tailored_resume_content.txt",
+                            mime="text/plain"
+                        )
     
     # Skill Gap Analysis Tab
     elif selected == "📚 Skill Gap Analysis":
@@ -829,16 +1130,10 @@ def main():
                 )
             
             if uploaded_resume_skills and dream_job_desc and st.button("📊 Analyze Skill Gaps", use_container_width=True):
-                with st.spinner("Analyzing skill gaps and creating your personalized learning path..."):
-                    resume_text = extract_text_from_pdf(uploaded_resume_skills)
-                    if resume_text:
-                        skill_analysis = generate_skill_gap_analysis(resume_text, dream_job_desc, api_key)
-                        
-                        if skill_analysis:
-                            st.markdown('<div class="success-box">', unsafe_allow_html=True)
-                            st.markdown("### 📈 Your Personalized Learning Roadmap")
-                            st.write(skill_analysis)
-                            st.markdown('</div>', unsafe_allow_html=True)
+                resume_text = extract_text_from_pdf(uploaded_resume_skills)
+                if resume_text:
+                    chunks = generate_skill_gap_analysis(resume_text, dream_job_desc, api_key, bypass_cache, stream=True)
+                    render_streamed_result("📈 Your Personalized Learning Roadmap", chunks, "success-box", "Analyzing skill gaps and creating your personalized learning path...")
     
     # Interview Prep Tab
     elif selected == "🎯 Interview Prep":
@@ -870,16 +1165,10 @@ def main():
                 )
             
             if uploaded_resume_interview and interview_job_desc and st.button("🎯 Generate Interview Questions", use_container_width=True):
-                with st.spinner("Creating personalized interview questions based on your profile..."):
-                    resume_text = extract_text_from_pdf(uploaded_resume_interview)
-                    if resume_text:
-                        interview_questions = generate_interview_questions(resume_text, interview_job_desc, api_key)
-                        
-                        if interview_questions:
-                            st.markdown('<div class="success-box">', unsafe_allow_html=True)
-                            st.markdown("### 🎪 Your Personalized Interview Preparation")
-                            st.write(interview_questions)
-                            st.markdown('</div>', unsafe_allow_html=True)
+                resume_text = extract_text_from_pdf(uploaded_resume_interview)
+                if resume_text:
+                    chunks = generate_interview_questions(resume_text, interview_job_desc, api_key, bypass_cache, stream=True)
+                    render_streamed_result("🎪 Your Personalized Interview Preparation", chunks, "success-box", "Creating personalized interview questions based on your profile...")
     
     # ATS Checker Tab
     elif selected == "🔍 ATS Checker":
@@ -899,17 +1188,19 @@ def main():
             st.markdown("#### 📄 Upload Resume for ATS Analysis")
             uploaded_resume_ats = st.file_uploader("Choose your resume (PDF)", type="pdf", key="ats_resume")
             
+            structured = st.toggle("📐 Structured report (JSON)", key="ats_structured",
+                                   help="Faster, compact output with the score and issue lists only")
+            
             if uploaded_resume_ats and st.button("🔍 Run ATS Compatibility Check", use_container_width=True):
-                with st.spinner("Analyzing ATS compatibility and optimization opportunities..."):
-                    resume_text = extract_text_from_pdf(uploaded_resume_ats)
-                    if resume_text:
-                        ats_analysis = check_ats_compatibility(resume_text, api_key)
-                        
-                        if ats_analysis:
-                            st.markdown('<div class="success-box">', unsafe_allow_html=True)
-                            st.markdown("### 🤖 ATS Compatibility Report")
-                            st.write(ats_analysis)
-                            st.markdown('</div>', unsafe_allow_html=True)
+                resume_text = extract_text_from_pdf(uploaded_resume_ats)
+                if resume_text and structured:
+                    with st.spinner("Scoring ATS compatibility..."):
+                        report = score_ats_compatibility(resume_text, api_key, bypass_cache)
+                    if report:
+                        render_ats_report(report)
+                elif resume_text:
+                    chunks = check_ats_compatibility(resume_text, api_key, bypass_cache, stream=True)
+                    render_streamed_result("🤖 ATS Compatibility Report", chunks, "success-box", "Analyzing ATS compatibility and optimization opportunities...")
     
     # Career Paths Tab
     elif selected == "📈 Career Paths":
@@ -930,16 +1221,10 @@ def main():
             uploaded_resume_career = st.file_uploader("Choose your resume (PDF)", type="pdf", key="career_resume")
             
             if uploaded_resume_career and st.button("📈 Explore Career Paths", use_container_width=True):
-                with st.spinner("Analyzing your profile and discovering career opportunities..."):
-                    resume_text = extract_text_from_pdf(uploaded_resume_career)
-                    if resume_text:
-                        career_recommendations = generate_career_recommendations(resume_text, api_key)
-                        
-                        if career_recommendations:
-                            st.markdown('<div class="success-box">', unsafe_allow_html=True)
-                            st.markdown("### 🚀 Your Career Roadmap & Opportunities")
-                            st.write(career_recommendations)
-                            st.markdown('</div>', unsafe_allow_html=True)
+                resume_text = extract_text_from_pdf(uploaded_resume_career)
+                if resume_text:
+                    chunks = generate_career_recommendations(resume_text, api_key, bypass_cache, stream=True)
+                    render_streamed_result("🚀 Your Career Roadmap & Opportunities", chunks, "success-box", "Analyzing your profile and discovering career opportunities...")
     
     # LinkedIn Scraper Tab
     elif selected == "LinkedIn Scraper":
@@ -957,51 +1242,141 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
-        # Input fields
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            job_title = st.text_input("🔍 Job Title", placeholder="e.g., Data Scientist")
-        
-        with col2:
-            location = st.text_input("📍 Location (Optional)", placeholder="e.g., New York, NY")
+        scrape_mode = st.radio("Search mode", ["Single search", "Batch search"], horizontal=True)
+        fetch_details = st.checkbox("📝 Fetch full job descriptions", help="Downloads each posting's description so it can be used in the matching tabs")
+        merge_duplicates = st.checkbox("🧹 Merge near-duplicate postings", value=True, help="Collapses reposts of the same role across locations into one row")
         
-        with col3:
-            num_jobs = st.number_input("📊 Number of Jobs", min_value=5, max_value=20, value=10)
-        
-        if st.button("🚀 Scrape LinkedIn Jobs", use_container_width=True):
-            if job_title:
-                with st.spinner("Scraping LinkedIn jobs... This may take a few minutes."):
-                    jobs_data = scrape_linkedin_jobs(job_title, location, num_jobs)
-                
-                if jobs_data:
-                    st.success(f"✅ Successfully scraped {len(jobs_data)} jobs!")
+        if scrape_mode == "Single search":
+            paginate = st.checkbox("📜 Scroll through more result pages", help="Keeps loading results until the requested number of jobs is reached")
+            
+            # Input fields
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                job_title = st.text_input("🔍 Job Title", placeholder="e.g., Data Scientist")
+            
+            with col2:
+                location = st.text_input("📍 Location (Optional)", placeholder="e.g., New York, NY")
+            
+            with col3:
+                num_jobs = st.number_input("📊 Number of Jobs", min_value=5, max_value=500 if paginate else 20, value=10)
+            
+            if st.button("🚀 Scrape LinkedIn Jobs", use_container_width=True):
+                if job_title:
+                    if paginate:
+                        # Show jobs as each result page streams in rather than waiting for the whole crawl
+                        jobs_data = []
+                        live_status = st.empty()
+                        live_table = st.empty()
+                        for page in stream_linkedin_jobs(job_title, location, num_jobs):
+                            jobs_data.extend(page)
+                            live_status.info(f"⏳ Scraped {len(jobs_data)} of {num_jobs} jobs...")
+                            live_table.dataframe(pd.DataFrame(jobs_data), use_container_width=True)
+                        live_status.empty()
+                        live_table.empty()
+                    else:
+                        with st.spinner("Scraping LinkedIn jobs... This may take a few minutes."):
+                            jobs_data = scrape_linkedin_jobs(job_title, location, num_jobs)
+                    
+                    if jobs_data:
+                        with st.spinner("Saving jobs and fetching new descriptions..." if fetch_details else "Saving jobs..."):
+                            jobs_data, new_count = save_scraped_jobs(jobs_data, f"{job_title} @ {location}" if location else job_title, fetch_details)
+                            index_saved_jobs(api_key)
+                        if new_count is not None:
+                            st.info(f"💾 {new_count} new postings saved, {len(jobs_data) - new_count} already in your job store")
+                        if merge_duplicates:
+                            jobs_data = merge_stored_duplicates(pd.DataFrame(jobs_data)).to_dict("records")
                     
-                    # Display results in a dataframe
-                    df = pd.DataFrame(jobs_data)
-                    st.dataframe(df, use_container_width=True)
+                    if jobs_data:
+                        st.success(f"✅ Successfully scraped {len(jobs_data)} jobs!")
+                        
+                        # Display results in a dataframe
+                        df = pd.DataFrame(jobs_data)
+                        st.dataframe(df, use_container_width=True)
+                        
+                        # Download option
+                        csv = df.to_csv(index=False)
+                        st.download_button(
+                            label="📥 Download Jobs Data as CSV",
+                            data=csv,
+                            file_name=f"linkedin_jobs_{job_title.replace(' ', '_')}.csv",
+                            mime="text/csv"
+                        )
+                        
+                        # Display individual job cards
+                        st.markdown("### 📋 Job Details")
+                        for i, job in enumerate(jobs_data):
+                            with st.expander(f"🏢 {job['Title']} at {job['Company']}"):
+                                st.markdown(f"**📍 Location:** {job['Location']}")
+                                st.markdown(f"**🔗 URL:** [View Job]({job['URL']})")
+                                st.markdown("**📝 Description:**")
+                                st.write(job['Description'])
+                    else:
+                        st.error("❌ Failed to scrape jobs. LinkedIn may be blocking automated requests or there might be connection issues.")
+                else:
+                    st.warning("⚠️ Please enter a job title to search for.")
+
+        else:
+            st.markdown("#### 🔀 Batch Search")
+            st.caption("Every job title is searched in every location, in parallel across several browsers. Duplicate postings are merged.")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                titles_input = st.text_area("🔍 Job Titles (one per line)", placeholder="Data Scientist\nML Engineer")
+            
+            with col2:
+                locations_input = st.text_area("📍 Locations (one per line, optional)", placeholder="New York, NY\nRemote")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                batch_num_jobs = st.number_input("📊 Jobs per Search", min_value=5, max_value=20, value=10)
+            
+            with col2:
+                pool_size = configured_pool_size()
+                batch_workers = st.slider("🌐 Parallel Browsers", min_value=1, max_value=pool_size, value=pool_size) if pool_size > 1 else 1
+            
+            titles = [t.strip() for t in titles_input.splitlines() if t.strip()]
+            locations = [l.strip() for l in locations_input.splitlines() if l.strip()] or [""]
+            queries = [(title, loc) for title in titles for loc in locations]
+            
+            if st.button(f"🚀 Run {len(queries)} Searches", use_container_width=True, disabled=not queries):
+                with st.spinner(f"Scraping {len(queries)} searches with {batch_workers} browsers..."):
+                    jobs_df = scrape_linkedin_jobs_batch(queries, batch_num_jobs, batch_workers)
+                
+                if jobs_df is not None and not jobs_df.empty:
+                    with st.spinner("Saving jobs and fetching new descriptions..." if fetch_details else "Saving jobs..."):
+                        jobs_records, new_count = save_scraped_jobs(jobs_df.to_dict("records"), None, fetch_details)
+                        index_saved_jobs(api_key)
+                        jobs_df = pd.DataFrame(jobs_records)
+                    if new_count is not None:
+                        st.info(f"💾 {new_count} new postings saved, {len(jobs_df) - new_count} already in your job store")
+                    if merge_duplicates:
+                        unique_count = len(jobs_df)
+                        jobs_df = merge_stored_duplicates(jobs_df)
+                        st.info(f"🧹 Merged {unique_count - len(jobs_df)} near-duplicate postings")
+                
+                if jobs_df is not None and not jobs_df.empty:
+                    st.success(f"✅ Found {len(jobs_df)} unique jobs across {len(queries)} searches!")
+                    st.dataframe(jobs_df, use_container_width=True)
                     
-                    # Download option
-                    csv = df.to_csv(index=False)
                     st.download_button(
                         label="📥 Download Jobs Data as CSV",
-                        data=csv,
-                        file_name=f"linkedin_jobs_{job_title.replace(' ', '_')}.csv",
+                        data=jobs_df.to_csv(index=False),
+                        file_name="linkedin_jobs_batch.csv",
                         mime="text/csv"
                     )
-                    
-                    # Display individual job cards
-                    st.markdown("### 📋 Job Details")
-                    for i, job in enumerate(jobs_data):
-                        with st.expander(f"🏢 {job['Title']} at {job['Company']}"):
-                            st.markdown(f"**📍 Location:** {job['Location']}")
-                            st.markdown(f"**🔗 URL:** [View Job]({job['URL']})")
-                            st.markdown("**📝 Description:**")
-                            st.write(job['Description'])
                 else:
                     st.error("❌ Failed to scrape jobs. LinkedIn may be blocking automated requests or there might be connection issues.")
-            else:
-                st.warning("⚠️ Please enter a job title to search for.")
+    
+        # Page readiness timings
+        readiness = readiness_stats.summary()
+        if readiness["pages"] or readiness["timeouts"]:
+            with st.expander("⏱️ Page Load Timings"):
+                st.caption(f"{readiness['pages']} pages ready in {readiness['mean_seconds']:.2f}s on average, "
+                           f"{readiness['timeouts']} timed out after {SCRAPER_PAGE_TIMEOUT:g}s")
+                st.bar_chart(pd.Series(readiness_stats.histogram(), name="Pages"))
     
     # About Tab
     elif selected == "About":
@@ -1,17 +1,18 @@
 import streamlit as st
 from streamlit_option_menu import option_menu
 from streamlit_extras.add_vertical_space import add_vertical_space
-import PyPDF2
 import os
-import openai
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
-import time
 from dotenv import load_dotenv
+from linkedin_scraper import wait_for_job_cards
+from llm_backends import get_backend
+from pdf_text import extract_text
+from token_budget import DEFAULT_RESUME_BUDGET, fit_resume
 
 # Load environment variables
 load_dotenv()
@@ -65,42 +66,38 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 def extract_text_from_pdf(pdf_file):
-    """Extract text from uploaded PDF file"""
+    """Extract text from uploaded PDF file (cached by content hash)"""
     try:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
+        return extract_text(pdf_file)
     except Exception as e:
         st.error(f"Error extracting text from PDF: {str(e)}")
         return None
 
-def analyze_resume_with_openai(resume_text, query, api_key):
-    """Analyze resume using OpenAI API directly"""
+# This lightweight app defaults to OpenAI; LLM_BACKEND=gemini or fake switches it
+LLM_PROVIDER = os.getenv("LLM_BACKEND", "openai").lower()
+SYSTEM_PROMPT = "You are an expert career counselor and resume analyst. Provide detailed, actionable feedback."
+
+def analyze_resume_with_llm(resume_text, query, api_key):
+    """Analyze resume through the configured LLM backend"""
     try:
-        client = openai.OpenAI(api_key=api_key)
+        backend = get_backend(
+            api_key,
+            provider=LLM_PROVIDER,
+            model_name=os.getenv("OPENAI_MODEL", "gpt-3.5-turbo") if LLM_PROVIDER == "openai" else None,
+            system_prompt=SYSTEM_PROMPT,
+            default_config={"max_output_tokens": 1000, "temperature": 0.3},
+        )
         
         prompt = f"""
         Based on the following resume content, please {query}
         
         Resume Content:
-        {resume_text[:4000]}  # Limit text to avoid token limits
+        {fit_resume(resume_text, "resume_analysis", DEFAULT_RESUME_BUDGET)}
         
         Please provide a detailed and helpful response.
         """
         
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are an expert career counselor and resume analyst. Provide detailed, actionable feedback."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=1000,
-            temperature=0.3
-        )
-        
-        return response.choices[0].message.content
+        return backend.generate(prompt)
     except Exception as e:
         st.error(f"Error analyzing resume: {str(e)}")
         return None
@@ -138,7 +135,7 @@ def scrape_linkedin_jobs(job_title, location="", num_jobs=10):
             search_url += f"&location={location.replace(' ', '%20')}"
         
         driver.get(search_url)
-        time.sleep(3)
+        wait_for_job_cards(driver, float(os.getenv("SCRAPER_PAGE_TIMEOUT", "10")))
         
         jobs_data = []
         
@@ -195,11 +192,17 @@ def main():
         add_vertical_space(3)
         
         # API Key input
-        st.markdown("### 🔑 OpenAI API Key")
-        api_key = st.text_input("Enter your OpenAI API Key", type="password")
-        
-        if api_key:
-            os.environ["OPENAI_API_KEY"] = api_key
+        if LLM_PROVIDER == "fake":
+            st.markdown("### 🧪 Offline Mode")
+            st.info("💡 LLM_BACKEND=fake: answers are generated locally for testing")
+            api_key = "offline"
+        else:
+            key_label, key_env = ("Google Gemini", "GEMINI_API_KEY") if LLM_PROVIDER == "gemini" else ("OpenAI", "OPENAI_API_KEY")
+            st.markdown(f"### 🔑 {key_label} API Key")
+            api_key = st.text_input(f"Enter your {key_label} API Key", type="password")
+            
+            if api_key:
+                os.environ[key_env] = api_key
     
     # Resume Analyzer Tab
     if selected == "Resume Analyzer":
@@ -232,7 +235,7 @@ def main():
                         query = "provide a comprehensive summary highlighting the candidate's qualifications, key experience, skills, projects, and major achievements. Make it concise but informative."
                         
                         with st.spinner("Analyzing resume..."):
-                            summary = analyze_resume_with_openai(resume_text, query, api_key)
+                            summary = analyze_resume_with_llm(resume_text, query, api_key)
                         
                         if summary:
                             st.markdown('<div class="result-box">', unsafe_allow_html=True)
@@ -244,7 +247,7 @@ def main():
                         query = "identify the key strengths, competitive advantages, and standout qualifications that make this candidate attractive to employers. Focus on what makes them unique."
                         
                         with st.spinner("Identifying strengths..."):
-                            strengths = analyze_resume_with_openai(resume_text, query, api_key)
+                            strengths = analyze_resume_with_llm(resume_text, query, api_key)
                         
                         if strengths:
                             st.markdown('<div class="result-box">', unsafe_allow_html=True)
@@ -257,7 +260,7 @@ def main():
                         query = "identify potential weaknesses, gaps, or areas for improvement in this resume. Provide constructive feedback and specific suggestions for enhancement."
                         
                         with st.spinner("Identifying areas for improvement..."):
-                            weaknesses = analyze_resume_with_openai(resume_text, query, api_key)
+                            weaknesses = analyze_resume_with_llm(resume_text, query, api_key)
                         
                         if weaknesses:
                             st.markdown('<div class="result-box">', unsafe_allow_html=True)
@@ -269,7 +272,7 @@ def main():
                         query = "suggest the most suitable job titles and career positions that align with the candidate's profile. Based on their qualifications, experience, and skills, what roles would be the best fit?"
                         
                         with st.spinner("Generating job suggestions..."):
-                            suggestions = analyze_resume_with_openai(resume_text, query, api_key)
+                            suggestions = analyze_resume_with_llm(resume_text, query, api_key)
                         
                         if suggestions:
                             st.markdown('<div class="result-box">', unsafe_allow_html=True)
@@ -284,7 +287,7 @@ def main():
                 
                 if st.button("Get Answer") and custom_query:
                     with st.spinner("Processing your question..."):
-                        custom_response = analyze_resume_with_openai(resume_text, custom_query, api_key)
+                        custom_response = analyze_resume_with_llm(resume_text, custom_query, api_key)
                     
                     if custom_response:
                         st.markdown('<div class="result-box">', unsafe_allow_html=True)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Headless batch screening: rank a directory of PDF resumes against one job description.
+
+PDFs are parsed in a process pool, Gemini match-scoring calls run concurrently
+under a requests-per-minute limit, and every finished resume is appended to a
+checkpoint file so an interrupted run resumes where it stopped.
+
+Usage:
+    python batch_screen.py resumes/ job_description.txt -o ranking.csv
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import pandas as pd
+from dotenv import load_dotenv
+
+from llm_backends import default_provider, get_backend
+from llm_cache import cached_generate
+from pdf_text import extract_text
+from prefilter import similarity_matrix, top_k_per_job
+from resume_parser import local_match_scores
+from prompts import PROMPT_VERSIONS, build_job_match_json_prompt
+from score_schema import JOB_MATCH_SCHEMA, generation_config_for, parse_structured_response
+
+
+def load_checkpoint(path):
+    """Return previously scored rows keyed by resume file name"""
+    done = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    # A run killed mid-write can leave a truncated last line
+                    continue
+                done[row["file"]] = row
+    return done
+
+
+def _extract_one(path):
+    """Process pool worker: return (path, text, error)"""
+    try:
+        # Documents are already spread across processes; don't nest page pools
+        return path, extract_text(path, parallel=False), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def score_resume(resume_text, job_description, api_key, model_name, bypass_cache=False):
+    """Score one resume against the job; returns the validated JOB_MATCH_SCHEMA dict"""
+    prompt = build_job_match_json_prompt(resume_text, job_description)
+    backend = get_backend(api_key, model_name=model_name)
+
+    def generate():
+        return backend.generate(prompt, generation_config_for(JOB_MATCH_SCHEMA))
+
+    inputs = {"resume_text": resume_text, "job_description": job_description}
+    response = cached_generate(generate, backend.name, "job_match_json", PROMPT_VERSIONS["job_match_json"], inputs,
+                               bypass=bypass_cache)
+    return parse_structured_response(response, JOB_MATCH_SCHEMA)
+
+
+def flatten_scores(scores):
+    """Join list fields so a score dict fits in one CSV/Parquet row"""
+    return {field: "; ".join(value) if isinstance(value, list) else value for field, value in scores.items()}
+
+
+def write_ranking(rows, output_path):
+    """Write rows sorted by overall match score (then pre-filter score) to CSV or Parquet"""
+    df = pd.DataFrame(rows)
+    for column in ("file", "overall_match", "prefilter_score"):
+        if column not in df.columns:
+            df[column] = None
+    df = df.sort_values(["overall_match", "prefilter_score"], ascending=False, na_position="last").reset_index(drop=True)
+    df.insert(0, "rank", range(1, len(df) + 1))
+
+    if output_path.endswith(".parquet"):
+        df.to_parquet(output_path, index=False)
+    else:
+        df.to_csv(output_path, index=False)
+    return df
+
+
+def run_batch(resume_dir, job_description, api_key, output_path, checkpoint_path=None,
+              model_name=None, parse_workers=None, llm_workers=4,
+              requests_per_minute=60, tokens_per_minute=0, bypass_cache=False, top_k=None):
+    """Score every PDF in ``resume_dir`` and write the ranked results
+
+    With ``top_k`` set, all resumes are first ranked locally by TF-IDF cosine
+    similarity and only the best ``top_k`` are sent to Gemini.
+    """
+    checkpoint_path = checkpoint_path or output_path + ".checkpoint.jsonl"
+    done = load_checkpoint(checkpoint_path)
+
+    pdf_paths = sorted(
+        os.path.join(resume_dir, name)
+        for name in os.listdir(resume_dir)
+        if name.lower().endswith(".pdf")
+    )
+    pending = [p for p in pdf_paths if os.path.basename(p) not in done]
+    print(f"📄 {len(pdf_paths)} resumes found, {len(done)} already scored, {len(pending)} to go")
+
+    # The shared backend paces, retries and circuit-breaks every LLM call
+    get_backend(api_key, model_name=model_name).set_rate_limits(requests_per_minute, tokens_per_minute)
+    checkpoint_lock = threading.Lock()
+    failures = 0
+    skipped_rows = []
+
+    pending_paths = set(pending)
+
+    def parse_failed(path, error):
+        nonlocal failures
+        if path in pending_paths:
+            failures += 1
+        print(f"❌ {os.path.basename(path)}: could not extract text ({error or 'empty'})", file=sys.stderr)
+
+    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint, \
+            ProcessPoolExecutor(max_workers=parse_workers) as parse_pool, \
+            ThreadPoolExecutor(max_workers=llm_workers) as llm_pool:
+
+        def score_and_record(path, resume_text, prefilter_score=None):
+            scores = score_resume(resume_text, job_description, api_key, model_name, bypass_cache)
+            row = {"file": os.path.basename(path), **flatten_scores(scores)}
+            local = local_match_scores(resume_text, job_description)
+            row["years_of_experience"] = local["years_of_experience"]
+            row["local_direct_skills"] = local["direct_skills_match"]
+            row["local_related_skills"] = local["related_skills_match"]
+            if prefilter_score is not None:
+                row["prefilter_score"] = prefilter_score
+            with checkpoint_lock:
+                checkpoint.write(json.dumps(row) + "\n")
+                checkpoint.flush()
+            return row
+
+        llm_futures = {}
+        if top_k:
+            # The pre-filter ranks the whole pool, so it needs every resume's text before scoring
+            texts = {}
+            for path, resume_text, error in parse_pool.map(_extract_one, pdf_paths):
+                if error or not resume_text:
+                    parse_failed(path, error)
+                    continue
+                texts[path] = resume_text
+
+            paths = list(texts)
+            similarity = similarity_matrix([texts[p] for p in paths], [job_description])
+            shortlisted = {paths[i] for i, _ in top_k_per_job(similarity, top_k)[0]}
+            for i, path in enumerate(paths):
+                name = os.path.basename(path)
+                prefilter_score = round(float(similarity[i, 0]), 4)
+                if name in done:
+                    done[name]["prefilter_score"] = prefilter_score
+                elif path in shortlisted:
+                    llm_futures[llm_pool.submit(score_and_record, path, texts[path], prefilter_score)] = path
+                else:
+                    skipped_rows.append({"file": name, "prefilter_score": prefilter_score})
+            del texts
+            print(f"🔎 Pre-filter kept {len(shortlisted)} of {len(paths)} resumes for Gemini scoring")
+        else:
+            # Hand each resume to the LLM pool as soon as its PDF is parsed
+            for future in as_completed([parse_pool.submit(_extract_one, p) for p in pending]):
+                path, resume_text, error = future.result()
+                if error or not resume_text:
+                    parse_failed(path, error)
+                    continue
+                llm_futures[llm_pool.submit(score_and_record, path, resume_text)] = path
+
+        for future in as_completed(llm_futures):
+            path = llm_futures[future]
+            try:
+                row = future.result()
+                done[row["file"]] = row
+                print(f"✅ {row['file']}: {row['overall_match']}%")
+            except Exception as e:
+                failures += 1
+                print(f"❌ {os.path.basename(path)}: {e}", file=sys.stderr)
+
+    df = write_ranking(list(done.values()) + skipped_rows, output_path)
+    print(f"🏁 Wrote {len(df)} ranked resumes to {output_path} ({failures} failed, rerun to retry)")
+    return df
+
+
+def main(argv=None):
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Rank a directory of PDF resumes against one job description")
+    parser.add_argument("resume_dir", help="Directory containing PDF resumes")
+    parser.add_argument("job_description", help="Text file with the job description")
+    parser.add_argument("-o", "--output", default="ranking.csv", help="Output file (.csv or .parquet)")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint.jsonl)")
+    parser.add_argument("--model", default=None, help="Model name (default: GEMINI_MODEL / OPENAI_MODEL)")
+    parser.add_argument("--parse-workers", type=int, default=None, help="PDF parsing processes (default: CPU count)")
+    parser.add_argument("--llm-workers", type=int, default=4, help="Concurrent Gemini requests")
+    parser.add_argument("--rpm", type=int, default=60, help="Maximum Gemini requests per minute")
+    parser.add_argument("--tpm", type=int, default=0, help="Maximum Gemini tokens per minute (0 = unlimited)")
+    parser.add_argument("--top-k", type=int, default=None, help="Only send the K best locally pre-filtered resumes to Gemini")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    args = parser.parse_args(argv)
+
+    # LLM_BACKEND picks the provider; the fake backend runs offline without a key
+    provider = default_provider()
+    key_env = {"gemini": "GEMINI_API_KEY", "openai": "OPENAI_API_KEY"}.get(provider)
+    api_key = os.getenv(key_env) if key_env else "offline"
+    if not api_key:
+        parser.error(f"{key_env} is not set (add it to .env or the environment)")
+
+    with open(args.job_description, "r", encoding="utf-8") as f:
+        job_description = f.read()
+
+    run_batch(
+        args.resume_dir,
+        job_description,
+        api_key,
+        args.output,
+        checkpoint_path=args.checkpoint,
+        model_name=args.model,
+        parse_workers=args.parse_workers,
+        llm_workers=args.llm_workers,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        bypass_cache=args.no_cache,
+        top_k=args.top_k,
+    )
+
+
+if __name__ == "__main__":
+    main()
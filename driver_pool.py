@@ -0,0 +1,182 @@
+"""
+Warm pool of headless Chrome drivers for the LinkedIn scraper.
+
+The chromedriver binary is resolved once per process and drivers are reused
+across searches instead of paying browser start-up on every call. The pool
+starts its drivers in the background as soon as it is created. A driver is
+health-checked before it is handed out and recycled after ``max_uses``
+searches or as soon as it crashes; a page that merely timed out leaves the
+driver usable.
+"""
+
+import atexit
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+@lru_cache(maxsize=1)
+def resolve_chromedriver_path():
+    """Download/locate chromedriver once per process"""
+    return ChromeDriverManager().install()
+
+
+def create_chrome_driver():
+    """Start a headless Chrome configured for LinkedIn scraping"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
+
+    service = Service(resolve_chromedriver_path())
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+
+def _quit_quietly(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class DriverPool:
+    """Bounded pool of reusable WebDriver instances"""
+
+    def __init__(self, size=2, max_uses=20, factory=create_chrome_driver):
+        self.size = size
+        self.max_uses = max_uses
+        self.factory = factory
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def warm(self, count=None):
+        """Pre-start up to ``count`` idle drivers (defaults to the pool size)"""
+        drivers = []
+        try:
+            for _ in range(count or self.size):
+                drivers.append(self.acquire(timeout=0))
+        except Exception:
+            # The pool is busy, or a browser cannot start here and fails again, visibly, on the first search
+            pass
+        finally:
+            for driver in drivers:
+                self.release(driver)
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def acquire(self, timeout=None):
+        """Check out a healthy driver, starting one if the pool has room"""
+        if self._closed:
+            raise RuntimeError("Driver pool is closed")
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("No WebDriver available in the pool")
+
+        try:
+            while True:
+                try:
+                    driver = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if self._is_healthy(driver):
+                    return driver
+                self._discard(driver)
+
+            driver = self.factory()
+            with self._lock:
+                self._uses[id(driver)] = 0
+            return driver
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, driver, broken=False):
+        """Return a driver to the pool, recycling it when worn out or broken"""
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+
+        if broken or self._closed or uses >= self.max_uses:
+            self._discard(driver)
+        else:
+            try:
+                driver.delete_all_cookies()
+                self._idle.put(driver)
+            except Exception:
+                self._discard(driver)
+        self._slots.release()
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        _quit_quietly(driver)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Context manager that checks a driver out and always returns it"""
+        driver = self.acquire(timeout=timeout)
+        broken = False
+        try:
+            yield driver
+        except TimeoutException:
+            # A slow page says nothing about the browser; keep the driver
+            raise
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def close(self):
+        """Quit every idle driver; checked-out drivers are quit on release"""
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def configured_pool_size():
+    """Size of the process-wide pool, read from the environment without starting any browsers"""
+    pool = _pool
+    return pool.size if pool is not None else int(os.getenv("SCRAPER_POOL_SIZE", "2"))
+
+
+def get_driver_pool():
+    """Return the process-wide driver pool, configured from the environment"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool(
+                size=configured_pool_size(),
+                max_uses=int(os.getenv("SCRAPER_DRIVER_MAX_USES", "20")),
+            )
+            atexit.register(_pool.close)
+            warm_count = int(os.getenv("SCRAPER_WARM_DRIVERS", str(_pool.size)))
+            if warm_count > 0:
+                threading.Thread(target=_pool.warm, args=(warm_count,), name="driver-pool-warm", daemon=True).start()
+        return _pool
@@ -0,0 +1,229 @@
+"""
+Shared Gemini client layer.
+
+``genai.configure`` swaps a process-global client, so calling it per request
+is both slow and unsafe when several sessions use different API keys. Here
+each API key gets one long-lived ``GenerativeServiceClient`` (and so one
+gRPC channel) that every model object for that key reuses, model objects are
+created once per model name, and the model name, default generation settings,
+request timeout and call metrics all live in one place. Each client also
+owns the rate limiter, retry policy and circuit breaker for its key (see
+``llm_limits``), so every session sharing a key shares one quota.
+"""
+
+import itertools
+import os
+import threading
+import time
+
+import google.generativeai as genai
+from google.ai import generativelanguage as glm
+
+from llm_limits import RequestLimiter, call_with_retry, limits_from_env
+from token_budget import count_tokens
+
+DEFAULT_GEMINI_MODEL = "gemini-2.5-flash"
+DEFAULT_EMBEDDING_MODEL = "text-embedding-004"
+
+
+def default_model_name():
+    """Model used when a call does not name one (GEMINI_MODEL, read lazily so .env files apply)"""
+    return os.getenv("GEMINI_MODEL", DEFAULT_GEMINI_MODEL)
+
+
+def default_generation_config():
+    """Generation settings applied to every request unless overridden per call"""
+    config = {}
+    if os.getenv("GEMINI_TEMPERATURE"):
+        config["temperature"] = float(os.getenv("GEMINI_TEMPERATURE"))
+    if os.getenv("GEMINI_MAX_OUTPUT_TOKENS"):
+        config["max_output_tokens"] = int(os.getenv("GEMINI_MAX_OUTPUT_TOKENS"))
+    return config
+
+
+class CallStats:
+    """Thread-safe counters for Gemini request latency and failures"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.errors = 0
+            self.total_seconds = 0.0
+            self.first_token_seconds = 0.0
+            self.streams = 0
+
+    def record(self, seconds, ok=True, first_token=None):
+        with self._lock:
+            self.calls += 1
+            self.total_seconds += seconds
+            if not ok:
+                self.errors += 1
+            if first_token is not None:
+                self.streams += 1
+                self.first_token_seconds += first_token
+
+    def summary(self):
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+                "mean_first_token_seconds": self.first_token_seconds / self.streams if self.streams else 0.0,
+            }
+
+
+call_stats = CallStats()
+
+
+def _bind_model(model, service):
+    """Point ``model`` at ``service`` instead of the global client from ``genai.configure``
+
+    ``GenerativeModel`` takes no client argument, so this is the only place
+    that sets its private ``_client``. If an SDK update drops the attribute,
+    this fails loudly rather than silently sending every key's requests
+    through the global client.
+    """
+    if not hasattr(model, "_client"):
+        raise RuntimeError(
+            f"google-generativeai {genai.__version__} no longer has GenerativeModel._client; "
+            "per-key clients need a version that does"
+        )
+    model._client = service
+    return model
+
+
+class GeminiClient:
+    """One API key's connection to Gemini, shared by all sessions using that key"""
+
+    def __init__(self, api_key, model_name=None, timeout=None, generation_config=None, stats=call_stats):
+        self.model_name = model_name or default_model_name()
+        self.timeout = timeout or float(os.getenv("GEMINI_TIMEOUT", "120"))
+        self.generation_config = generation_config if generation_config is not None else default_generation_config()
+        self.stats = stats
+        self.limiter, self.breaker, self.retry = limits_from_env()
+        self._service = glm.GenerativeServiceClient(client_options={"api_key": api_key})
+        self._models = {}
+        self._lock = threading.Lock()
+
+    def set_rate_limits(self, requests_per_minute=0, tokens_per_minute=0):
+        """Replace the configured quota for this key (0 disables a limit)"""
+        self.limiter = RequestLimiter(requests_per_minute, tokens_per_minute)
+
+    def model(self, model_name=None):
+        """Return the cached model object for ``model_name`` bound to this key's connection"""
+        model_name = model_name or self.model_name
+        with self._lock:
+            model = self._models.get(model_name)
+            if model is None:
+                model = _bind_model(genai.GenerativeModel(model_name), self._service)
+                self._models[model_name] = model
+            return model
+
+    def _config(self, generation_config):
+        return {**self.generation_config, **(generation_config or {})}
+
+    def generate(self, prompt, generation_config=None, model_name=None):
+        """Return the full response text for ``prompt``"""
+        prompt_tokens = count_tokens(prompt)
+
+        def call():
+            self.limiter.acquire(prompt_tokens)
+            response = self.model(model_name).generate_content(
+                prompt,
+                generation_config=self._config(generation_config),
+                request_options={"timeout": self.timeout},
+            )
+            text = response.text
+            self.limiter.record_usage(count_tokens(text))
+            return text
+
+        start = time.perf_counter()
+        ok = False
+        try:
+            text = call_with_retry(call, self.breaker, **self.retry)
+            ok = True
+            return text
+        finally:
+            self.stats.record(time.perf_counter() - start, ok)
+
+    def stream(self, prompt, generation_config=None, model_name=None):
+        """Yield response text chunks for ``prompt`` as they arrive
+
+        Failures are only retried until the first chunk arrives, since text
+        already shown to the user cannot be taken back.
+        """
+        prompt_tokens = count_tokens(prompt)
+
+        def open_stream():
+            self.limiter.acquire(prompt_tokens)
+            chunks = iter(self.model(model_name).generate_content(
+                prompt,
+                generation_config=self._config(generation_config),
+                stream=True,
+                request_options={"timeout": self.timeout},
+            ))
+            return next(chunks, None), chunks
+
+        start = time.perf_counter()
+        first_token = None
+        output_tokens = 0
+        ok = False
+        try:
+            first, chunks = call_with_retry(open_stream, self.breaker, **self.retry)
+            first_token = time.perf_counter() - start
+            for chunk in itertools.chain([first] if first is not None else [], chunks):
+                text = chunk.text
+                output_tokens += count_tokens(text)
+                yield text
+            ok = True
+        except GeneratorExit:
+            # The consumer stopped reading early; that is not a failed request
+            ok = True
+            raise
+        finally:
+            self.limiter.record_usage(output_tokens)
+            self.stats.record(time.perf_counter() - start, ok, first_token)
+
+    def embed(self, texts, model_name=DEFAULT_EMBEDDING_MODEL, task_type="RETRIEVAL_DOCUMENT", dimensions=None):
+        """Return one embedding (list of floats) per text, sent in batches of up to 100"""
+        model_name = model_name if model_name.startswith("models/") else f"models/{model_name}"
+        vectors = []
+        for start in range(0, len(texts), 100):
+            batch = texts[start:start + 100]
+            requests = [
+                glm.EmbedContentRequest(model=model_name, content=glm.Content(parts=[glm.Part(text=text)]),
+                                        task_type=task_type, output_dimensionality=dimensions)
+                for text in batch
+            ]
+
+            def call():
+                self.limiter.acquire(sum(count_tokens(text) for text in batch))
+                return self._service.batch_embed_contents(model=model_name, requests=requests, timeout=self.timeout)
+
+            begin = time.perf_counter()
+            ok = False
+            try:
+                response = call_with_retry(call, self.breaker, **self.retry)
+                ok = True
+            finally:
+                self.stats.record(time.perf_counter() - begin, ok)
+            vectors.extend(list(embedding.values) for embedding in response.embeddings)
+        return vectors
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_gemini_client(api_key):
+    """Return the process-wide client for ``api_key``, creating it on first use"""
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = GeminiClient(api_key)
+            _clients[api_key] = client
+        return client
@@ -0,0 +1,159 @@
+"""
+Near-duplicate job posting detection with MinHash and LSH banding.
+
+The same role is often posted many times across locations or reposted with
+small edits. Each posting is reduced to a MinHash signature over word
+shingles, and LSH banding only compares postings that share a band bucket, so
+clusters are found in roughly linear time instead of comparing every pair.
+Collapsing clusters before LLM scoring means one job is only paid for once.
+The job store keeps each posting's signature and band buckets, so new
+postings join an existing cluster as they are saved.
+"""
+
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
+
+from linkedin_scraper import PLACEHOLDER_DESCRIPTION
+from prefilter import tokenize
+
+# Mersenne prime for the universal hash family used to simulate permutations
+_PRIME = np.uint64((1 << 31) - 1)
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 16
+
+
+def shingles(text, k=3):
+    """Return the set of hashed word k-grams in ``text``"""
+    tokens = tokenize(text or "")
+    if len(tokens) < k:
+        grams = [" ".join(tokens)] if tokens else []
+    else:
+        grams = [" ".join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)]
+    return {zlib.crc32(g.encode("utf-8")) for g in grams}
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures with a seeded hash family"""
+
+    def __init__(self, num_perm=128, seed=1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingle_set):
+        """Return a uint64 signature; empty inputs get an all-max signature"""
+        if not shingle_set:
+            return np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        x = np.fromiter(shingle_set, dtype=np.uint64, count=len(shingle_set)) % _PRIME
+        hashed = (self.a[:, None] * x[None, :] + self.b[:, None]) % _PRIME
+        return hashed.min(axis=1)
+
+
+@lru_cache(maxsize=4)
+def get_min_hasher(num_perm=DEFAULT_NUM_PERM):
+    """Return the shared hasher, so signatures stay comparable across calls"""
+    return MinHasher(num_perm)
+
+
+def band_keys(signature, bands=DEFAULT_BANDS):
+    """Return the LSH bucket key of each band of a signature"""
+    rows_per_band = len(signature) // bands
+    return [signature[band * rows_per_band:(band + 1) * rows_per_band].tobytes() for band in range(bands)]
+
+
+def signature_similarity(a, b):
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.mean(a == b))
+
+
+def find_duplicate_clusters(texts, threshold=DEFAULT_THRESHOLD, num_perm=DEFAULT_NUM_PERM, bands=DEFAULT_BANDS, k=3):
+    """Group near-duplicate texts; returns a list of index lists (singletons included)
+
+    Candidate pairs come from LSH band collisions and are confirmed when their
+    estimated Jaccard similarity (signature agreement) reaches ``threshold``.
+    """
+    hasher = get_min_hasher(num_perm)
+    shingle_sets = [shingles(t, k) for t in texts]
+    signatures = [hasher.signature(s) for s in shingle_sets]
+    keys = [band_keys(sig, bands) for sig in signatures]
+
+    parent = list(range(len(texts)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for band in range(bands):
+        buckets = defaultdict(list)
+        for i in range(len(texts)):
+            if shingle_sets[i]:
+                buckets[keys[i][band]].append(i)
+
+        for members in buckets.values():
+            head = members[0]
+            for other in members[1:]:
+                root_a, root_b = find(head), find(other)
+                if root_a == root_b:
+                    continue
+                if signature_similarity(signatures[head], signatures[other]) >= threshold:
+                    parent[root_b] = root_a
+
+    clusters = defaultdict(list)
+    for i in range(len(texts)):
+        clusters[find(i)].append(i)
+    return sorted(clusters.values(), key=lambda c: c[0])
+
+
+def job_text(job):
+    """Text used to fingerprint a job: title, company and any real description"""
+    description = job.get("Description") or ""
+    if description == PLACEHOLDER_DESCRIPTION:
+        description = ""
+    return f"{job.get('Title', '')} {job.get('Company', '')} {description}"
+
+
+def job_signature(job, num_perm=DEFAULT_NUM_PERM):
+    """Return (MinHash signature, whether the job had any text) for a scraped job dict"""
+    shingle_set = shingles(job_text(job))
+    return get_min_hasher(num_perm).signature(shingle_set), bool(shingle_set)
+
+
+def collapse_duplicates(df, threshold=DEFAULT_THRESHOLD, cluster_ids=None):
+    """Keep one row per near-duplicate cluster of a jobs DataFrame
+
+    Rows are grouped by ``cluster_ids`` (one per row, e.g. the job store's
+    recorded clusters) when given, otherwise by MinHash similarity. Adds
+    ``Duplicates`` (cluster size) and ``Locations`` (all locations the role
+    was posted in) to the representative rows.
+    """
+    if df.empty:
+        return df.assign(Duplicates=[], Locations=[])
+
+    records = df.to_dict("records")
+    if cluster_ids is None:
+        clusters = find_duplicate_clusters([job_text(job) for job in records], threshold=threshold)
+    else:
+        groups = defaultdict(list)
+        for i, cluster_id in enumerate(cluster_ids):
+            groups[cluster_id].append(i)
+        clusters = list(groups.values())
+
+    keep, sizes, locations = [], [], []
+    for cluster in clusters:
+        keep.append(cluster[0])
+        sizes.append(len(cluster))
+        seen = dict.fromkeys(str(records[i].get("Location", "")) for i in cluster if records[i].get("Location"))
+        locations.append("; ".join(seen))
+
+    collapsed = df.iloc[keep].copy()
+    collapsed["Duplicates"] = sizes
+    collapsed["Locations"] = locations
+    return collapsed.reset_index(drop=True)
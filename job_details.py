@@ -0,0 +1,216 @@
+"""
+Full job description fetching for scraped LinkedIn postings.
+
+Descriptions are fetched concurrently from LinkedIn's static guest job pages
+with a plain HTTP client; a pooled Selenium driver is only used when the HTTP
+fetch fails. Results are cached by LinkedIn job ID so a posting is never
+downloaded twice.
+"""
+
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from driver_pool import get_driver_pool
+from linkedin_scraper import PLACEHOLDER_DESCRIPTION, DomainThrottle
+
+GUEST_POSTING_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+DESCRIPTION_CLASSES = ("show-more-less-html__markup", "description__text")
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+_JOB_ID_PATTERNS = (
+    re.compile(r"currentJobId=(\d+)"),
+    re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)"),
+)
+
+# Block-level tags that should become line breaks in the plain-text description
+_BREAK_TAGS = {"br", "p", "li", "div", "ul", "ol", "h1", "h2", "h3", "h4", "tr"}
+_VOID_TAGS = {"br", "hr", "img", "input", "meta", "link", "wbr"}
+
+
+def extract_job_id(url):
+    """Return the numeric LinkedIn job ID from a job URL, or None"""
+    if not url:
+        return None
+    for pattern in _JOB_ID_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
+
+
+class _DescriptionParser(HTMLParser):
+    """Collects the text inside the first job description container"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.depth = 0
+        self.done = False
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if self.depth:
+            if tag not in _VOID_TAGS:
+                self.depth += 1
+            if tag in _BREAK_TAGS:
+                self.parts.append("\n")
+            return
+        classes = (dict(attrs).get("class") or "").split()
+        if any(c in classes for c in DESCRIPTION_CLASSES):
+            self.depth = 1
+
+    def handle_startendtag(self, tag, attrs):
+        if self.depth and tag == "br":
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if self.depth and tag not in _VOID_TAGS:
+            self.depth -= 1
+            if tag in _BREAK_TAGS:
+                self.parts.append("\n")
+            if self.depth == 0:
+                self.done = True
+
+    def handle_data(self, data):
+        if self.depth:
+            self.parts.append(data)
+
+
+def parse_description_html(html):
+    """Extract the plain-text description from a LinkedIn job page"""
+    parser = _DescriptionParser()
+    parser.feed(html)
+    text = "".join(parser.parts)
+    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in text.splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+class DescriptionCache:
+    """Thread-safe in-memory cache of descriptions keyed by job ID"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, job_id):
+        with self._lock:
+            return self._entries.get(job_id)
+
+    def put(self, job_id, description):
+        with self._lock:
+            self._entries[job_id] = description
+
+
+description_cache = DescriptionCache()
+
+
+class DescriptionFetcher:
+    """Fetches job descriptions over HTTP with a bounded worker pool"""
+
+    def __init__(self, max_workers=4, timeout=10.0, min_interval=0.5, driver_pool=None, driver_pool_factory=None,
+                 cache=description_cache):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        # The browser fallback is rare, so a factory lets the pool (and Chrome) start only when it is needed
+        self._driver_pool = driver_pool
+        self.driver_pool_factory = driver_pool_factory
+        self.cache = cache
+        self.throttle = DomainThrottle(min_interval)
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+
+    @property
+    def driver_pool(self):
+        """Pool used for the browser fallback, created by ``driver_pool_factory`` on first use"""
+        if self._driver_pool is None and self.driver_pool_factory is not None:
+            self._driver_pool = self.driver_pool_factory()
+        return self._driver_pool
+
+    @property
+    def has_driver_fallback(self):
+        """True if a browser fallback is configured, checked without creating the pool"""
+        return self._driver_pool is not None or self.driver_pool_factory is not None
+
+    def fetch_http(self, job_id):
+        """Fetch a description from the static guest posting page"""
+        url = GUEST_POSTING_URL.format(job_id=job_id)
+        self.throttle.wait(url)
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return parse_description_html(response.text)
+
+    def fetch_with_driver(self, url):
+        """Fallback: render the job page in a pooled browser and read its description"""
+        selector = ", ".join(f".{c}" for c in DESCRIPTION_CLASSES)
+        self.throttle.wait(url)
+        with self.driver_pool.driver() as driver:
+            driver.get(url)
+            element = WebDriverWait(driver, self.timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+            return driver.execute_script("return arguments[0].innerText;", element).strip()
+
+    def fetch(self, url):
+        """Return the description for one job URL, using the cache when possible"""
+        job_id = extract_job_id(url)
+        if job_id:
+            cached = self.cache.get(job_id)
+            if cached:
+                return cached
+
+        description = None
+        if job_id:
+            try:
+                description = self.fetch_http(job_id)
+            except requests.RequestException:
+                description = None
+        if not description and self.has_driver_fallback and url:
+            try:
+                description = self.fetch_with_driver(url)
+            except Exception:
+                description = None
+
+        if description and job_id:
+            self.cache.put(job_id, description)
+        return description
+
+    def enrich(self, jobs):
+        """Return copies of ``jobs`` with full descriptions filled in where possible"""
+        jobs = [dict(job) for job in jobs]
+        pending = [job for job in jobs if not job.get("Description") or job["Description"] == PLACEHOLDER_DESCRIPTION]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for job, description in zip(pending, executor.map(lambda j: self.fetch(j.get("URL")), pending)):
+                if description:
+                    job["Description"] = description
+        return jobs
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_description_fetcher():
+    """Return the process-wide fetcher, configured from the environment"""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = DescriptionFetcher(
+                max_workers=int(os.getenv("JOB_DETAIL_WORKERS", "4")),
+                min_interval=float(os.getenv("JOB_DETAIL_MIN_INTERVAL", "0.5")),
+                driver_pool_factory=get_driver_pool,
+            )
+        return _fetcher
@@ -0,0 +1,328 @@
+"""
+Semantic search over the stored job corpus.
+
+Job descriptions from the local job store are embedded once and kept in a
+float32 matrix memory-mapped from disk, so tens of thousands of postings cost
+no parsing or Python objects at startup and only the rows a query touches are
+paged in. Once the corpus is large enough, an inverted-file (IVF) index of
+k-means clusters narrows each query to the few clusters nearest the resume
+before exact cosine scoring, which keeps "top 50 jobs for this resume" in the
+milliseconds.
+
+Embeddings come from a pluggable backend (``EMBEDDING_BACKEND``): a local
+hashing vectorizer that works offline, or Gemini embeddings. Each backend
+keeps its own index directory, and a job is re-embedded only when its title
+or description changes.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+
+import numpy as np
+
+from gemini_client import DEFAULT_EMBEDDING_MODEL, get_gemini_client
+from job_store import get_job_store
+from prefilter import hashed_counts
+from token_budget import fit_job_description, fit_resume
+
+EMBEDDING_PROVIDERS = ("hashing", "gemini")
+DEFAULT_HASHING_DIM = 1024
+JOB_EMBED_BUDGET = 1500
+RESUME_EMBED_BUDGET = 1500
+
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+class HashingEmbedder:
+    """Offline embeddings: log-scaled hashed unigram/bigram counts, L2-normalized"""
+
+    def __init__(self, dim=DEFAULT_HASHING_DIM):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def embed(self, texts, query=False):
+        counts = hashed_counts(texts, self.dim)
+        np.log1p(counts, out=counts)
+        return _normalize_rows(counts)
+
+
+class GeminiEmbedder:
+    """Gemini text embeddings through the shared per-key client"""
+
+    def __init__(self, api_key, model_name=None, dim=None):
+        self.client = get_gemini_client(api_key)
+        self.model_name = model_name or os.getenv("GEMINI_EMBEDDING_MODEL", DEFAULT_EMBEDDING_MODEL)
+        self.dim = dim or int(os.getenv("EMBEDDING_DIM", "768"))
+        self.name = f"gemini-{self.model_name.rsplit('/', 1)[-1]}-{self.dim}"
+
+    def embed(self, texts, query=False):
+        vectors = self.client.embed(list(texts), self.model_name,
+                                    task_type="RETRIEVAL_QUERY" if query else "RETRIEVAL_DOCUMENT",
+                                    dimensions=self.dim)
+        return _normalize_rows(np.asarray(vectors, dtype=np.float32).reshape(len(texts), self.dim))
+
+
+def get_embedder(api_key=None, provider=None):
+    """Return the embedding backend named by ``provider`` or ``EMBEDDING_BACKEND`` (hashing or gemini)"""
+    provider = (provider or os.getenv("EMBEDDING_BACKEND", "hashing")).lower()
+    if provider == "hashing":
+        return HashingEmbedder(int(os.getenv("EMBEDDING_DIM", str(DEFAULT_HASHING_DIM))))
+    if provider == "gemini":
+        if not api_key:
+            raise ValueError("Gemini embeddings need a Google Gemini API key")
+        return GeminiEmbedder(api_key)
+    raise ValueError(f"Unknown EMBEDDING_BACKEND {provider!r}; expected one of {', '.join(EMBEDDING_PROVIDERS)}")
+
+
+def job_text(title, description):
+    """Text embedded for a job: its title and the most relevant part of its description"""
+    return f"{title or ''}\n{fit_job_description(description or '', JOB_EMBED_BUDGET)}"
+
+
+def kmeans(vectors, n_clusters, iterations=10, seed=0):
+    """Spherical k-means over unit vectors; returns unit-length centroids"""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, vectors)
+        empty = ~sums.any(axis=1)
+        # Reseed empty clusters from random points so every list stays useful
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]
+        centroids = _normalize_rows(sums)
+    return centroids
+
+
+class JobVectorIndex:
+    """Memory-mapped job embedding matrix with an optional IVF index
+
+    ``nprobe`` clusters are scanned per query; with fewer than
+    ``ivf_min_rows`` jobs every row is scored exactly, which is already
+    fast at that size.
+    """
+
+    def __init__(self, directory, embedder, nprobe=16, ivf_min_rows=5000):
+        self.embedder = embedder
+        self.nprobe = nprobe
+        self.ivf_min_rows = ivf_min_rows
+        self.directory = os.path.join(directory, re.sub(r"[^\w.-]", "_", embedder.name))
+        os.makedirs(self.directory, exist_ok=True)
+        self._vectors_path = os.path.join(self.directory, "vectors.f32")
+        self._meta_path = os.path.join(self.directory, "meta.json")
+        self._ivf_path = os.path.join(self.directory, "ivf.npz")
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._synced_fingerprint = None
+
+        self.ids, self.hashes = [], []
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("dim") == embedder.dim:
+                self.ids, self.hashes = meta["ids"], meta["hashes"]
+        self._rows = {job_id: row for row, job_id in enumerate(self.ids)}
+        self._vectors = None
+        self._open(max(len(self.ids), 1024))
+
+        self._centroids = self._assignments = None
+        self._built_rows = 0
+        if os.path.exists(self._ivf_path) and self.ids:
+            ivf = np.load(self._ivf_path)
+            if ivf["centroids"].shape[1] == embedder.dim:
+                self._centroids, self._assignments = ivf["centroids"], ivf["assignments"]
+                self._built_rows = int(ivf["built_rows"])
+                self._assignments = self._assign(self._centroids, self._assignments, len(self.ids))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _open(self, capacity):
+        """Map the vector file with room for ``capacity`` rows, growing the file if needed"""
+        size = capacity * self.embedder.dim * 4
+        with open(self._vectors_path, "ab") as f:
+            if f.tell() < size:
+                f.truncate(size)
+            else:
+                capacity = f.tell() // (self.embedder.dim * 4)
+        if self._vectors is not None:
+            self._vectors.flush()
+        self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r+",
+                                  shape=(capacity, self.embedder.dim))
+
+    def _save_meta(self):
+        self._vectors.flush()
+        tmp_path = self._meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"dim": self.embedder.dim, "ids": self.ids, "hashes": self.hashes}, f)
+        os.replace(tmp_path, self._meta_path)
+
+    def sync(self, store=None, batch_size=256, progress_callback=None, wait=True):
+        """Embed jobs in ``store`` that are new or changed; return how many were embedded
+
+        Only one sync runs at a time; with ``wait=False`` a call that finds
+        another sync in progress returns 0 at once. Embedding happens
+        outside the search lock, which is held only to swap new rows in.
+        """
+        store = store or get_job_store()
+        if not self._sync_lock.acquire(blocking=wait):
+            return 0
+        try:
+            fingerprint = store.fingerprint()
+            if fingerprint == self._synced_fingerprint:
+                return 0
+            # Only sync mutates ids, hashes and rows, so they can be read here without the search lock
+            pending = []
+            for job_id, title, description in store.iter_descriptions():
+                digest = hashlib.sha1(f"{title}\0{description}".encode("utf-8")).hexdigest()
+                row = self._rows.get(job_id)
+                if row is None or self.hashes[row] != digest:
+                    pending.append((job_id, job_text(title, description), digest))
+
+            changed_rows = []
+            try:
+                for start in range(0, len(pending), batch_size):
+                    batch = pending[start:start + batch_size]
+                    vectors = self.embedder.embed([text for _, text, _ in batch])
+                    with self._lock:
+                        for (job_id, _, digest), vector in zip(batch, vectors):
+                            row = self._rows.get(job_id)
+                            if row is None:
+                                row = len(self.ids)
+                                if row >= self._vectors.shape[0]:
+                                    self._open(self._vectors.shape[0] * 2)
+                                self.ids.append(job_id)
+                                self.hashes.append(digest)
+                                self._rows[job_id] = row
+                            else:
+                                self.hashes[row] = digest
+                            self._vectors[row] = vector
+                            changed_rows.append(row)
+                    if progress_callback:
+                        progress_callback(min(start + batch_size, len(pending)), len(pending))
+            finally:
+                # Written once per sync (and after a failed batch, so finished batches are kept)
+                if changed_rows:
+                    self._save_meta()
+
+            if changed_rows:
+                self._update_ivf(changed_rows)
+            self._synced_fingerprint = fingerprint
+            return len(pending)
+        finally:
+            self._sync_lock.release()
+
+    def _update_ivf(self, changed_rows):
+        """Rebuild or extend the IVF index, holding the search lock only to swap it in"""
+        count = len(self.ids)
+        if count < self.ivf_min_rows:
+            return
+        if self._centroids is None or count >= 1.5 * self._built_rows:
+            # Rebuild as the corpus grows so clusters stay balanced
+            matrix = self._vectors[:count]
+            n_clusters = max(1, int(math.sqrt(count)))
+            sample = np.random.default_rng(0).choice(count, min(count, n_clusters * 40), replace=False)
+            centroids = kmeans(np.asarray(matrix[np.sort(sample)]), n_clusters)
+            assignments = self._assign(centroids, np.empty(0, dtype=np.int32), count)
+            built_rows = count
+        else:
+            centroids, built_rows = self._centroids, self._built_rows
+            assignments = self._assign(centroids, self._assignments, count)
+            rows = np.asarray(changed_rows)
+            rows = rows[rows < len(self._assignments)]
+            if len(rows):
+                assignments[rows] = np.argmax(self._vectors[rows] @ centroids.T, axis=1)
+        with self._lock:
+            self._centroids, self._assignments, self._built_rows = centroids, assignments, built_rows
+        np.savez(self._ivf_path, centroids=centroids, assignments=assignments, built_rows=built_rows)
+
+    def _assign(self, centroids, assignments, count):
+        """Return a copy of ``assignments`` extended to ``count`` rows with each new row's nearest centroid"""
+        parts = [assignments]
+        for start in range(len(assignments), count, 8192):
+            stop = min(start + 8192, count)
+            parts.append(np.argmax(self._vectors[start:stop] @ centroids.T, axis=1).astype(np.int32))
+        return np.concatenate(parts)
+
+    def search(self, vector, k=50):
+        """Return [(job_id, cosine similarity)] for the ``k`` jobs nearest ``vector``"""
+        with self._lock:
+            count = len(self.ids)
+            if not count:
+                return []
+            vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+            if self._centroids is not None and len(self._assignments) == count:
+                nearest = np.argsort(-(self._centroids @ vector))[:self.nprobe]
+                rows = np.flatnonzero(np.isin(self._assignments, nearest))
+                scores = self._vectors[rows] @ vector
+            else:
+                rows = np.arange(count)
+                scores = self._vectors[:count] @ vector
+            k = min(k, len(rows))
+            if k <= 0:
+                return []
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [(self.ids[rows[i]], float(scores[i])) for i in top]
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_job_index(api_key=None, provider=None):
+    """Return the process-wide index for the configured embedding backend"""
+    embedder = get_embedder(api_key, provider)
+    with _indexes_lock:
+        index = _indexes.get(embedder.name)
+        if index is None:
+            index = JobVectorIndex(
+                os.getenv("JOB_INDEX_PATH", os.path.join(".cache", "job_index")),
+                embedder,
+                nprobe=int(os.getenv("JOB_INDEX_NPROBE", "16")),
+                ivf_min_rows=int(os.getenv("JOB_INDEX_IVF_MIN_ROWS", "5000")),
+            )
+            _indexes[embedder.name] = index
+        return index
+
+
+def sync_job_index(api_key=None, provider=None, progress_callback=None):
+    """Embed stored jobs that are new or changed since the last sync; return how many were embedded"""
+    return get_job_index(api_key, provider).sync(get_job_store(), progress_callback=progress_callback)
+
+
+def top_jobs_for_resume(resume_text, k=50, api_key=None, provider=None):
+    """Return the ``k`` indexed jobs most similar to a resume as a DataFrame with a ``similarity`` column
+
+    Jobs stored since the last sync are embedded first; that check is a
+    single fingerprint query when nothing changed, and is skipped while
+    another sync is running. Each near-duplicate cluster is represented by
+    its best-matching posting.
+    """
+    index = get_job_index(api_key, provider)
+    store = get_job_store()
+    index.sync(store, wait=False)
+    query = index.embedder.embed([fit_resume(resume_text, "job_match", RESUME_EMBED_BUDGET)], query=True)[0]
+    fetch = k
+    while True:
+        hits = index.search(query, fetch)
+        clusters = store.cluster_ids([job_id for job_id, _ in hits])
+        best = {}
+        for job_id, score in hits:
+            best.setdefault(clusters.get(job_id, job_id), (job_id, score))
+        # Duplicates took some of the slots; widen the search until k clusters are found
+        if len(best) >= k or len(hits) < fetch:
+            break
+        fetch *= 2
+    hits = list(best.values())[:k]
+    jobs = store.get_jobs([job_id for job_id, _ in hits])
+    jobs["similarity"] = jobs["job_id"].map(dict(hits)).round(4)
+    return jobs
@@ -0,0 +1,293 @@
+"""
+Local SQLite store for scraped LinkedIn jobs.
+
+Repeat scrapes upsert into the store, so postings seen before only get their
+``last_seen`` timestamp refreshed and their stored description reused instead
+of being fetched again. The store also gives the matching tabs a corpus of
+job descriptions that works without network access.
+
+Each posting's MinHash signature and LSH band buckets are stored alongside
+it, so a new or edited posting is linked to its near-duplicate cluster on
+upsert (``duplicate_of`` names the cluster's representative) and searches
+return one job per cluster.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from job_dedupe import DEFAULT_THRESHOLD, band_keys, job_signature, signature_similarity
+from job_details import extract_job_id
+from linkedin_scraper import PLACEHOLDER_DESCRIPTION, normalize_job_url
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    url TEXT,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    description TEXT,
+    query TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    signature BLOB,
+    duplicate_of TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS idx_jobs_title ON jobs (title);
+CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs (first_seen);
+CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen);
+CREATE TABLE IF NOT EXISTS job_bands (
+    band INTEGER NOT NULL,
+    bucket BLOB NOT NULL,
+    job_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_job_bands_bucket ON job_bands (band, bucket);
+CREATE INDEX IF NOT EXISTS idx_job_bands_job ON job_bands (job_id);
+"""
+
+# Columns added after the first release; older stores get them on open
+CLUSTER_COLUMNS = {"signature": "BLOB", "duplicate_of": "TEXT"}
+
+COLUMNS = ["job_id", "url", "title", "company", "location", "description", "query", "first_seen", "last_seen"]
+
+
+def job_key(url):
+    """Stable store key: the LinkedIn job ID, or a hash of the normalized URL"""
+    job_id = extract_job_id(url)
+    if job_id:
+        return job_id
+    return "url:" + hashlib.sha1((normalize_job_url(url) or "").encode("utf-8")).hexdigest()
+
+
+def _real_description(description):
+    if description and description != PLACEHOLDER_DESCRIPTION:
+        return description
+    return None
+
+
+class JobStore:
+    """SQLite-backed job corpus with incremental upserts"""
+
+    def __init__(self, db_path, duplicate_threshold=DEFAULT_THRESHOLD):
+        self.db_path = db_path
+        self.duplicate_threshold = duplicate_threshold
+        self._lock = threading.Lock()
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        with self._lock, self._connect() as conn:
+            conn.executescript(SCHEMA)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, kind in CLUSTER_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_duplicate_of ON jobs (duplicate_of)")
+            # Cluster jobs saved before clusters were recorded, oldest first
+            unclustered = conn.execute(
+                "SELECT job_id, title, company, description FROM jobs WHERE signature IS NULL ORDER BY rowid"
+            ).fetchall()
+            for job_id, title, company, description in unclustered:
+                self._assign_cluster(conn, job_id, title, company, description)
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def upsert_jobs(self, jobs, query=None):
+        """Insert new postings and refresh existing ones; return the keys of new postings
+
+        A job's own ``Query`` (set by batch scrapes) is recorded in preference
+        to ``query``.
+        """
+        now = time.time()
+        new_keys = []
+        with self._lock, self._connect() as conn:
+            for job in jobs:
+                key = job_key(job.get("URL"))
+                description = _real_description(job.get("Description"))
+                stored = conn.execute(
+                    "SELECT title, company, description FROM jobs WHERE job_id = ?", (key,)
+                ).fetchone()
+                if stored:
+                    conn.execute(
+                        "UPDATE jobs SET title = ?, company = ?, location = ?, last_seen = ?, "
+                        "description = COALESCE(?, description) WHERE job_id = ?",
+                        (job.get("Title"), job.get("Company"), job.get("Location"), now, description, key),
+                    )
+                    description = description or stored[2]
+                    if (job.get("Title"), job.get("Company"), description) == tuple(stored):
+                        continue
+                else:
+                    conn.execute(
+                        "INSERT INTO jobs (job_id, url, title, company, location, description, query, "
+                        "first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (key, normalize_job_url(job.get("URL")), job.get("Title"), job.get("Company"),
+                         job.get("Location"), description, job.get("Query") or query, now, now),
+                    )
+                    new_keys.append(key)
+                self._assign_cluster(conn, key, job.get("Title"), job.get("Company"), description)
+        return new_keys
+
+    def _assign_cluster(self, conn, key, title, company, description):
+        """Store a job's signature and band buckets and link it to its closest near-duplicate's cluster"""
+        signature, has_text = job_signature({"Title": title, "Company": company, "Description": description})
+        buckets = list(enumerate(band_keys(signature))) if has_text else []
+        conn.execute("DELETE FROM job_bands WHERE job_id = ?", (key,))
+
+        candidates = set()
+        for band, bucket in buckets:
+            candidates.update(row[0] for row in conn.execute(
+                "SELECT job_id FROM job_bands WHERE band = ? AND bucket = ?", (band, bucket)))
+        candidates.discard(key)
+
+        representative, best = None, self.duplicate_threshold
+        candidates = sorted(candidates)
+        for start in range(0, len(candidates), 500):
+            chunk = candidates[start:start + 500]
+            rows = conn.execute(
+                f"SELECT job_id, signature, duplicate_of FROM jobs WHERE job_id IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            for other, other_signature, other_cluster in rows:
+                cluster = other_cluster or other
+                if cluster == key:
+                    continue
+                similarity = signature_similarity(signature, np.frombuffer(other_signature, dtype=np.uint64))
+                if similarity >= best:
+                    representative, best = cluster, similarity
+
+        conn.executemany("INSERT INTO job_bands (band, bucket, job_id) VALUES (?, ?, ?)",
+                         [(band, bucket, key) for band, bucket in buckets])
+        conn.execute("UPDATE jobs SET signature = ?, duplicate_of = ? WHERE job_id = ?",
+                     (signature.tobytes(), representative, key))
+        if representative:
+            # A representative that joins another cluster takes its members along
+            conn.execute("UPDATE jobs SET duplicate_of = ? WHERE duplicate_of = ?", (representative, key))
+
+    def get(self, job_id):
+        """Return the stored description for a job key, or None"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT description FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def fill_descriptions(self, jobs):
+        """Return copies of ``jobs`` with stored descriptions substituted for placeholders"""
+        filled = []
+        for job in jobs:
+            job = dict(job)
+            if not _real_description(job.get("Description")):
+                stored = self.get(job_key(job.get("URL")))
+                if stored:
+                    job["Description"] = stored
+            filled.append(job)
+        return filled
+
+    def search(self, text=None, company=None, with_description=False, limit=500, include_duplicates=False):
+        """Return stored jobs as a DataFrame, most recently seen first
+
+        Unless ``include_duplicates`` is set, each near-duplicate cluster
+        contributes one matching job: its representative when that matches.
+        """
+        clauses, params = [], []
+        if text:
+            clauses.append("(title LIKE ? OR description LIKE ?)")
+            params += [f"%{text}%", f"%{text}%"]
+        if company:
+            clauses.append("company = ?")
+            params.append(company)
+        if with_description:
+            clauses.append("description IS NOT NULL")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        columns = ", ".join(COLUMNS)
+        if include_duplicates:
+            sql = f"SELECT {columns} FROM jobs {where} ORDER BY last_seen DESC LIMIT ?"
+        else:
+            sql = (
+                f"SELECT {columns} FROM (SELECT {columns}, ROW_NUMBER() OVER ("
+                "PARTITION BY COALESCE(duplicate_of, job_id) ORDER BY duplicate_of IS NOT NULL, last_seen DESC"
+                f") AS pick FROM jobs {where}) WHERE pick = 1 ORDER BY last_seen DESC LIMIT ?"
+            )
+        with self._connect() as conn:
+            rows = conn.execute(sql, (*params, limit)).fetchall()
+        return pd.DataFrame(rows, columns=COLUMNS)
+
+    def iter_descriptions(self, batch_size=1000):
+        """Yield (job_id, title, description) for every job with a description, in insertion order"""
+        last_rowid = 0
+        while True:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT rowid, job_id, title, description FROM jobs "
+                    "WHERE description IS NOT NULL AND rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for rowid, job_id, title, description in rows:
+                yield job_id, title, description
+            last_rowid = rows[-1][0]
+
+    def get_jobs(self, job_ids):
+        """Return the stored jobs for ``job_ids`` as a DataFrame in the given order"""
+        frames = []
+        with self._connect() as conn:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(job_ids), 500):
+                chunk = list(job_ids[start:start + 500])
+                rows = conn.execute(
+                    f"SELECT {', '.join(COLUMNS)} FROM jobs WHERE job_id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                frames.append(pd.DataFrame(rows, columns=COLUMNS))
+        if not frames:
+            return pd.DataFrame(columns=COLUMNS)
+        df = pd.concat(frames, ignore_index=True).set_index("job_id", drop=False)
+        return df.reindex([job_id for job_id in job_ids if job_id in df.index]).reset_index(drop=True)
+
+    def cluster_ids(self, job_ids):
+        """Return {job_id: id of its cluster's representative} for the stored ``job_ids``"""
+        clusters = {}
+        with self._connect() as conn:
+            for start in range(0, len(job_ids), 500):
+                chunk = list(job_ids[start:start + 500])
+                clusters.update(conn.execute(
+                    f"SELECT job_id, COALESCE(duplicate_of, job_id) FROM jobs "
+                    f"WHERE job_id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall())
+        return clusters
+
+    def fingerprint(self):
+        """Return a value that changes whenever a job is added or updated"""
+        with self._connect() as conn:
+            return tuple(conn.execute("SELECT COUNT(*), COUNT(description), MAX(last_seen) FROM jobs").fetchone())
+
+    def count(self):
+        """Return (total jobs, jobs with a description)"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*), COUNT(description) FROM jobs"
+            ).fetchone()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_job_store():
+    """Return the process-wide job store, configured from the environment"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = JobStore(
+                os.getenv("JOB_STORE_PATH", os.path.join(".cache", "jobs.sqlite3")),
+                duplicate_threshold=float(os.getenv("JOB_DUPLICATE_THRESHOLD", str(DEFAULT_THRESHOLD))),
+            )
+        return _store
@@ -0,0 +1,290 @@
+"""
+LinkedIn job search scraping on top of a Selenium WebDriver.
+
+Functions here take an already running driver (normally checked out of
+``driver_pool``) and return plain dicts, so they can be used from the
+Streamlit apps and from headless tools alike.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+
+import pandas as pd
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+JOB_CARD_SELECTOR = ".job-search-card"
+DEFAULT_PAGE_TIMEOUT = 10.0
+
+
+class ReadinessStats:
+    """Histogram of how long search pages take until job cards are present"""
+
+    BUCKETS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, float("inf"))
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counts = [0] * len(self.BUCKETS)
+            self.timeouts = 0
+            self.total = 0.0
+            self.samples = 0
+
+    def record(self, seconds, timed_out=False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.samples += 1
+            self.total += seconds
+            for i, upper in enumerate(self.BUCKETS):
+                if seconds <= upper:
+                    self.counts[i] += 1
+                    break
+
+    def histogram(self):
+        """Return {bucket label: count}, e.g. {"≤0.5s": 3, ...}"""
+        with self._lock:
+            labels = [f"≤{b:g}s" if b != float("inf") else f">{self.BUCKETS[-2]:g}s" for b in self.BUCKETS]
+            return dict(zip(labels, self.counts))
+
+    def summary(self):
+        with self._lock:
+            mean = self.total / self.samples if self.samples else 0.0
+            return {"pages": self.samples, "timeouts": self.timeouts, "mean_seconds": mean}
+
+
+readiness_stats = ReadinessStats()
+
+
+def wait_for_job_cards(driver, timeout=DEFAULT_PAGE_TIMEOUT, stats=readiness_stats):
+    """Block until job cards are rendered (or ``timeout`` expires) and record the latency
+
+    Returns True when cards appeared, False on timeout.
+    """
+    start = time.monotonic()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, JOB_CARD_SELECTOR))
+        )
+    except TimeoutException:
+        stats.record(time.monotonic() - start, timed_out=True)
+        return False
+    stats.record(time.monotonic() - start)
+    return True
+
+
+class DomainThrottle:
+    """Enforces a minimum interval between page loads on the same domain"""
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        domain = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(domain, 0.0))
+            self._next_slot[domain] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def build_search_url(job_title, location=""):
+    """Construct the LinkedIn job search URL for a title/location pair"""
+    base_url = "https://www.linkedin.com/jobs/search"
+    search_url = f"{base_url}?keywords={job_title.replace(' ', '%20')}"
+    if location:
+        search_url += f"&location={location.replace(' ', '%20')}"
+    return search_url
+
+
+def normalize_job_url(url):
+    """Strip tracking query strings so the same posting always has one URL"""
+    if not url:
+        return url
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/"), "", ""))
+
+
+PLACEHOLDER_DESCRIPTION = "Click the URL to view full job description"
+SHOW_MORE_SELECTOR = "button.infinite-scroller__show-more-button"
+
+
+def extract_card(card):
+    """Return the job fields of one search result card, or None if it is incomplete"""
+    try:
+        # Extract job details
+        title_element = card.find_element(By.CSS_SELECTOR, ".base-search-card__title")
+        company_element = card.find_element(By.CSS_SELECTOR, ".base-search-card__subtitle")
+        location_element = card.find_element(By.CSS_SELECTOR, ".job-search-card__location")
+        link_element = card.find_element(By.CSS_SELECTOR, "a")
+
+        return {
+            "Title": title_element.text.strip(),
+            "Company": company_element.text.strip(),
+            "Location": location_element.text.strip(),
+            "URL": link_element.get_attribute("href"),
+            # Get job description (simplified)
+            "Description": PLACEHOLDER_DESCRIPTION,
+        }
+    except Exception:
+        return None
+
+
+# Reads every field of cards[start:stop] in a single WebDriver round trip
+BULK_EXTRACT_JS = """
+const cards = Array.from(document.querySelectorAll(arguments[0]));
+const stop = arguments[2] === null ? undefined : arguments[2];
+return cards.slice(arguments[1], stop).map(card => {
+    const title = card.querySelector('.base-search-card__title');
+    const company = card.querySelector('.base-search-card__subtitle');
+    const location = card.querySelector('.job-search-card__location');
+    const link = card.querySelector('a');
+    if (!title || !company || !location || !link) {
+        return null;
+    }
+    return {
+        Title: title.innerText.trim(),
+        Company: company.innerText.trim(),
+        Location: location.innerText.trim(),
+        URL: link.href
+    };
+});
+"""
+
+
+def extract_cards(driver, start=0, stop=None):
+    """Extract cards[start:stop] from the current page with one execute_script call
+
+    Returns a list aligned with the cards (None for incomplete ones). Falls back
+    to per-element WebDriver lookups if the script fails.
+    """
+    try:
+        result = driver.execute_script(BULK_EXTRACT_JS, JOB_CARD_SELECTOR, start, stop)
+        if isinstance(result, list):
+            return [dict(job, Description=PLACEHOLDER_DESCRIPTION) if job else None for job in result]
+    except WebDriverException:
+        pass
+
+    job_cards = driver.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR)
+    return [extract_card(card) for card in job_cards[start:stop]]
+
+
+def scrape_search_page(driver, job_title, location, num_jobs, throttle=None, timeout=DEFAULT_PAGE_TIMEOUT):
+    """Load a LinkedIn search page in ``driver`` and extract its job cards"""
+    search_url = build_search_url(job_title, location)
+    if throttle:
+        throttle.wait(search_url)
+
+    driver.get(search_url)
+    if not wait_for_job_cards(driver, timeout):
+        return []
+
+    # Find job listings
+    return [job for job in extract_cards(driver, 0, num_jobs) if job]
+
+
+def _load_more_cards(driver, card_count, timeout):
+    """Scroll (and press "See more jobs") until more than ``card_count`` cards exist
+
+    Returns False when no new cards appear within ``timeout``.
+    """
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    try:
+        button = driver.find_element(By.CSS_SELECTOR, SHOW_MORE_SELECTOR)
+        if button.is_displayed():
+            button.click()
+    except Exception:
+        pass
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+            lambda d: len(d.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR)) > card_count
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def iter_search_pages(driver, job_title, location, num_jobs, throttle=None,
+                      timeout=DEFAULT_PAGE_TIMEOUT, scroll_timeout=5.0):
+    """Yield lists of new job dicts from a search, one list per page of results loaded
+
+    Only the cards added since the previous scroll are read. Stops after
+    ``num_jobs`` unique postings or when scrolling stops producing new cards.
+    """
+    search_url = build_search_url(job_title, location)
+    if throttle:
+        throttle.wait(search_url)
+
+    driver.get(search_url)
+    if not wait_for_job_cards(driver, timeout):
+        return
+
+    seen_urls = set()
+    processed = 0
+    while True:
+        new_jobs = extract_cards(driver, processed)
+        page = []
+        for job in new_jobs:
+            if not job:
+                continue
+            url = normalize_job_url(job["URL"])
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            page.append(job)
+            if len(seen_urls) >= num_jobs:
+                break
+        if page:
+            yield page
+        if len(seen_urls) >= num_jobs:
+            return
+        processed += len(new_jobs)
+
+        if not _load_more_cards(driver, processed, scroll_timeout):
+            return
+
+
+def scrape_many(queries, num_jobs, pool, max_workers=None, min_interval=1.0, timeout=DEFAULT_PAGE_TIMEOUT):
+    """Scrape several (job_title, location) queries concurrently on pooled drivers
+
+    Results are merged in query order into one DataFrame, deduplicated by
+    normalized job URL, with a ``Query`` column recording the first query
+    (in the order given) that found each job, so the output does not depend
+    on which search finished first. Returns (DataFrame, {query: error
+    message}) for any failed searches.
+    """
+    throttle = DomainThrottle(min_interval)
+    rows = []
+    errors = {}
+
+    def run_query(job_title, location):
+        with pool.driver() as driver:
+            return scrape_search_page(driver, job_title, location, num_jobs, throttle=throttle, timeout=timeout)
+
+    with ThreadPoolExecutor(max_workers=max_workers or pool.size) as executor:
+        futures = [(executor.submit(run_query, title, loc), title, loc) for title, loc in queries]
+        for future, title, loc in futures:
+            label = f"{title} @ {loc}" if loc else title
+            try:
+                for job in future.result():
+                    rows.append({**job, "Query": label})
+            except Exception as e:
+                errors[label] = str(e)
+
+    df = pd.DataFrame(rows, columns=["Title", "Company", "Location", "URL", "Description", "Query"])
+    if not df.empty:
+        df["URL"] = df["URL"].map(normalize_job_url)
+        df = df.drop_duplicates(subset="URL").reset_index(drop=True)
+    return df, errors
@@ -0,0 +1,244 @@
+"""
+Pluggable LLM backends behind one small interface.
+
+Every backend turns a prompt into text through ``generate`` (full text),
+``stream`` (text chunks as they arrive) and ``batch`` (many prompts run
+concurrently), and exposes a ``name`` used in response cache keys. Gemini is
+the default; an OpenAI-compatible backend covers OpenAI and any server that
+speaks its chat completions API, and a deterministic fake backend answers
+offline for load tests and UI work. ``LLM_BACKEND`` selects the provider.
+
+``generation_config`` uses Gemini's keys (``temperature``,
+``max_output_tokens``, ``response_mime_type``, ``response_schema``); other
+backends translate what they support.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Protocol
+
+from gemini_client import get_gemini_client
+from llm_limits import RequestLimiter, call_with_retry, limits_from_env
+from token_budget import count_tokens
+
+PROVIDERS = ("gemini", "openai", "fake")
+DEFAULT_OPENAI_MODEL = "gpt-4o-mini"
+
+
+class LLMBackend(Protocol):
+    """Interface shared by all LLM backends"""
+
+    name: str
+
+    def generate(self, prompt: str, generation_config: dict = None) -> str:
+        ...
+
+    def stream(self, prompt: str, generation_config: dict = None) -> Iterator[str]:
+        ...
+
+    def batch(self, prompts: List[str], generation_config: dict = None, max_workers: int = 4) -> List[str]:
+        ...
+
+
+class BaseBackend:
+    """Default ``stream`` and ``batch`` for subclasses that implement ``generate``"""
+
+    name = "base"
+
+    def stream(self, prompt, generation_config=None):
+        yield self.generate(prompt, generation_config)
+
+    def batch(self, prompts, generation_config=None, max_workers=4):
+        """Return responses in prompt order; a failed prompt yields None"""
+        def run(prompt):
+            try:
+                return self.generate(prompt, generation_config)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(run, prompts))
+
+    def set_rate_limits(self, requests_per_minute=0, tokens_per_minute=0):
+        """Replace this backend's quota (0 disables a limit)"""
+        self.limiter = RequestLimiter(requests_per_minute, tokens_per_minute)
+
+
+class GeminiBackend(BaseBackend):
+    """Google Gemini through the shared per-key client"""
+
+    def __init__(self, api_key, model_name=None, system_prompt=None, default_config=None):
+        self.client = get_gemini_client(api_key)
+        self.model_name = model_name or self.client.model_name
+        # Plain model names keep cache entries from before backends existed valid
+        self.name = self.model_name
+        self.system_prompt = system_prompt
+        self.default_config = default_config or {}
+
+    def _prepare(self, prompt, generation_config):
+        if self.system_prompt:
+            prompt = f"{self.system_prompt}\n\n{prompt}"
+        return prompt, {**self.default_config, **(generation_config or {})}
+
+    def generate(self, prompt, generation_config=None):
+        prompt, config = self._prepare(prompt, generation_config)
+        return self.client.generate(prompt, config, model_name=self.model_name)
+
+    def stream(self, prompt, generation_config=None):
+        prompt, config = self._prepare(prompt, generation_config)
+        return self.client.stream(prompt, config, model_name=self.model_name)
+
+    def set_rate_limits(self, requests_per_minute=0, tokens_per_minute=0):
+        self.client.set_rate_limits(requests_per_minute, tokens_per_minute)
+
+
+class OpenAIBackend(BaseBackend):
+    """OpenAI or any OpenAI-compatible chat completions server (``OPENAI_BASE_URL``)"""
+
+    def __init__(self, api_key, model_name=None, base_url=None, system_prompt=None, default_config=None):
+        # Optional dependency: only needed when this backend is selected
+        import openai
+
+        self.model_name = model_name or os.getenv("OPENAI_MODEL", DEFAULT_OPENAI_MODEL)
+        self.name = f"openai:{self.model_name}"
+        self.system_prompt = system_prompt
+        self.default_config = default_config or {}
+        self.client = openai.OpenAI(api_key=api_key, base_url=base_url or os.getenv("OPENAI_BASE_URL") or None,
+                                    timeout=float(os.getenv("OPENAI_TIMEOUT", "120")))
+        self.limiter, self.breaker, self.retry = limits_from_env("OPENAI", "OpenAI")
+
+    def _request(self, prompt, generation_config):
+        config = {**self.default_config, **(generation_config or {})}
+        messages = [{"role": "user", "content": prompt}]
+        if self.system_prompt:
+            messages.insert(0, {"role": "system", "content": self.system_prompt})
+        request = {"model": self.model_name, "messages": messages}
+        if "temperature" in config:
+            request["temperature"] = config["temperature"]
+        if "max_output_tokens" in config:
+            request["max_tokens"] = config["max_output_tokens"]
+        if config.get("response_mime_type") == "application/json":
+            # The schema itself is enforced by the caller's validator
+            request["response_format"] = {"type": "json_object"}
+        return request
+
+    def generate(self, prompt, generation_config=None):
+        request = self._request(prompt, generation_config)
+
+        def call():
+            self.limiter.acquire(count_tokens(prompt))
+            response = self.client.chat.completions.create(**request)
+            text = response.choices[0].message.content or ""
+            self.limiter.record_usage(count_tokens(text))
+            return text
+
+        return call_with_retry(call, self.breaker, **self.retry)
+
+    def stream(self, prompt, generation_config=None):
+        request = self._request(prompt, generation_config)
+
+        def open_stream():
+            self.limiter.acquire(count_tokens(prompt))
+            return self.client.chat.completions.create(stream=True, **request)
+
+        output_tokens = 0
+        try:
+            for chunk in call_with_retry(open_stream, self.breaker, **self.retry):
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    output_tokens += count_tokens(text)
+                    yield text
+        finally:
+            self.limiter.record_usage(output_tokens)
+
+
+class FakeBackend(BaseBackend):
+    """Deterministic offline backend: the same prompt always gets the same answer
+
+    Structured requests get JSON that satisfies the requested schema, so every
+    tab works without a network. ``latency`` (or ``FAKE_LLM_LATENCY``) adds a
+    per-call delay to imitate a real model under load tests.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency=None, system_prompt=None, default_config=None):
+        # system_prompt and default_config are accepted so callers can switch providers freely
+        self.latency = float(os.getenv("FAKE_LLM_LATENCY", "0")) if latency is None else latency
+        self.limiter = RequestLimiter()
+
+    @staticmethod
+    def _seed(prompt):
+        return hashlib.sha256(prompt.encode("utf-8")).digest()
+
+    def _fake_value(self, schema, seed, path):
+        digest = hashlib.sha256(seed + path.encode("utf-8")).digest()
+        kind = schema["type"]
+        if kind == "object":
+            return {name: self._fake_value(field, seed, f"{path}.{name}") for name, field in schema["properties"].items()}
+        if kind == "array":
+            return [self._fake_value(schema["items"], seed, f"{path}[{i}]") for i in range(1 + digest[0] % 3)]
+        if kind in ("number", "integer"):
+            return 40 + digest[0] % 56
+        return f"Sample {path.rsplit('.', 1)[-1].strip('[]0123456789_').replace('_', ' ') or 'item'} {digest.hex()[:6]}"
+
+    def generate(self, prompt, generation_config=None):
+        self.limiter.acquire(count_tokens(prompt))
+        if self.latency:
+            time.sleep(self.latency)
+        seed = self._seed(prompt)
+        schema = (generation_config or {}).get("response_schema")
+        if schema:
+            return json.dumps(self._fake_value(schema, seed, "$"))
+        if (generation_config or {}).get("response_mime_type") == "application/json":
+            # Without a schema there is no shape to imitate; an empty object parses everywhere
+            return "{}"
+        return (
+            f"**Offline response {seed.hex()[:8]}**\n\n"
+            f"This deterministic answer was generated locally for a {count_tokens(prompt)}-token prompt. "
+            "Select a real backend with LLM_BACKEND to get model output."
+        )
+
+    def stream(self, prompt, generation_config=None):
+        text = self.generate(prompt, generation_config)
+        for i, word in enumerate(text.split(" ")):
+            yield word if i == 0 else " " + word
+
+
+def default_provider():
+    """Provider named by ``LLM_BACKEND`` (gemini, openai or fake)"""
+    provider = os.getenv("LLM_BACKEND", "gemini").lower()
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unknown LLM_BACKEND {provider!r}; expected one of {', '.join(PROVIDERS)}")
+    return provider
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend(api_key=None, provider=None, model_name=None, **options):
+    """Return a process-wide backend for (provider, key, model), creating it on first use
+
+    Extra ``options`` (``system_prompt``, ``default_config``) only apply when
+    the backend is first created.
+    """
+    provider = provider or default_provider()
+    cache_key = (provider, api_key, model_name)
+    with _backends_lock:
+        backend = _backends.get(cache_key)
+        if backend is None:
+            if provider == "gemini":
+                backend = GeminiBackend(api_key, model_name, **options)
+            elif provider == "openai":
+                backend = OpenAIBackend(api_key, model_name, **options)
+            elif provider == "fake":
+                backend = FakeBackend(**options)
+            else:
+                raise ValueError(f"Unknown LLM provider {provider!r}")
+            _backends[cache_key] = backend
+        return backend
@@ -0,0 +1,199 @@
+"""
+Response cache for LLM analyses.
+
+Entries are keyed on the model name, the analysis prompt template and its
+version, and a hash of the inputs, so identical requests (repeated clicks,
+several users pasting the same job description) are answered without calling
+the API. Entries expire after a TTL and both tiers are size bounded.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """In-memory LRU with TTL, backed by an optional SQLite store on disk"""
+
+    def __init__(self, max_entries=256, ttl_seconds=7 * 24 * 3600, db_path=None, max_disk_entries=5000):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.db_path:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                    "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+                )
+
+    @staticmethod
+    def make_key(model_name, template, version, inputs):
+        """Build a cache key from the model, prompt template version and inputs"""
+        payload = json.dumps(
+            {"model": model_name, "template": template, "version": version, "inputs": inputs},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _expired(self, created_at, now):
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _remember(self, key, value, created_at):
+        self._entries[key] = (value, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        """Return a cached response, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, created_at = entry
+                if not self._expired(created_at, now):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+            if self.db_path:
+                with self._connect() as conn:
+                    row = conn.execute(
+                        "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row and not self._expired(row[1], now):
+                        conn.execute(
+                            "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                        )
+                        value = zlib.decompress(row[0]).decode("utf-8")
+                        self._remember(key, value, row[1])
+                        self.hits += 1
+                        return value
+                    if row:
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """Store a response and evict the least recently used overflow"""
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            if self.db_path:
+                blob = zlib.compress(value.encode("utf-8"))
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, blob, now, now),
+                    )
+                    conn.execute(
+                        "DELETE FROM responses WHERE key IN ("
+                        "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                        (self.max_disk_entries,),
+                    )
+
+    def clear(self):
+        """Drop every cached response and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            if self.db_path:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM responses")
+
+    def stats(self):
+        """Return hit/miss counters and the current in-memory size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """Return the process-wide response cache, configured from the environment"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(
+                max_entries=int(os.getenv("LLM_CACHE_SIZE", "256")),
+                ttl_seconds=int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600))),
+                db_path=os.getenv("LLM_CACHE_PATH") or None,
+                max_disk_entries=int(os.getenv("LLM_CACHE_DISK_SIZE", "5000")),
+            )
+        return _cache
+
+
+def cached_generate(generate, model_name, template, version, inputs, bypass=False):
+    """Return a cached response or call ``generate()`` and cache its result
+
+    ``bypass`` skips the lookup but still stores the fresh response.
+    """
+    cache = get_response_cache()
+    key = cache.make_key(model_name, template, version, inputs)
+    if not bypass:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    value = generate()
+    if value:
+        cache.put(key, value)
+    return value
+
+
+def cached_stream(stream_generate, model_name, template, version, inputs, bypass=False):
+    """Yield a cached response as one chunk, or stream ``stream_generate()`` and cache the result
+
+    The joined text is only stored once the stream has been fully consumed,
+    so an interrupted stream never leaves a truncated cache entry.
+    """
+    cache = get_response_cache()
+    key = cache.make_key(model_name, template, version, inputs)
+    if not bypass:
+        cached = cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+    parts = []
+    for chunk in stream_generate():
+        if chunk:
+            parts.append(chunk)
+            yield chunk
+
+    value = "".join(parts)
+    if value:
+        cache.put(key, value)
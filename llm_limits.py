@@ -0,0 +1,198 @@
+"""
+Client-side rate limiting, retries and circuit breaking for LLM calls.
+
+Every request first takes a slot from a requests-per-minute bucket and an
+estimate of its tokens from a tokens-per-minute bucket, so concurrent
+sessions sharing an API key queue up at the quota ceiling instead of all
+hitting 429s together. Quota and server errors are retried with jittered
+exponential backoff, and a circuit breaker fails fast while the backend is
+persistently unhealthy rather than piling more retries onto it.
+"""
+
+import os
+import random
+import threading
+import time
+
+try:
+    from google.api_core import exceptions as google_exceptions
+except ImportError:
+    google_exceptions = None
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate_per_minute``"""
+
+    def __init__(self, rate_per_minute, capacity=None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, amount=1):
+        """Block until ``amount`` tokens are available, then take them"""
+        # A request larger than the bucket would otherwise wait forever
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def debit(self, amount):
+        """Take ``amount`` tokens without waiting; the balance may go negative"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= amount
+
+
+class RequestLimiter:
+    """Requests-per-minute and tokens-per-minute budgets; a limit of 0 disables it"""
+
+    def __init__(self, requests_per_minute=0, tokens_per_minute=0):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+
+    def acquire(self, estimated_tokens=0):
+        if self.requests:
+            self.requests.acquire(1)
+        if self.tokens and estimated_tokens:
+            self.tokens.acquire(estimated_tokens)
+
+    def record_usage(self, extra_tokens):
+        """Charge tokens only known after the call (e.g. the generated output)"""
+        if self.tokens and extra_tokens > 0:
+            self.tokens.debit(extra_tokens)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a backend whose circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures, then allows one trial call per cooldown"""
+
+    def __init__(self, failure_threshold=5, cooldown=30.0, name="Gemini"):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.cooldown:
+                return "half-open"
+            return "open"
+
+    def before_call(self):
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.cooldown - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._trial_running:
+                raise CircuitOpenError(
+                    f"{self.name} is temporarily unavailable after repeated failures; try again in {max(remaining, 1):.0f}s"
+                )
+            self._trial_running = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_neutral(self):
+        """End a call whose outcome says nothing about backend health (e.g. a rejected request)"""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+def is_retryable(error):
+    """True for quota (429) and server-side (5xx) errors, including timeouts"""
+    if google_exceptions is not None and isinstance(error, (
+        google_exceptions.TooManyRequests,
+        google_exceptions.ResourceExhausted,
+        google_exceptions.InternalServerError,
+        google_exceptions.BadGateway,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.GatewayTimeout,
+        google_exceptions.DeadlineExceeded,
+    )):
+        return True
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    return isinstance(status, int) and status in RETRYABLE_STATUS_CODES
+
+
+def backoff_delay(attempt, base_delay=1.0, max_delay=30.0):
+    """Full-jitter exponential backoff: uniform in [0, min(max_delay, base * 2**attempt)]"""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def call_with_retry(call, breaker=None, max_retries=4, base_delay=1.0, max_delay=30.0):
+    """Run ``call()`` with retries on retryable errors, guarded by ``breaker``
+
+    Only the final outcome of a call counts towards the breaker.
+    Non-retryable errors (bad requests, invalid keys) neither trip it nor
+    reset its failure count.
+    """
+    if breaker:
+        breaker.before_call()
+    for attempt in range(max_retries + 1):
+        try:
+            result = call()
+        except Exception as e:
+            if not is_retryable(e):
+                if breaker:
+                    breaker.record_neutral()
+                raise
+            if attempt == max_retries:
+                if breaker:
+                    breaker.record_failure()
+                raise
+            time.sleep(backoff_delay(attempt, base_delay, max_delay))
+            continue
+        if breaker:
+            breaker.record_success()
+        return result
+
+
+def limits_from_env(prefix="GEMINI", name="Gemini"):
+    """Build (limiter, breaker, retry settings) from the ``<prefix>_*`` environment variables"""
+    limiter = RequestLimiter(
+        requests_per_minute=int(os.getenv(f"{prefix}_RPM", "60")),
+        tokens_per_minute=int(os.getenv(f"{prefix}_TPM", "250000")),
+    )
+    breaker = CircuitBreaker(
+        failure_threshold=int(os.getenv(f"{prefix}_BREAKER_THRESHOLD", "5")),
+        cooldown=float(os.getenv(f"{prefix}_BREAKER_COOLDOWN", "30")),
+        name=name,
+    )
+    retry = {
+        "max_retries": int(os.getenv(f"{prefix}_MAX_RETRIES", "4")),
+        "base_delay": float(os.getenv(f"{prefix}_RETRY_BASE_DELAY", "1.0")),
+    }
+    return limiter, breaker, retry
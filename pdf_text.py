@@ -0,0 +1,557 @@
+"""
+PDF text extraction with a content-addressed cache.
+
+Resumes are keyed by the SHA-256 of their raw bytes, so re-uploading the same
+file or switching between tabs returns the cached text instead of parsing the
+PDF with PyPDF2 again. Extraction runs on persistent worker processes with a
+per-page timeout, so one pathological page cannot stall the whole request;
+long documents (publication lists, portfolios) are split into page ranges
+that are extracted side by side.
+
+Ingestion is memory-bounded: uploads are copied in chunks and spilled to a
+memory-mapped temporary file once they pass a size threshold, byte and page
+limits are checked before any text is extracted, each page's content streams
+are test-decompressed against a size limit before PyPDF2 touches them, and
+extraction stops once the text budget is reached.
+"""
+
+import atexit
+import hashlib
+import io
+import mmap
+import multiprocessing
+import multiprocessing.connection
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import PyPDF2
+from PyPDF2.filters import ASCII85Decode, ASCIIHexDecode
+
+from token_budget import count_tokens
+
+_CHUNK_SIZE = 1 << 20
+
+
+class PdfLimitError(ValueError):
+    """Raised when a PDF exceeds an ingestion limit"""
+
+
+class PdfTextCache:
+    """Bounded in-memory LRU cache with an optional SQLite tier on disk"""
+
+    def __init__(self, max_entries=64, db_path=None):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.db_path:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS pdf_text ("
+                    "sha256 TEXT PRIMARY KEY, text BLOB NOT NULL)"
+                )
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _remember(self, key, text):
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        """Return cached text for a content hash, or None"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+            if self.db_path:
+                with self._connect() as conn:
+                    row = conn.execute(
+                        "SELECT text FROM pdf_text WHERE sha256 = ?", (key,)
+                    ).fetchone()
+                if row:
+                    text = zlib.decompress(row[0]).decode("utf-8")
+                    self._remember(key, text)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return text
+
+            self.misses += 1
+            return None
+
+    def put(self, key, text):
+        """Store extracted text under its content hash"""
+        with self._lock:
+            self._remember(key, text)
+            if self.db_path:
+                blob = zlib.compress(text.encode("utf-8"))
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO pdf_text (sha256, text) VALUES (?, ?)",
+                        (key, blob),
+                    )
+
+    def clear(self):
+        """Drop every cached entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+            if self.db_path:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM pdf_text")
+
+    def stats(self):
+        """Return hit/miss counters and the current in-memory size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_pdf_text_cache():
+    """Return the process-wide cache, configured from the environment"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PdfTextCache(
+                max_entries=int(os.getenv("PDF_CACHE_SIZE", "64")),
+                db_path=os.getenv("PDF_CACHE_PATH") or None,
+            )
+        return _cache
+
+
+@contextmanager
+def spool_pdf(pdf_file, max_bytes, spill_bytes=_CHUNK_SIZE):
+    """Yield (source, sha256) for a PDF without holding more than one copy in memory
+
+    ``source`` is a path for files on disk and spilled uploads, or bytes for
+    uploads smaller than ``spill_bytes``. Raises PdfLimitError past ``max_bytes``.
+    """
+    if isinstance(pdf_file, (str, os.PathLike)):
+        size = os.path.getsize(pdf_file)
+        if size > max_bytes:
+            raise PdfLimitError(f"PDF is {size / 1e6:.1f} MB; the limit is {max_bytes / 1e6:.1f} MB")
+        digest = hashlib.sha256()
+        with open(pdf_file, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        yield os.fspath(pdf_file), digest.hexdigest()
+        return
+
+    if isinstance(pdf_file, (bytes, bytearray)):
+        pdf_file = io.BytesIO(pdf_file)
+    pdf_file.seek(0)
+
+    digest = hashlib.sha256()
+    buffer = io.BytesIO()
+    spill = None
+    size = 0
+    try:
+        for chunk in iter(lambda: pdf_file.read(_CHUNK_SIZE), b""):
+            size += len(chunk)
+            if size > max_bytes:
+                raise PdfLimitError(f"PDF is larger than the {max_bytes / 1e6:.1f} MB limit")
+            digest.update(chunk)
+            if spill is None and size > spill_bytes:
+                spill = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+                spill.write(buffer.getvalue())
+                buffer = None
+            (spill or buffer).write(chunk)
+
+        if spill is None:
+            yield buffer.getvalue(), digest.hexdigest()
+        else:
+            spill.close()
+            yield spill.name, digest.hexdigest()
+    finally:
+        if spill is not None:
+            spill.close()
+            os.unlink(spill.name)
+
+
+@contextmanager
+def open_pdf(source):
+    """Open a PdfReader over bytes or a memory-mapped file path"""
+    if isinstance(source, (bytes, bytearray)):
+        yield PyPDF2.PdfReader(io.BytesIO(source))
+        return
+    with open(source, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield PyPDF2.PdfReader(mapped)
+
+
+@contextmanager
+def pdf_path(source):
+    """Yield a file path for bytes or a path, spilling bytes to a temp file that is removed afterwards
+
+    Worker processes are handed the path, so the document is not pickled
+    into every task.
+    """
+    if not isinstance(source, (bytes, bytearray)):
+        yield source
+        return
+    spill = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+    try:
+        with spill:
+            spill.write(source)
+        yield spill.name
+    finally:
+        os.unlink(spill.name)
+
+
+def _decoded_size(stream, limit):
+    """Size of a content stream after decoding, capped at ``limit + 1`` without decoding further"""
+    data = stream._data
+    filters = stream.get("/Filter") or []
+    if not isinstance(filters, list):
+        filters = [filters]
+    for name in filters:
+        if name in ("/FlateDecode", "/Fl"):
+            inflater = zlib.decompressobj()
+            data = inflater.decompress(data, limit + 1)
+        elif name in ("/ASCII85Decode", "/A85"):
+            data = ASCII85Decode.decode(data)
+        elif name in ("/ASCIIHexDecode", "/AHx"):
+            data = ASCIIHexDecode.decode(data)
+        else:
+            # Other filters (LZW, run-length) are rare in content streams; count the raw size
+            break
+        if len(data) > limit:
+            break
+    return len(data)
+
+
+def check_page(page, max_stream_bytes):
+    """Raise PdfLimitError if the page's content streams decompress past ``max_stream_bytes``"""
+    contents = page.get("/Contents")
+    if contents is None:
+        return
+    contents = contents.get_object()
+    streams = [item.get_object() for item in contents] if isinstance(contents, list) else [contents]
+    total = 0
+    for stream in streams:
+        if hasattr(stream, "_data"):
+            total += _decoded_size(stream, max_stream_bytes - total)
+        if total > max_stream_bytes:
+            raise PdfLimitError(f"A page's content exceeds the {max_stream_bytes / 1e6:.1f} MB decompressed limit")
+
+
+def _extract_page_range(source, start, stop, max_stream_bytes, text_budget):
+    """Return the text of pages[start:stop], stopping once ``text_budget`` tokens are read"""
+    with open_pdf(source) as reader:
+        texts = []
+        used = 0
+        for i in range(start, stop):
+            check_page(reader.pages[i], max_stream_bytes)
+            texts.append(reader.pages[i].extract_text() or "")
+            used += count_tokens(texts[-1])
+            if used >= text_budget:
+                break
+        return texts
+
+
+def _page_worker_loop(conn):
+    """Worker process: extract page ranges sent over ``conn`` until the pipe closes"""
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send((True, _extract_page_range(*task)))
+        except Exception as e:
+            try:
+                conn.send((False, e))
+            except Exception:
+                # The exception itself may not pickle
+                conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+class _PageWorker:
+    """One extraction process with a private pipe, so a hung range can be killed on its own"""
+
+    def __init__(self, context):
+        self.conn, child = context.Pipe()
+        # spawn: forking a multi-threaded Streamlit server is not safe
+        self.process = context.Process(target=_page_worker_loop, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+        self.deadline = None
+
+    def submit(self, task, timeout):
+        self.conn.send(task)
+        self.deadline = time.monotonic() + timeout
+
+    def result(self):
+        """Return the finished range's texts, re-raising the worker's exception"""
+        ok, value = self.conn.recv()
+        self.deadline = None
+        if not ok:
+            raise value
+        return value
+
+    def drain(self):
+        """Wait for an abandoned range until its deadline; return whether the worker is reusable"""
+        if self.deadline is None:
+            return True
+        try:
+            if self.conn.poll(max(0.0, self.deadline - time.monotonic())):
+                self.conn.recv()
+                self.deadline = None
+                return True
+        except (EOFError, OSError):
+            pass
+        return False
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class PageExtractor:
+    """Extracts PDF pages within ingestion limits on a persistent set of worker processes
+
+    Workers are started on first use and kept for later documents. Each call
+    checks out up to ``workers`` of them for its own use and sends one page
+    range at a time to each; documents shorter than ``min_pages`` go to a
+    single worker as one range. A range gets ``page_timeout`` seconds per
+    page from the moment it is sent; if it runs over, its pages come back
+    empty and only that worker is killed and later replaced, so other
+    extractions are unaffected. Pages are read in order until
+    ``text_budget`` tokens have been collected. ``parallel=False`` parses
+    in-process without a timeout, for callers already isolated in a worker.
+    """
+
+    def __init__(self, workers=None, page_timeout=10.0, min_pages=8, pages_per_task=4,
+                 max_bytes=20_000_000, max_pages=200, max_stream_bytes=20_000_000,
+                 text_budget=8000, spill_bytes=_CHUNK_SIZE):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.page_timeout = page_timeout
+        self.min_pages = min_pages
+        self.pages_per_task = pages_per_task
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.max_stream_bytes = max_stream_bytes
+        self.text_budget = text_budget
+        self.spill_bytes = spill_bytes
+        self.timeouts = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._idle = []
+        self._started = 0
+        self._available = threading.Condition()
+
+    def _checkout(self, count):
+        """Take up to ``count`` workers for one call, waiting for at least one"""
+        with self._available:
+            while not self._idle and self._started >= self.workers:
+                self._available.wait()
+            taken = []
+            while len(taken) < count and self._idle:
+                taken.append(self._idle.pop())
+            to_start = min(count - len(taken), self.workers - self._started)
+            self._started += to_start
+        started = []
+        try:
+            for _ in range(to_start):
+                started.append(_PageWorker(self._context))
+        except Exception:
+            self._checkin(taken + started, lost=to_start - len(started))
+            raise
+        taken += started
+        # A worker that died between calls is replaced
+        for i, worker in enumerate(taken):
+            if not worker.process.is_alive():
+                worker.kill()
+                taken[i] = _PageWorker(self._context)
+        return taken
+
+    def _checkin(self, workers, lost=0):
+        with self._available:
+            self._idle.extend(workers)
+            self._started -= lost
+            self._available.notify_all()
+
+    def close(self):
+        """Stop idle workers; busy ones are stopped when their call returns them"""
+        with self._available:
+            idle, self._idle = self._idle, []
+            self._started -= len(idle)
+        for worker in idle:
+            worker.kill()
+
+    def _page_ranges(self, num_pages):
+        # Each range reopens the PDF in its worker, which only pays off when ranges run side by side
+        if num_pages < self.min_pages or self.workers == 1:
+            return [(0, num_pages)]
+        return [(start, min(start + self.pages_per_task, num_pages))
+                for start in range(0, num_pages, self.pages_per_task)]
+
+    def extract_pages(self, source, parallel=True):
+        """Return (page texts, complete) for bytes or a file path
+
+        ``complete`` is False if any page timed out. Pages after the text
+        budget is reached are neither extracted nor returned.
+        """
+        with open_pdf(source) as reader:
+            num_pages = len(reader.pages)
+            if num_pages > self.max_pages:
+                raise PdfLimitError(f"PDF has {num_pages} pages; the limit is {self.max_pages}")
+            if not parallel:
+                pages = []
+                used = 0
+                for page in reader.pages:
+                    check_page(page, self.max_stream_bytes)
+                    pages.append(page.extract_text() or "")
+                    used += count_tokens(pages[-1])
+                    if used >= self.text_budget:
+                        break
+                return pages, True
+        if not num_pages:
+            return [], True
+
+        with pdf_path(source) as path:
+            return self._extract_on_workers(path, self._page_ranges(num_pages))
+
+    def _extract_on_workers(self, path, ranges):
+        free = self._checkout(min(self.workers, len(ranges)))
+        busy = {}
+        lost = []
+        results = {}
+        pages = []
+        used = 0
+        complete = True
+        next_index = emitted = 0
+        try:
+            while True:
+                while free and next_index < len(ranges) and used < self.text_budget:
+                    worker = free.pop()
+                    start, stop = ranges[next_index]
+                    task = (path, start, stop, self.max_stream_bytes, self.text_budget - used)
+                    worker.submit(task, self.page_timeout * (stop - start))
+                    busy[worker] = next_index
+                    next_index += 1
+
+                # Pages are consumed in document order as soon as the next range is in
+                while emitted in results:
+                    texts = results.pop(emitted)
+                    pages.extend(texts)
+                    used += sum(count_tokens(text) for text in texts)
+                    emitted += 1
+                if used >= self.text_budget or emitted == len(ranges):
+                    break
+
+                wait_for = min(worker.deadline for worker in busy) - time.monotonic()
+                ready = multiprocessing.connection.wait([worker.conn for worker in busy], timeout=max(0.0, wait_for))
+                now = time.monotonic()
+                for worker in list(busy):
+                    index = busy[worker]
+                    if worker.conn in ready:
+                        try:
+                            results[index] = worker.result()
+                        except (EOFError, OSError):
+                            # The worker died mid-range; handled like a timeout below
+                            pass
+                        else:
+                            del busy[worker]
+                            free.append(worker)
+                            continue
+                    elif worker.deadline > now:
+                        continue
+                    del busy[worker]
+                    start, stop = ranges[index]
+                    results[index] = [""] * (stop - start)
+                    complete = False
+                    with self._available:
+                        self.timeouts += 1
+                    worker.kill()
+                    if next_index < len(ranges):
+                        free.append(_PageWorker(self._context))
+                    else:
+                        lost.append(worker)
+        finally:
+            # Ranges still running past the budget (or after an error) finish or are killed
+            for worker in busy:
+                if worker.drain():
+                    free.append(worker)
+                else:
+                    worker.kill()
+                    lost.append(worker)
+            self._checkin(free, lost=len(lost))
+        return pages, complete
+
+_extractor = None
+_extractor_lock = threading.Lock()
+
+
+def get_page_extractor():
+    """Return the process-wide page extractor, configured from the environment"""
+    global _extractor
+    with _extractor_lock:
+        if _extractor is None:
+            _extractor = PageExtractor(
+                workers=int(os.getenv("PDF_PAGE_WORKERS", "0")) or None,
+                page_timeout=float(os.getenv("PDF_PAGE_TIMEOUT", "10")),
+                min_pages=int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8")),
+                max_bytes=int(os.getenv("PDF_MAX_BYTES", "20000000")),
+                max_pages=int(os.getenv("PDF_MAX_PAGES", "200")),
+                max_stream_bytes=int(os.getenv("PDF_MAX_STREAM_BYTES", "20000000")),
+                text_budget=int(os.getenv("PDF_TEXT_BUDGET", "8000")),
+                spill_bytes=int(os.getenv("PDF_SPILL_BYTES", str(_CHUNK_SIZE))),
+            )
+            atexit.register(_extractor.close)
+        return _extractor
+
+
+def parse_pdf_bytes(data, parallel=True):
+    """Parse PDF bytes with PyPDF2 and return the page text joined in order"""
+    pages, _ = get_page_extractor().extract_pages(data, parallel)
+    return "".join(pages)
+
+
+def extract_text(pdf_file, cache=None, parallel=True):
+    """Extract text from a PDF, reusing cached results for identical bytes
+
+    ``parallel=False`` keeps extraction in-process, for callers that already
+    run one document per worker process. Results with timed-out pages are
+    returned but not cached, so a later request can try those pages again.
+    Raises PdfLimitError for files over the configured size, page or
+    decompressed-content limits.
+    """
+    extractor = get_page_extractor()
+    cache = cache or get_pdf_text_cache()
+    with spool_pdf(pdf_file, extractor.max_bytes, extractor.spill_bytes) as (source, digest):
+        # The text stops at the token budget, so a different budget is a different result
+        key = f"{digest}:{extractor.text_budget}"
+        text = cache.get(key)
+        if text is None:
+            pages, complete = extractor.extract_pages(source, parallel)
+            text = "".join(pages)
+            if complete:
+                cache.put(key, text)
+    return text
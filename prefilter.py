@@ -0,0 +1,108 @@
+"""
+Local first-pass resume/job scorer built on NumPy.
+
+Resumes and job descriptions are tokenized into unigrams and bigrams, hashed
+into fixed-width TF-IDF vectors and compared with cosine similarity for all
+N resumes x M jobs. Term counts are kept sparse per document, and resumes are
+expanded to dense vectors a fixed-size chunk at a time, so memory stays flat
+however many resumes are screened. Only the top-K resumes per job need to be
+sent to Gemini for detailed match scoring.
+"""
+
+import re
+import zlib
+
+import numpy as np
+
+DEFAULT_FEATURES = 2 ** 14
+DEFAULT_CHUNK_ROWS = 256
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the "
+    "their this to was were will with we you your they he she i me my us".split()
+)
+
+
+def tokenize(text):
+    """Lowercase word tokens (keeps c++, c#, node.js) without stopwords"""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def _terms(text):
+    tokens = tokenize(text)
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def sparse_counts(texts, n_features=DEFAULT_FEATURES):
+    """Return one (columns, counts) pair of arrays per text with its hashed term counts"""
+    buckets = {}
+    rows = []
+    for text in texts:
+        cols = []
+        for term in _terms(text or ""):
+            col = buckets.get(term)
+            if col is None:
+                col = buckets[term] = zlib.crc32(term.encode("utf-8")) % n_features
+            cols.append(col)
+        cols, counts = np.unique(np.asarray(cols, dtype=np.intp), return_counts=True)
+        rows.append((cols, counts.astype(np.float32)))
+    return rows
+
+
+def hashed_counts(texts, n_features=DEFAULT_FEATURES):
+    """Return a (len(texts), n_features) float32 matrix of hashed term counts"""
+    matrix = np.zeros((len(texts), n_features), dtype=np.float32)
+    for row, (cols, counts) in enumerate(sparse_counts(texts, n_features)):
+        matrix[row, cols] = counts
+    return matrix
+
+
+def _tfidf_rows(rows, n_features, idf):
+    """Dense unit-length TF-IDF vectors for a list of sparse (columns, counts) rows"""
+    matrix = np.zeros((len(rows), n_features), dtype=np.float32)
+    for row, (cols, counts) in enumerate(rows):
+        # Sublinear term frequency
+        matrix[row, cols] = np.log1p(counts) * idf[cols]
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def similarity_matrix(resume_texts, job_texts, n_features=DEFAULT_FEATURES, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Cosine similarity of TF-IDF vectors, shape (len(resume_texts), len(job_texts))
+
+    Job vectors are held densely, so ``job_texts`` is expected to be the
+    short side; resumes are densified ``chunk_rows`` at a time.
+    """
+    resumes = sparse_counts(resume_texts, n_features)
+    jobs = sparse_counts(job_texts, n_features)
+
+    # Smoothed IDF over the combined corpus
+    doc_freq = np.bincount(np.concatenate([cols for cols, _ in resumes + jobs] + [np.empty(0, dtype=np.intp)]),
+                           minlength=n_features)
+    idf = np.log((1 + len(resumes) + len(jobs)) / (1 + doc_freq)).astype(np.float32) + 1.0
+
+    job_matrix = _tfidf_rows(jobs, n_features, idf)
+    similarity = np.empty((len(resumes), len(jobs)), dtype=np.float32)
+    for start in range(0, len(resumes), chunk_rows):
+        chunk = _tfidf_rows(resumes[start:start + chunk_rows], n_features, idf)
+        similarity[start:start + chunk_rows] = chunk @ job_matrix.T
+    return similarity
+
+
+def top_k_per_job(similarity, k):
+    """Return {job_index: [(resume_index, score), ...]} with the best k resumes per job"""
+    n_resumes = similarity.shape[0]
+    k = min(k, n_resumes)
+    result = {}
+    if k <= 0:
+        return {j: [] for j in range(similarity.shape[1])}
+
+    top = np.argpartition(-similarity, k - 1, axis=0)[:k]
+    for j in range(similarity.shape[1]):
+        rows = top[:, j]
+        rows = rows[np.argsort(-similarity[rows, j], kind="stable")]
+        result[j] = [(int(i), float(similarity[i, j])) for i in rows]
+    return result
@@ -0,0 +1,364 @@
+"""
+Prompt templates for the Gemini analyses.
+
+Kept free of Streamlit so the web app and the headless tools build identical
+prompts. Bump a template's entry in PROMPT_VERSIONS whenever its wording
+changes so cached responses from the old prompt are not reused.
+
+Matching and coaching prompts describe the resume through its parsed profile
+(``resume_parser.resume_context``); the free-form and ATS prompts keep the raw
+sections, since their answers depend on the resume's own wording and layout.
+"""
+
+from resume_parser import local_match_scores, resume_context
+from token_budget import fit_job_description, fit_resume
+
+
+PROMPT_VERSIONS = {
+    "resume_analysis": 2,
+    "job_match": 4,
+    "job_match_json": 4,
+    "job_match_batch": 5,
+    "tailored_resume": 3,
+    "skill_gap": 3,
+    "interview_questions": 3,
+    "ats_compatibility": 2,
+    "ats_compatibility_json": 2,
+    "career_recommendations": 3,
+}
+
+
+def build_resume_analysis_prompt(resume_text, query):
+    """Prompt for a free-form question about the resume"""
+    return f"""
+        You are an expert career counselor and resume analyst. Provide detailed, actionable feedback.
+        
+        Based on the following resume content, please {query}
+        
+        Resume Content:
+        {fit_resume(resume_text, "resume_analysis")}
+        
+        Please provide a detailed and helpful response.
+        """
+
+
+def local_skill_check(resume_text, job_description):
+    """Skill matches already settled by the local taxonomy, so the model only judges the uncertain ones"""
+    scores = local_match_scores(resume_text, job_description)
+    related = "; ".join(f"{skill} (candidate has {', '.join(have)})" for skill, have in scores["related_skills"].items())
+    return "\n".join([
+        f"- Confirmed direct matches: {', '.join(scores['matched_skills']) or 'none'}",
+        f"- Possibly related (judge whether transferable): {related or 'none'}",
+        f"- Not found in the resume (check for equivalents): {', '.join(scores['missing_skills']) or 'none'}",
+    ])
+
+
+def build_job_match_prompt(resume_text, job_description):
+    """Prompt for semantic resume-to-job match scoring"""
+    return f"""
+        You are an AI recruitment expert. Perform a semantic analysis to match this resume with the job description.
+        
+        RESUME CONTENT:
+        {resume_context(resume_text, "job_match")}
+        
+        JOB DESCRIPTION:
+        {fit_job_description(job_description)}
+        
+        LOCAL SKILL CHECK:
+        {local_skill_check(resume_text, job_description)}
+        
+        Treat the confirmed matches as given and focus your skill judgement on the other two groups.
+        
+        Provide a detailed analysis in the following format:
+        
+        OVERALL MATCH SCORE: [X]%
+        
+        SKILL MATCH ANALYSIS:
+        - Direct Skills Match: [X]% (skills that exactly match)
+        - Related Skills Match: [X]% (similar/transferable skills)
+        - Missing Critical Skills: [list key missing skills]
+        
+        EXPERIENCE RELEVANCE:
+        - Years of Experience Match: [X]%
+        - Domain Experience: [X]%
+        - Role Suitability: [X]%
+        
+        STRENGTHS FOR THIS ROLE:
+        - [List 3-4 key strengths from resume that match this job]
+        
+        IMPROVEMENT AREAS:
+        - [List specific skills/experience to develop for this role]
+        
+        RECOMMENDATIONS:
+        - [3-4 specific actionable recommendations to improve match]
+        """
+
+
+def build_job_match_json_prompt(resume_text, job_description):
+    """Prompt for job match scoring as a JSON object (see score_schema.JOB_MATCH_SCHEMA)"""
+    return f"""
+        You are an AI recruitment expert. Perform a semantic analysis to match this resume with the job description.
+        
+        RESUME CONTENT:
+        {resume_context(resume_text, "job_match")}
+        
+        JOB DESCRIPTION:
+        {fit_job_description(job_description)}
+        
+        LOCAL SKILL CHECK:
+        {local_skill_check(resume_text, job_description)}
+        
+        Treat the confirmed matches as given and focus your skill judgement on the other two groups.
+        
+        Return only a JSON object with 0-100 scores for overall_match, direct_skills_match (skills that exactly match),
+        related_skills_match (similar/transferable skills), experience_match, domain_experience and role_suitability,
+        plus short lists of missing_skills, strengths, improvement_areas and recommendations.
+        Keep every list item to a short phrase.
+        """
+
+
+def build_job_match_batch_prompt(resume_text, jobs):
+    """Prompt scoring one resume against several jobs in a single JSON response keyed by job ID
+
+    ``jobs`` is a list of (job_id, description) pairs.
+    """
+    job_blocks = "\n".join(
+        f"""
+        [JOB {job_id}]
+        {fit_job_description(description)}
+        """
+        for job_id, description in jobs
+    )
+    return f"""
+        You are an AI recruitment expert. Perform a semantic analysis to match this resume with each of the job descriptions below.
+        
+        RESUME CONTENT:
+        {resume_context(resume_text, "job_match")}
+        
+        JOB DESCRIPTIONS:
+        {job_blocks}
+        
+        Return only a JSON object with one entry per job, keyed by its job ID, in this exact shape:
+        {{"<job id>": {{"overall_match": <0-100>, "direct_skills_match": <0-100>,
+          "related_skills_match": <0-100>, "experience_match": <0-100>,
+          "missing_skills": ["<key missing skill>", ...]}}}}
+        """
+
+
+def build_tailored_resume_prompt(resume_text, job_description):
+    """Prompt for job-specific resume tailoring"""
+    return f"""
+        You are an expert resume writer. Create a tailored version of this resume for the specific job.
+        
+        ORIGINAL RESUME:
+        {resume_context(resume_text, "tailored_resume")}
+        
+        TARGET JOB:
+        {fit_job_description(job_description)}
+        
+        Generate optimized sections:
+        
+        TAILORED PROFESSIONAL SUMMARY:
+        [Write a 3-4 line summary optimized for this job, highlighting most relevant skills and experience]
+        
+        OPTIMIZED SKILLS SECTION:
+        [Reorder and enhance skills to match job requirements. Add related skills if missing.]
+        
+        ENHANCED PROJECT/EXPERIENCE DESCRIPTIONS:
+        [Rewrite 2-3 key experiences/projects with job-relevant keywords and metrics]
+        
+        ATS OPTIMIZATION KEYWORDS:
+        [List 10-15 keywords from job description to incorporate]
+        
+        SUGGESTED ADDITIONS:
+        [Recommend any certifications, skills, or experiences to add for better job fit]
+        """
+
+
+def build_skill_gap_prompt(resume_text, job_description):
+    """Prompt for skill gap analysis and a learning path"""
+    return f"""
+        You are a career development expert. Analyze skill gaps and create a learning roadmap.
+        
+        CURRENT RESUME:
+        {resume_context(resume_text, "skill_gap")}
+        
+        TARGET JOB:
+        {fit_job_description(job_description)}
+        
+        Provide analysis in this format:
+        
+        SKILL GAP ANALYSIS:
+        
+        MISSING CRITICAL SKILLS:
+        - [List 3-5 most important missing skills]
+        
+        WEAK AREAS TO STRENGTHEN:
+        - [List 2-3 skills present but need improvement]
+        
+        PERSONALIZED LEARNING PATH:
+        
+        PRIORITY 1 (Next 4 weeks):
+        - Week 1: [Specific skill/topic to learn]
+        - Week 2: [Next skill/topic]
+        - Week 3: [Continue with next priority]
+        - Week 4: [Practice/project week]
+        
+        PRIORITY 2 (Next 2 months):
+        - Month 1: [Advanced topics]
+        - Month 2: [Certification/project]
+        
+        RECOMMENDED RESOURCES:
+        - Online Courses: [Suggest 2-3 specific courses]
+        - Certifications: [Relevant certifications to pursue]
+        - Practice Projects: [2-3 project ideas to build skills]
+        
+        SKILL DEVELOPMENT TIMELINE:
+        - 30 days: [Expected skill level]
+        - 60 days: [Expected skill level]
+        - 90 days: [Job-ready assessment]
+        """
+
+
+def build_interview_questions_prompt(resume_text, job_description):
+    """Prompt for job-specific interview questions"""
+    return f"""
+        You are an experienced interviewer. Generate interview questions for this candidate based on their resume and the target job.
+        
+        CANDIDATE RESUME:
+        {resume_context(resume_text, "interview_questions")}
+        
+        TARGET JOB:
+        {fit_job_description(job_description)}
+        
+        Generate questions in these categories:
+        
+        TECHNICAL QUESTIONS (Based on Resume Experience):
+        1. [Question about specific technology mentioned in resume]
+        2. [Question about project details from resume]
+        3. [Question about technical skills listed]
+        4. [Scenario-based technical question]
+        5. [Problem-solving question related to job requirements]
+        
+        BEHAVIORAL QUESTIONS (STAR Method):
+        1. [Question about leadership/teamwork from resume]
+        2. [Question about challenges/achievements mentioned]
+        3. [Question about learning/adaptation]
+        4. [Question about conflict resolution]
+        
+        JOB-SPECIFIC QUESTIONS:
+        1. [Question about specific job requirement]
+        2. [Question about company/industry knowledge needed]
+        3. [Question about future goals in this role]
+        
+        SUGGESTED STAR METHOD ANSWERS:
+        [Provide framework answers for 2-3 behavioral questions based on resume content]
+        
+        TECHNICAL PREPARATION AREAS:
+        [List 5-7 technical topics to review based on job requirements]
+        """
+
+
+def build_ats_compatibility_prompt(resume_text):
+    """Prompt for an ATS compatibility check"""
+    return f"""
+        You are an ATS (Applicant Tracking System) expert. Analyze this resume for ATS compatibility.
+        
+        RESUME CONTENT:
+        {fit_resume(resume_text, "ats_compatibility")}
+        
+        Provide analysis in this format:
+        
+        ATS COMPATIBILITY SCORE: [X]/100
+        
+        SECTION ANALYSIS:
+        
+        ✅ GOOD PRACTICES FOUND:
+        - [List what's working well]
+        
+        ❌ ATS ISSUES DETECTED:
+        - [List specific formatting/content issues]
+        
+        KEYWORD OPTIMIZATION:
+        - Keyword Density: [Assessment]
+        - Missing Industry Keywords: [List important missing keywords]
+        - Overused Keywords: [List if any]
+        
+        FORMATTING RECOMMENDATIONS:
+        - [Specific formatting improvements needed]
+        
+        SECTION IMPROVEMENTS:
+        - Contact Information: [Issues/suggestions]
+        - Professional Summary: [Issues/suggestions]
+        - Skills Section: [Issues/suggestions]
+        - Experience Section: [Issues/suggestions]
+        
+        ATS-OPTIMIZED SUGGESTIONS:
+        - [3-5 specific actionable improvements]
+        
+        REWRITTEN SECTIONS (if needed):
+        [Provide ATS-friendly rewrites of problematic sections]
+        """
+
+
+def build_ats_compatibility_json_prompt(resume_text):
+    """Prompt for an ATS compatibility check as a JSON object (see score_schema.ATS_SCHEMA)"""
+    return f"""
+        You are an ATS (Applicant Tracking System) expert. Analyze this resume for ATS compatibility.
+        
+        RESUME CONTENT:
+        {fit_resume(resume_text, "ats_compatibility")}
+        
+        Return only a JSON object with an ats_score from 0-100, lists of good_practices, issues, missing_keywords,
+        overused_keywords, formatting_recommendations and 3-5 suggestions, and a one-sentence section_feedback
+        entry for contact_information, professional_summary, skills and experience.
+        Keep every list item to a short phrase.
+        """
+
+
+def build_career_recommendations_prompt(resume_text):
+    """Prompt for alternative career path recommendations"""
+    return f"""
+        You are a career counselor. Analyze this resume and suggest alternative career paths and roles.
+        
+        RESUME CONTENT:
+        {resume_context(resume_text, "career_recommendations")}
+        
+        Provide recommendations in this format:
+        
+        CURRENT PROFILE ANALYSIS:
+        - Primary Skills: [Top 5 skills]
+        - Experience Level: [Assessment]
+        - Industry Background: [Current industry/domain]
+        
+        RECOMMENDED CAREER PATHS:
+        
+        PATH 1: [Similar Role Progression]
+        - Suggested Role: [Job title]
+        - Why it fits: [Reasoning based on skills/experience]
+        - Skills to develop: [2-3 skills needed]
+        - Salary range: [Estimate if possible]
+        
+        PATH 2: [Lateral Move]
+        - Suggested Role: [Job title]
+        - Why it fits: [Reasoning]
+        - Skills to develop: [2-3 skills needed]
+        - Transition timeline: [Estimated time]
+        
+        PATH 3: [Growth/Advancement]
+        - Suggested Role: [Senior/lead position]
+        - Why it fits: [Reasoning]
+        - Skills to develop: [Leadership/advanced skills]
+        - Experience needed: [Additional requirements]
+        
+        EMERGING OPPORTUNITIES:
+        - [2-3 trending roles that match profile]
+        
+        SKILL TRANSFERABILITY:
+        - [How current skills apply to different industries]
+        
+        NEXT STEPS:
+        - Immediate (30 days): [Action items]
+        - Short-term (3 months): [Development goals]
+        - Long-term (1 year): [Career milestone]
+        """
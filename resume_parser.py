@@ -0,0 +1,444 @@
+"""
+Local structured parsing of resume text.
+
+Extracted PDF text is parsed once into a compact ``ResumeProfile`` (contact
+details, sections, skills, roles with dates, education) memoized by content
+hash, so every tab and prompt reuses the same result. Prompts get the
+profile's short summary in place of the raw skills and education sections,
+and deterministic features such as skill matches (see ``skill_taxonomy``) and
+years of experience are computed locally without an LLM call.
+
+Parsing is heuristic: it relies on the section headings recognised by
+``token_budget.split_sections`` and on common date formats, and leaves a
+field empty rather than guessing when a resume does not follow them.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import date
+
+from skill_taxonomy import get_skill_taxonomy
+from token_budget import (
+    DEFAULT_RESUME_BUDGET, JOB_SECTION_ALIASES, RESUME_BUDGETS, RESUME_PRIORITIES,
+    count_tokens, fit_sections, split_sections,
+)
+
+_MONTHS = {name: i + 1 for i, name in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"))}
+_DATE = r"(?:(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?,?\s+|\d{1,2}\s*[/.-]\s*)?(?:19|20)\d{2}"
+_PRESENT = r"present|current|now|today|ongoing|date"
+_DATE_RANGE = re.compile(rf"({_DATE})\s*(?:-|–|—|to|until|till)\s*({_DATE}|{_PRESENT})", re.IGNORECASE)
+_DATE_PARTS = re.compile(r"(?:([a-z]{3})[a-z]*\.?,?\s+|(\d{1,2})\s*[/.-]\s*)?((?:19|20)\d{2})", re.IGNORECASE)
+_YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE = re.compile(r"\+?\(?\d[\d\s().-]{7,}\d")
+_LINKEDIN = re.compile(r"(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+/?", re.IGNORECASE)
+_GITHUB = re.compile(r"(?:https?://)?(?:www\.)?github\.com/[\w-]+/?", re.IGNORECASE)
+
+_DEGREE = re.compile(
+    r"\b(?:ph\.?\s?d|doctor(?:ate)?|master(?:'?s)?|m\.?\s?s\.?c?|m\.?\s?tech|m\.?\s?eng|mba|m\.?\s?a\.?|"
+    r"bachelor(?:'?s)?|b\.?\s?s\.?c?|b\.?\s?tech|b\.?\s?e\.?|b\.?\s?eng|b\.?\s?a\.?|associate(?:'?s)?|diploma)\b",
+    re.IGNORECASE,
+)
+_INSTITUTION = re.compile(r"\b(?:university|college|institute|school|academy|polytechnic)\b", re.IGNORECASE)
+
+_BULLET = re.compile(r"^[\s•●▪◦‣∙·*\-–—>\x7f\uf0a7\uf0b7]+")
+_LIST_SEPARATORS = re.compile(r"[,;|•●▪·]|\s{2,}|\s/\s")
+_REQUIRED_YEARS = re.compile(r"(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?years?", re.IGNORECASE)
+
+# Sections the profile summary stands in for when it has content for them
+_SUMMARIZED_SECTIONS = {"skills": "skills", "education": "education"}
+
+
+class Role:
+    """One position from the experience section"""
+
+    def __init__(self, title, company, start, end, current, highlights):
+        self.title = title
+        self.company = company
+        self.start = start  # (year, month)
+        self.end = end  # (year, month); today's month for current roles
+        self.current = current
+        self.highlights = highlights
+
+    @property
+    def months(self):
+        return max(0, (self.end[0] - self.start[0]) * 12 + self.end[1] - self.start[1] + 1)
+
+    def to_dict(self):
+        return {
+            "title": self.title,
+            "company": self.company,
+            "start": "%04d-%02d" % self.start,
+            "end": None if self.current else "%04d-%02d" % self.end,
+            "current": self.current,
+            "highlights": self.highlights,
+        }
+
+
+class Education:
+    """One degree or school from the education section"""
+
+    def __init__(self, degree="", institution="", year=None):
+        self.degree = degree
+        self.institution = institution
+        self.year = year
+
+    def to_dict(self):
+        return {"degree": self.degree, "institution": self.institution, "year": self.year}
+
+
+class ResumeProfile:
+    """Typed view of a resume: contact, sections, skills, roles and education"""
+
+    def __init__(self, contact, sections, skills, roles, education, known_skills=()):
+        self.contact = contact
+        self.sections = sections
+        self.skills = skills
+        # Canonical taxonomy skills mentioned anywhere in the resume
+        self.known_skills = list(known_skills)
+        self.roles = roles
+        self.education = education
+
+    @property
+    def section_names(self):
+        return [name for name, _ in self.sections]
+
+    @property
+    def years_of_experience(self):
+        """Total years covered by dated roles, counting overlapping roles once"""
+        intervals = sorted(
+            (role.start[0] * 12 + role.start[1], role.end[0] * 12 + role.end[1] + 1) for role in self.roles
+        )
+        months = 0
+        current_start = current_end = None
+        for start, end in intervals:
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    months += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            months += current_end - current_start
+        return round(months / 12, 1)
+
+    def to_dict(self):
+        return {
+            "contact": self.contact,
+            "sections": self.section_names,
+            "skills": self.skills,
+            "known_skills": self.known_skills,
+            "years_of_experience": self.years_of_experience,
+            "roles": [role.to_dict() for role in self.roles],
+            "education": [entry.to_dict() for entry in self.education],
+        }
+
+    def summary_text(self):
+        """Compact plain-text profile for prompts; contact details are left out"""
+        lines = []
+        if self.roles:
+            lines.append(f"Experience: about {self.years_of_experience:g} years across {len(self.roles)} roles")
+            for role in self.roles:
+                period = f"{role.start[0]}-{'present' if role.current else role.end[0]}"
+                lines.append(f"- {' at '.join(part for part in (role.title, role.company) if part)} ({period})")
+        if self.skills:
+            lines.append("Skills: " + ", ".join(self.skills))
+        if self.education:
+            lines.append("Education: " + "; ".join(
+                ", ".join(str(part) for part in (entry.degree, entry.institution, entry.year) if part)
+                for entry in self.education
+            ))
+        return "\n".join(lines)
+
+
+def _strip_bullet(line):
+    return _BULLET.sub("", line).strip()
+
+
+def _parse_date(text, today):
+    """Return (year, month) for a resume date; anything without a year (e.g. "Present") is this month"""
+    match = _DATE_PARTS.search(text)
+    if not match:
+        return (today.year, today.month)
+    month_name, month_number, year = match.groups()
+    month = _MONTHS.get((month_name or "").lower()[:3]) or (int(month_number) if month_number else 1)
+    return (int(year), min(max(month, 1), 12))
+
+
+def parse_contact(header):
+    """Name, email, phone and profile links from the resume header"""
+    contact = {"name": "", "email": "", "phone": "", "linkedin": "", "github": ""}
+    for key, pattern in (("email", _EMAIL), ("linkedin", _LINKEDIN), ("github", _GITHUB)):
+        match = pattern.search(header)
+        if match:
+            contact[key] = match.group(0)
+    for match in _PHONE.finditer(header):
+        # Skip date ranges such as "2019 - 2021" that look like digits
+        if sum(c.isdigit() for c in match.group(0)) >= 9 and not _DATE_RANGE.search(match.group(0)):
+            contact["phone"] = match.group(0).strip()
+            break
+    for line in header.splitlines():
+        candidate = line.strip()
+        if (candidate and len(candidate.split()) <= 5 and not any(c.isdigit() for c in candidate)
+                and "@" not in candidate and "/" not in candidate):
+            contact["name"] = candidate
+            break
+    return contact
+
+
+def _section_body(text):
+    """Section text without its heading line"""
+    lines = text.splitlines()
+    return lines[1:] if len(lines) > 1 else []
+
+
+def parse_skill_list(lines):
+    """Split skill lines ("Languages: Python, SQL | Docker") into unique skill names"""
+    skills, seen = [], set()
+    for line in lines:
+        line = _strip_bullet(line)
+        if ":" in line[:40]:
+            line = line.split(":", 1)[1]
+        for item in _LIST_SEPARATORS.split(line):
+            item = item.strip(" .()")
+            key = item.lower()
+            if (item and len(item) <= 40 and len(item.split()) <= 4 and key not in seen
+                    and not _REQUIRED_YEARS.search(item)):
+                seen.add(key)
+                skills.append(item)
+    return skills
+
+
+def parse_roles(lines, today=None):
+    """Roles from experience lines: a line with a date range starts a new role"""
+    today = today or date.today()
+    roles = []
+    previous = ""
+    just_started = False
+    for raw in lines:
+        line = _strip_bullet(raw)
+        if not line:
+            continue
+        match = _DATE_RANGE.search(line)
+        if not match:
+            if roles and just_started and not roles[-1].company and not _BULLET.match(raw):
+                # "Company" on the line under "Title   Dates"
+                roles[-1].company = line
+            elif roles:
+                # Bullet characters are often lost in PDF text, so any other line counts as a highlight
+                roles[-1].highlights.append(line)
+                previous = "" if _BULLET.match(raw) else line
+            else:
+                previous = line
+            just_started = False
+            continue
+
+        heading = (line[:match.start()] + " " + line[match.end():]).strip(" |,–—-()")
+        parts = [part.strip() for part in re.split(r"\s+at\s+|\s*[|@,–—]\s*|\s+-\s+", heading) if part.strip()]
+        if previous and len(parts) < 2:
+            # The title/company line above the dates belongs to this role, not the last one
+            if roles and roles[-1].highlights and roles[-1].highlights[-1] == previous:
+                roles[-1].highlights.pop()
+            parts = parts + [previous] if parts else [part.strip() for part in re.split(
+                r"\s+at\s+|\s*[|@,–—]\s*|\s+-\s+", previous) if part.strip()]
+        title = parts[0] if parts else ""
+        company = parts[1] if len(parts) > 1 else ""
+        end_text = match.group(2)
+        current = bool(re.fullmatch(_PRESENT, end_text.strip(), re.IGNORECASE))
+        start = _parse_date(match.group(1), today)
+        end = (today.year, today.month) if current else _parse_date(end_text, today)
+        roles.append(Role(title, company, start, max(start, end), current, []))
+        previous = ""
+        just_started = True
+    return roles
+
+
+def parse_education(lines):
+    """Degrees, institutions and graduation years from education lines"""
+    entries = []
+    for raw in lines:
+        line = _strip_bullet(raw)
+        degree = _DEGREE.search(line)
+        institution = _INSTITUTION.search(line)
+        years = _YEAR.findall(line)
+        if not (degree or institution):
+            if entries and years and entries[-1].year is None:
+                entries[-1].year = int(years[-1])
+            continue
+        text = _YEAR.sub("", line).strip(" |,–—-()")
+        last = entries[-1] if entries else None
+        if degree and last and not last.degree and last.institution:
+            last.degree = text
+        elif institution and not degree and last and not last.institution and last.degree:
+            last.institution = text
+        else:
+            last = Education(text if degree else "", text if institution and not degree else "")
+            if degree and institution:
+                # "B.S. Computer Science, Stanford University"
+                pieces = [p.strip() for p in re.split(r"\s*[,|–—]\s*|\s+-\s+", text) if p.strip()]
+                last.institution = next((p for p in pieces if _INSTITUTION.search(p)), "")
+                last.degree = ", ".join(p for p in pieces if p != last.institution)
+            entries.append(last)
+        if years and last.year is None:
+            last.year = int(years[-1])
+    return entries
+
+
+def parse_resume_text(resume_text, today=None):
+    """Parse resume text into a ResumeProfile (uncached; see parse_resume)"""
+    sections = split_sections(resume_text)
+    by_name = dict(sections)
+    known_skills = get_skill_taxonomy().extract(resume_text)
+    return ResumeProfile(
+        contact=parse_contact(by_name.get("header", "")),
+        sections=sections,
+        # Resumes without a skills section still get the known skills they mention
+        skills=parse_skill_list(_section_body(by_name.get("skills", ""))) or known_skills,
+        roles=parse_roles(_section_body(by_name.get("experience", "")), today),
+        education=parse_education(_section_body(by_name.get("education", ""))),
+        known_skills=known_skills,
+    )
+
+
+class ProfileCache:
+    """Thread-safe LRU of parsed profiles keyed by the SHA-256 of the resume text"""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_parse(self, resume_text):
+        key = hashlib.sha256((resume_text or "").encode("utf-8")).hexdigest()
+        with self._lock:
+            profile = self._entries.get(key)
+            if profile is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return profile
+            self.misses += 1
+        # Parsing takes milliseconds; two sessions racing on the same resume is harmless
+        profile = parse_resume_text(resume_text or "")
+        with self._lock:
+            self._entries[key] = profile
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return profile
+
+
+_profiles = None
+_profiles_lock = threading.Lock()
+
+
+def get_profile_cache():
+    """Return the process-wide profile cache, configured from the environment"""
+    global _profiles
+    with _profiles_lock:
+        if _profiles is None:
+            _profiles = ProfileCache(max_entries=int(os.getenv("RESUME_PROFILE_CACHE_SIZE", "256")))
+        return _profiles
+
+
+def parse_resume(resume_text):
+    """Return the memoized ResumeProfile for ``resume_text``"""
+    return get_profile_cache().get_or_parse(resume_text)
+
+
+def resume_context(resume_text, analysis, budget=None):
+    """Prompt input for ``analysis``: the profile summary plus the most relevant raw sections
+
+    The summary replaces the raw skills and education sections whenever the
+    parser found content for them, and the remaining sections fill what is
+    left of the analysis's token budget.
+    """
+    profile = parse_resume(resume_text)
+    summary = profile.summary_text()
+    budget = budget or RESUME_BUDGETS.get(analysis, DEFAULT_RESUME_BUDGET)
+    priorities = RESUME_PRIORITIES.get(analysis, RESUME_PRIORITIES["resume_analysis"])
+    covered = {name for name, field in _SUMMARIZED_SECTIONS.items() if getattr(profile, field)}
+    sections = [(name, text) for name, text in profile.sections if name not in covered]
+    raw = fit_sections(sections, max(budget - count_tokens(summary), 0), priorities)
+    if not summary:
+        return raw
+    return f"CANDIDATE PROFILE:\n{summary}\n\n{raw}" if raw else f"CANDIDATE PROFILE:\n{summary}"
+
+
+def job_skills(job_description, candidates=()):
+    """Skills a job asks for, canonicalized where the skill taxonomy knows them
+
+    Known skills are found anywhere in the requirement and duty sections (or
+    the whole posting if it has none); list items from the requirement
+    sections and any ``candidates`` the posting mentions are added as-is.
+    """
+    taxonomy = get_skill_taxonomy()
+    sections = dict(split_sections(job_description, JOB_SECTION_ALIASES))
+    focus = "\n".join(sections[name] for name in ("requirements", "preferred", "responsibilities") if name in sections)
+    skills = taxonomy.extract(focus or job_description)
+    lines = []
+    for name in ("requirements", "preferred"):
+        lines.extend(line for line in _section_body(sections.get(name, "")) if len(line) <= 120)
+    seen = {skill.lower() for skill in skills}
+    items = [item for item in parse_skill_list(lines) if taxonomy.canonicalize(item) or not taxonomy.extract(item)]
+    for skill in items + [c for c in candidates if mentions(focus or job_description, c)]:
+        # Phrases such as "Data wrangling with Polars" are covered by the known skills found in them
+        skill = taxonomy.canonicalize(skill) or skill
+        if skill.lower() not in seen:
+            seen.add(skill.lower())
+            skills.append(skill)
+    return skills
+
+
+def mentions(text, term):
+    """Whole-word, case-insensitive check that ``term`` appears in ``text``"""
+    return re.search(rf"(?<![\w+#]){re.escape(term)}(?![\w+#])", text or "", re.IGNORECASE) is not None
+
+
+def required_years(job_description):
+    """Smallest "N+ years" requirement in a job description, or None"""
+    years = [int(n) for n in _REQUIRED_YEARS.findall(job_description or "") if 0 < int(n) <= 30]
+    return min(years) if years else None
+
+
+def resume_skills(resume_text):
+    """Canonical skills found anywhere in the resume plus the parsed skills list"""
+    taxonomy = get_skill_taxonomy()
+    profile = parse_resume(resume_text)
+    skills = list(profile.known_skills)
+    seen = set(skills)
+    for skill in profile.skills:
+        skill = taxonomy.canonicalize(skill) or skill
+        if skill not in seen:
+            seen.add(skill)
+            skills.append(skill)
+    return skills
+
+
+def local_match_scores(resume_text, job_description):
+    """Instant, LLM-free skill and experience scores for a resume/job pair
+
+    Direct matches are job skills the resume has; related matches are job
+    skills the taxonomy links to one of the resume's skills (Pandas for
+    Data Wrangling). Only the related and missing skills need an LLM's view.
+    """
+    profile = parse_resume(resume_text)
+    have = resume_skills(resume_text)
+    wanted = job_skills(job_description, profile.skills)
+    taxonomy = get_skill_taxonomy()
+    # Skills outside the taxonomy can still match directly by name
+    have += [skill for skill in wanted if taxonomy.canonicalize(skill) is None and mentions(resume_text, skill)]
+    scores = taxonomy.match(have, wanted)
+    needed = required_years(job_description)
+    years = profile.years_of_experience
+    scores.update({
+        "years_of_experience": years,
+        "required_years": needed,
+        "experience_match": min(100, round(100 * years / needed)) if needed and profile.roles else None,
+    })
+    return scores
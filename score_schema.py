@@ -0,0 +1,166 @@
+"""
+JSON schemas and a validator for structured Gemini score responses.
+
+The same schema dicts are sent to Gemini as ``response_schema`` and used by
+``validate`` to check the reply, so a response is checked against exactly
+the shape that was requested. Validated results are plain dicts with typed
+fields that can be cached, sorted and aggregated without regex scraping.
+"""
+
+import json
+import re
+
+
+class SchemaError(ValueError):
+    """Raised when a structured response does not match its schema"""
+
+
+def _score(description):
+    return {"type": "number", "description": f"{description}, 0-100"}
+
+
+def _string_list(description):
+    return {"type": "array", "items": {"type": "string"}, "description": description}
+
+
+JOB_MATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "overall_match": _score("Overall match score"),
+        "direct_skills_match": _score("Skills that exactly match"),
+        "related_skills_match": _score("Similar or transferable skills"),
+        "experience_match": _score("Years of experience match"),
+        "domain_experience": _score("Domain experience match"),
+        "role_suitability": _score("Suitability for the role"),
+        "missing_skills": _string_list("Key skills the job needs that the resume lacks"),
+        "strengths": _string_list("3-4 resume strengths that match this job"),
+        "improvement_areas": _string_list("Skills or experience to develop for this role"),
+        "recommendations": _string_list("3-4 actionable recommendations to improve the match"),
+    },
+    "required": [
+        "overall_match", "direct_skills_match", "related_skills_match", "experience_match",
+        "domain_experience", "role_suitability", "missing_skills",
+    ],
+}
+
+ATS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "ats_score": _score("ATS compatibility score"),
+        "good_practices": _string_list("What already works well for ATS parsing"),
+        "issues": _string_list("Specific formatting or content issues"),
+        "missing_keywords": _string_list("Important industry keywords that are missing"),
+        "overused_keywords": _string_list("Keywords that are overused"),
+        "formatting_recommendations": _string_list("Formatting improvements needed"),
+        "section_feedback": {
+            "type": "object",
+            "properties": {
+                "contact_information": {"type": "string"},
+                "professional_summary": {"type": "string"},
+                "skills": {"type": "string"},
+                "experience": {"type": "string"},
+            },
+        },
+        "suggestions": _string_list("3-5 specific actionable improvements"),
+    },
+    "required": ["ats_score", "issues", "missing_keywords", "suggestions"],
+}
+
+# One job's scores inside a batched request (see job_match_batch_schema): the core
+# JOB_MATCH_SCHEMA fields, so both modes describe each score the same way
+_BATCH_FIELDS = ("overall_match", "direct_skills_match", "related_skills_match", "experience_match", "missing_skills")
+JOB_MATCH_BATCH_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {field: JOB_MATCH_SCHEMA["properties"][field] for field in _BATCH_FIELDS},
+    "required": [field for field in _BATCH_FIELDS if field != "missing_skills"],
+}
+
+
+def job_match_batch_schema(job_ids):
+    """Schema for a batched job match reply: one score object per job ID
+
+    Jobs are optional so one omitted job does not discard the rest of the
+    batch; they come back with empty scores.
+    """
+    return {
+        "type": "object",
+        "properties": {job_id: JOB_MATCH_BATCH_ITEM_SCHEMA for job_id in job_ids},
+    }
+
+
+def generation_config_for(schema):
+    """Gemini generation config that forces a JSON reply matching ``schema``"""
+    return {"response_mime_type": "application/json", "response_schema": schema}
+
+
+def _to_number(value, path):
+    if isinstance(value, bool):
+        raise SchemaError(f"{path}: expected a number, got a boolean")
+    if isinstance(value, str):
+        match = re.fullmatch(r"\s*(-?\d+(?:\.\d+)?)\s*%?\s*", value)
+        if not match:
+            raise SchemaError(f"{path}: expected a number, got {value!r}")
+        value = match.group(1)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise SchemaError(f"{path}: expected a number, got {type(value).__name__}")
+    # Every number in these schemas is a 0-100 score
+    return min(max(number, 0.0), 100.0)
+
+
+def validate(value, schema, path="$"):
+    """Return ``value`` coerced to ``schema``; raise SchemaError if it does not fit
+
+    Unknown object keys are dropped and missing optional fields are filled
+    with an empty value of their type, so callers can rely on every field.
+    """
+    kind = schema["type"]
+    if kind == "object":
+        if not isinstance(value, dict):
+            raise SchemaError(f"{path}: expected an object")
+        required = set(schema.get("required", ()))
+        result = {}
+        for name, field_schema in schema["properties"].items():
+            if value.get(name) is None:
+                if name in required:
+                    raise SchemaError(f"{path}.{name}: missing required field")
+                result[name] = _empty(field_schema)
+            else:
+                result[name] = validate(value[name], field_schema, f"{path}.{name}")
+        return result
+    if kind == "array":
+        if not isinstance(value, list):
+            raise SchemaError(f"{path}: expected an array")
+        return [validate(item, schema["items"], f"{path}[{i}]") for i, item in enumerate(value)]
+    if kind == "number":
+        return _to_number(value, path)
+    if kind == "string":
+        if isinstance(value, (dict, list)):
+            raise SchemaError(f"{path}: expected a string")
+        return str(value).strip()
+    raise SchemaError(f"{path}: unsupported schema type {kind!r}")
+
+
+def _empty(schema):
+    kind = schema["type"]
+    if kind == "object":
+        return {name: _empty(field) for name, field in schema["properties"].items()}
+    if kind == "array":
+        return []
+    if kind == "string":
+        return ""
+    return None
+
+
+def parse_structured_response(text, schema):
+    """Parse a JSON response (optionally inside a code fence) and validate it"""
+    text = (text or "").strip()
+    fenced = re.search(r"```(?:json)?\s*(.*?)```", text, re.DOTALL)
+    if fenced:
+        text = fenced.group(1)
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise SchemaError(f"response is not valid JSON: {e}")
+    return validate(data, schema)
@@ -0,0 +1,396 @@
+"""
+Local skill taxonomy with alias matching and related-skill expansion.
+
+Every known skill has a canonical name, aliases ("k8s" -> Kubernetes) and
+parent skills (Pandas -> Data Wrangling -> Data Analysis). All aliases are
+compiled into one Aho-Corasick automaton, so every known skill in a resume or
+job description is found in a single pass over the text. Related skills
+(specific ancestors, descendants and siblings under a specific parent) are precomputed
+per skill, which lets direct and related skill matches be scored locally;
+only skills the taxonomy does not know need the LLM's judgement.
+
+``SKILL_TAXONOMY_PATH`` can point to a JSON file of extra entries in the form
+``{"Skill": {"aliases": [...], "parents": [...]}}``.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import deque
+
+# (canonical name, aliases, parents); a parent needs its own entry to get aliases
+SKILLS = [
+    # Broad categories
+    ("Programming Languages", (), ()),
+    ("Software Engineering", ("software development",), ()),
+    ("Data Analysis", ("data analytics",), ()),
+    ("Data Wrangling", ("data cleaning", "data preparation", "data munging", "data manipulation"), ("Data Analysis",)),
+    ("Data Visualization", ("data viz", "dashboarding"), ("Data Analysis",)),
+    ("Statistics", ("statistical analysis", "statistical modeling", "statistical modelling"), ("Data Analysis",)),
+    ("Machine Learning", ("ml",), ("Data Science",)),
+    ("Deep Learning", ("neural networks",), ("Machine Learning",)),
+    ("Natural Language Processing", ("nlp",), ("Machine Learning",)),
+    ("Computer Vision", (), ("Deep Learning",)),
+    ("Generative AI", ("genai", "gen ai", "large language models", "llms", "llm"), ("Deep Learning",)),
+    ("Data Science", (), ()),
+    ("Data Engineering", ("etl", "elt", "data pipelines"), ()),
+    ("Big Data", (), ("Data Engineering",)),
+    ("Databases", ("database design",), ()),
+    ("SQL Databases", ("relational databases", "rdbms"), ("Databases",)),
+    ("NoSQL Databases", ("nosql",), ("Databases",)),
+    ("Cloud Computing", ("cloud platforms",), ()),
+    ("DevOps", ("devops", "site reliability engineering", "sre"), ()),
+    ("Containers", ("containerization",), ("DevOps",)),
+    ("CI/CD", ("continuous integration", "continuous delivery", "continuous deployment", "ci cd"), ("DevOps",)),
+    ("Infrastructure as Code", ("iac",), ("DevOps",)),
+    ("Web Development", (), ("Software Engineering",)),
+    ("Frontend Development", ("front end development", "front-end development"), ("Web Development",)),
+    ("Backend Development", ("back end development", "back-end development"), ("Web Development",)),
+    ("Mobile Development", ("mobile apps",), ("Software Engineering",)),
+    ("APIs", ("rest", "restful apis", "rest apis", "api design", "web services"), ("Backend Development",)),
+    ("Testing", ("software testing", "unit testing", "test automation", "qa"), ("Software Engineering",)),
+    ("Version Control", ("source control",), ("Software Engineering",)),
+    ("Business Intelligence", ("bi",), ("Data Analysis",)),
+    ("Project Management", (), ()),
+    ("Agile", ("scrum", "kanban", "agile methodologies"), ("Project Management",)),
+    ("Cybersecurity", ("information security", "infosec", "cyber security"), ()),
+
+    # Programming languages
+    ("Python", ("python3", "python 3"), ("Programming Languages",)),
+    ("Java", ("java 8", "java 11", "java 17"), ("Programming Languages",)),
+    ("JavaScript", ("js", "ecmascript", "es6"), ("Programming Languages", "Frontend Development")),
+    ("TypeScript", ("ts",), ("Programming Languages", "JavaScript")),
+    ("C++", ("cpp",), ("Programming Languages",)),
+    ("C#", ("c sharp", "csharp"), ("Programming Languages",)),
+    ("Go", ("golang",), ("Programming Languages",)),
+    ("Rust", (), ("Programming Languages",)),
+    ("Ruby", (), ("Programming Languages",)),
+    ("PHP", (), ("Programming Languages", "Backend Development")),
+    ("Kotlin", (), ("Programming Languages", "Mobile Development")),
+    ("Swift", (), ("Programming Languages", "Mobile Development")),
+    ("Scala", (), ("Programming Languages",)),
+    ("R", ("r programming", "rstudio"), ("Programming Languages", "Statistics")),
+    ("MATLAB", (), ("Programming Languages",)),
+    ("SQL", ("t-sql", "tsql", "pl/sql", "plsql"), ("Programming Languages", "SQL Databases")),
+    ("Bash", ("shell scripting",), ("Programming Languages",)),
+
+    # Data and ML libraries
+    ("Pandas", (), ("Python", "Data Wrangling")),
+    ("Polars", (), ("Python", "Data Wrangling")),
+    ("NumPy", (), ("Python", "Data Wrangling")),
+    ("Excel", ("microsoft excel", "ms excel", "spreadsheets"), ("Data Analysis",)),
+    ("Scikit-learn", ("sklearn", "scikit learn"), ("Python", "Machine Learning")),
+    ("TensorFlow", ("tf", "keras"), ("Python", "Deep Learning")),
+    ("PyTorch", ("torch",), ("Python", "Deep Learning")),
+    ("XGBoost", ("lightgbm", "gradient boosting"), ("Machine Learning",)),
+    ("Hugging Face", ("huggingface", "transformers"), ("Natural Language Processing", "Generative AI")),
+    ("LangChain", (), ("Generative AI",)),
+    ("OpenCV", (), ("Computer Vision",)),
+    ("Matplotlib", ("seaborn",), ("Python", "Data Visualization")),
+    ("Plotly", (), ("Data Visualization",)),
+    ("Tableau", (), ("Data Visualization", "Business Intelligence")),
+    ("Power BI", ("powerbi",), ("Data Visualization", "Business Intelligence")),
+    ("Looker", (), ("Business Intelligence",)),
+    ("Jupyter", ("jupyter notebooks", "ipython"), ("Python", "Data Science")),
+
+    # Data engineering
+    ("Apache Spark", ("spark", "pyspark"), ("Big Data",)),
+    ("Hadoop", ("hdfs", "mapreduce", "hive"), ("Big Data",)),
+    ("Apache Kafka", ("kafka",), ("Data Engineering",)),
+    ("Apache Airflow", ("airflow",), ("Data Engineering",)),
+    ("dbt", ("data build tool",), ("Data Engineering",)),
+    ("Snowflake", (), ("Data Engineering", "SQL Databases")),
+    ("BigQuery", ("google bigquery",), ("Data Engineering", "SQL Databases")),
+    ("Databricks", (), ("Big Data",)),
+
+    # Databases
+    ("PostgreSQL", ("postgres", "psql"), ("SQL Databases",)),
+    ("MySQL", ("mariadb",), ("SQL Databases",)),
+    ("SQL Server", ("mssql", "microsoft sql server"), ("SQL Databases",)),
+    ("Oracle Database", ("oracle db", "oracle"), ("SQL Databases",)),
+    ("SQLite", (), ("SQL Databases",)),
+    ("MongoDB", ("mongo",), ("NoSQL Databases",)),
+    ("Redis", (), ("NoSQL Databases",)),
+    ("Cassandra", (), ("NoSQL Databases",)),
+    ("DynamoDB", (), ("NoSQL Databases", "AWS")),
+    ("Elasticsearch", ("elastic search", "opensearch"), ("NoSQL Databases",)),
+
+    # Cloud and DevOps
+    ("AWS", ("amazon web services", "ec2", "s3", "aws lambda"), ("Cloud Computing",)),
+    ("Azure", ("microsoft azure",), ("Cloud Computing",)),
+    ("Google Cloud", ("gcp", "google cloud platform"), ("Cloud Computing",)),
+    ("Docker", ("dockerfile",), ("Containers",)),
+    ("Kubernetes", ("k8s", "eks", "aks", "gke", "helm"), ("Containers",)),
+    ("Terraform", (), ("Infrastructure as Code",)),
+    ("Ansible", (), ("Infrastructure as Code",)),
+    ("Jenkins", (), ("CI/CD",)),
+    ("GitHub Actions", (), ("CI/CD",)),
+    ("GitLab CI", ("gitlab ci/cd",), ("CI/CD",)),
+    ("Git", ("github", "gitlab", "bitbucket"), ("Version Control",)),
+    ("Linux", ("unix", "ubuntu"), ("DevOps",)),
+
+    # Web and mobile
+    ("HTML", ("html5",), ("Frontend Development",)),
+    ("CSS", ("css3", "sass", "scss", "tailwind", "tailwind css"), ("Frontend Development",)),
+    ("React", ("react.js", "reactjs"), ("JavaScript", "Frontend Development")),
+    ("Angular", ("angularjs", "angular.js"), ("TypeScript", "Frontend Development")),
+    ("Vue.js", ("vue", "vuejs"), ("JavaScript", "Frontend Development")),
+    ("Next.js", ("nextjs",), ("React",)),
+    ("Node.js", ("node", "nodejs", "express.js"), ("JavaScript", "Backend Development")),
+    ("Django", (), ("Python", "Backend Development")),
+    ("Flask", (), ("Python", "Backend Development")),
+    ("FastAPI", (), ("Python", "Backend Development")),
+    ("Streamlit", (), ("Python", "Data Visualization")),
+    ("Spring", ("spring boot", "spring framework"), ("Java", "Backend Development")),
+    (".NET", ("dotnet", "asp.net", ".net core"), ("C#", "Backend Development")),
+    ("Ruby on Rails", ("rails",), ("Ruby", "Backend Development")),
+    ("GraphQL", (), ("APIs",)),
+    ("Microservices", ("microservice architecture",), ("Backend Development",)),
+    ("React Native", (), ("React", "Mobile Development")),
+    ("Flutter", ("dart",), ("Mobile Development",)),
+    ("Android", ("android development",), ("Mobile Development",)),
+    ("iOS", ("ios development",), ("Mobile Development",)),
+
+    # Testing and practices
+    ("pytest", (), ("Python", "Testing")),
+    ("Selenium", (), ("Testing",)),
+    ("Jest", (), ("JavaScript", "Testing")),
+    ("Jira", (), ("Agile",)),
+]
+
+# Parents too broad for their children to count as related to each other (Python is not Java)
+BROAD_PARENTS = frozenset({
+    "Programming Languages", "Software Engineering", "Data Analysis", "Data Science", "Data Engineering", "Databases",
+    "Cloud Computing", "DevOps", "Web Development", "Frontend Development", "Backend Development",
+    "Python", "JavaScript", "Java", "Machine Learning", "Deep Learning",
+})
+
+# Aliases that are also everyday words or letters, with the spellings that count as the skill.
+# Capitalised words ("Go", "Excel") are still skipped before a number ("Spring 2020") and at the
+# start of a sentence or line unless a list separator follows ("Go, Python"). Words too common in job ads to mean the skill even then ("cloud",
+# "analytics", "backend") are not aliases at all.
+CASE_SENSITIVE_ALIASES = {
+    "go": ("Go",), "r": ("R",), "ts": ("TS",), "tf": ("TF",), "js": ("JS",), "rest": ("REST",), "qa": ("QA",),
+    "bi": ("BI",), "ml": ("ML",), "sre": ("SRE",), "iac": ("IaC", "IAC"), "node": ("Node",),
+    "spring": ("Spring",), "swift": ("Swift",), "rust": ("Rust",), "jest": ("Jest",), "excel": ("Excel",),
+    "oracle": ("Oracle", "ORACLE"), "spark": ("Spark",), "hive": ("Hive",), "torch": ("Torch",),
+    "rails": ("Rails",), "dart": ("Dart",),
+}
+
+_NUMBER_AFTER = re.compile(r" ?\d")
+_LIST_AFTER = re.compile(r" ?(?:[,;/|):]|\n|$)")
+
+_WORD_CHARS = frozenset("+#&")
+
+
+def normalize(text):
+    """Lowercase with whitespace runs collapsed, the form all matching happens in"""
+    return re.sub(r"\s+", " ", (text or "").lower())
+
+
+class AhoCorasick:
+    """Multi-pattern string matcher: finds every pattern occurrence in one pass over the text"""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for pattern, value in patterns:
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((len(pattern), value))
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def finditer(self, text):
+        """Yield (start, end, value) for every pattern occurrence, overlaps included"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, value in out[state]:
+                yield i + 1 - length, i + 1, value
+
+
+def _is_word_char(char):
+    return char.isalnum() or char in _WORD_CHARS
+
+
+def _starts_sentence(text, start):
+    """True if ``text[start:]`` begins a sentence or line (start of text, or after . ! ? or a newline)"""
+    before = text[:start].rstrip(" \"'(")
+    return not before or before[-1] in ".!?\n"
+
+
+def _is_ambiguous_mention(lined, start, end):
+    """True if a case-sensitive alias at ``lined[start:end]`` is more likely an ordinary word
+
+    ``lined`` is the text with whitespace collapsed but line breaks kept.
+    """
+    surface = lined[start:end]
+    if surface not in CASE_SENSITIVE_ALIASES[surface.lower()]:
+        return True
+    if len(surface) > 1 and surface[1:].islower():
+        if _NUMBER_AFTER.match(lined, end):
+            return True
+        return _starts_sentence(lined, start) and not _LIST_AFTER.match(lined, end)
+    return False
+
+
+class SkillTaxonomy:
+    """Canonical skills, their aliases and relations, with a one-pass skill extractor"""
+
+    def __init__(self, skills=SKILLS, broad_parents=BROAD_PARENTS):
+        self.parents = {}
+        aliases = {}
+        for name, names, parents in skills:
+            self.parents.setdefault(name, set()).update(parents)
+            for alias in (name,) + tuple(names):
+                aliases[normalize(alias).strip()] = name
+        for parents in list(self.parents.values()):
+            for parent in parents:
+                self.parents.setdefault(parent, set())
+        self.aliases = aliases
+        self.canonical = {normalize(name).strip(): name for name in self.parents}
+
+        self.children = {name: set() for name in self.parents}
+        for name, parents in self.parents.items():
+            for parent in parents:
+                self.children[parent].add(name)
+
+        self.ancestors = {name: self._walk(name, self.parents) for name in self.parents}
+        self.descendants = {name: self._walk(name, self.children) for name in self.parents}
+        self.related = {}
+        for name in self.parents:
+            siblings = set()
+            for parent in self.parents[name]:
+                if parent not in broad_parents:
+                    siblings |= self.children[parent]
+            # Knowing a broad ancestor ("Python") says little about a specific requirement ("Polars")
+            ancestors = self.ancestors[name] - broad_parents
+            self.related[name] = frozenset((ancestors | self.descendants[name] | siblings) - {name})
+
+        # Skills whose own name is an everyday word, so a mention of them is weaker evidence
+        self.ambiguous = frozenset(name for key, name in self.canonical.items() if key in CASE_SENSITIVE_ALIASES)
+        self._matcher = AhoCorasick(aliases.items())
+
+    @staticmethod
+    def _walk(name, edges):
+        seen, stack = set(), list(edges[name])
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.add(node)
+                stack.extend(edges[node])
+        return seen
+
+    def canonicalize(self, skill):
+        """Canonical name for a skill or alias, or None if the taxonomy does not know it"""
+        key = normalize(skill).strip()
+        return self.aliases.get(key) or self.canonical.get(key)
+
+    def is_ambiguous(self, skill):
+        """True for skills whose name is also an everyday word ("Go", "Excel")"""
+        return self.canonicalize(skill) in self.ambiguous
+
+    def extract(self, text):
+        """Canonical skills mentioned in ``text``, in order of first mention
+
+        Matches must sit on word boundaries, and where aliases overlap the
+        longest one wins ("React Native" over "React").
+        """
+        lined = re.sub(r"\s+", lambda m: "\n" if "\n" in m.group() else " ", text or "")
+        original = lined.replace("\n", " ")
+        text = original.lower()
+        if len(text) != len(original):
+            # A few characters change length when lowercased; keep offsets aligned with the original
+            text = "".join(c.lower() if len(c.lower()) == 1 else c for c in original)
+        matches = []
+        for start, end, name in self._matcher.finditer(text):
+            if text[start:end] in CASE_SENSITIVE_ALIASES and _is_ambiguous_mention(lined, start, end):
+                continue
+            if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+                continue
+            if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+                continue
+            matches.append((start, -(end - start), name))
+        matches.sort()
+
+        skills, seen, last_end = [], set(), 0
+        for start, negative_length, name in matches:
+            if start < last_end:
+                continue
+            last_end = start - negative_length
+            if name not in seen:
+                seen.add(name)
+                skills.append(name)
+        return skills
+
+    def match(self, candidate_skills, required_skills):
+        """Compare a candidate's skills with a job's
+
+        Returns direct matches, related matches ({required skill: [candidate
+        skills related to it]}) and missing skills, plus the share of required
+        skills covered directly and directly-or-related as 0-100 percentages.
+        Skills the taxonomy does not know can only match directly.
+        """
+        have = {self.canonicalize(skill) or skill for skill in candidate_skills}
+        direct, related, missing = [], {}, []
+        for skill in required_skills:
+            name = self.canonicalize(skill) or skill
+            if name in have:
+                direct.append(skill)
+                continue
+            close = sorted(have & self.related.get(name, frozenset()))
+            if close:
+                related[skill] = close
+            else:
+                missing.append(skill)
+        total = len(required_skills)
+        return {
+            "direct_skills_match": round(100 * len(direct) / total) if total else None,
+            "related_skills_match": round(100 * (len(direct) + len(related)) / total) if total else None,
+            "matched_skills": direct,
+            "related_skills": related,
+            "missing_skills": missing,
+        }
+
+
+def _load_extra_skills(path):
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    return [(name, tuple(entry.get("aliases", ())), tuple(entry.get("parents", ()))) for name, entry in entries.items()]
+
+
+_taxonomy = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_skill_taxonomy():
+    """Return the process-wide taxonomy, extended from ``SKILL_TAXONOMY_PATH`` if set"""
+    global _taxonomy
+    with _taxonomy_lock:
+        if _taxonomy is None:
+            path = os.getenv("SKILL_TAXONOMY_PATH")
+            _taxonomy = SkillTaxonomy(SKILLS + _load_extra_skills(path) if path else SKILLS)
+        return _taxonomy
@@ -0,0 +1,213 @@
+"""
+Token budgeting for prompt inputs.
+
+Instead of cutting resumes and job descriptions at a fixed character count,
+the text is split into sections and the budget is filled with the sections
+that matter most for each analysis (e.g. experience and skills for job
+matching), truncating only the last section that does not fit. The kept
+sections are emitted in their original order with whitespace collapsed.
+
+Token counts are a local estimate (word pieces of up to four characters plus
+punctuation), close enough to Gemini's tokenizer for budgeting without a
+network round trip.
+"""
+
+import re
+from functools import lru_cache
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+# Heading aliases for the resume sections we rank; anything before the first
+# heading is treated as the header (name and contact details)
+RESUME_SECTION_ALIASES = {
+    "summary": ("summary", "professional summary", "profile", "objective", "about me", "career objective"),
+    "experience": ("experience", "work experience", "professional experience", "employment history",
+                   "work history", "employment", "internships", "internship experience"),
+    "skills": ("skills", "technical skills", "core competencies", "key skills", "technologies", "tools"),
+    "projects": ("projects", "personal projects", "academic projects", "key projects"),
+    "education": ("education", "academic background", "qualifications", "education and training"),
+    "certifications": ("certifications", "certificates", "licenses", "licenses and certifications"),
+    "achievements": ("achievements", "awards", "honors", "honours", "accomplishments"),
+    "publications": ("publications", "research", "papers"),
+    "activities": ("activities", "volunteering", "volunteer experience", "extracurricular activities",
+                   "leadership", "interests", "hobbies", "languages"),
+}
+
+JOB_SECTION_ALIASES = {
+    "requirements": ("requirements", "qualifications", "minimum qualifications", "basic qualifications",
+                     "required qualifications", "what you bring", "what we're looking for",
+                     "what we are looking for", "who you are", "skills", "must have", "required skills"),
+    "preferred": ("preferred qualifications", "nice to have", "bonus points", "preferred skills", "pluses"),
+    "responsibilities": ("responsibilities", "key responsibilities", "what you'll do", "what you will do",
+                         "the role", "role description", "your role", "duties", "job description"),
+    "company": ("about us", "about the company", "who we are", "our mission", "company overview", "about"),
+    "benefits": ("benefits", "perks", "what we offer", "compensation", "salary", "why join us"),
+    "legal": ("equal opportunity", "eeo statement", "equal employment opportunity", "diversity"),
+}
+
+# Section order of importance per analysis; unlisted sections come last
+RESUME_PRIORITIES = {
+    "resume_analysis": ("header", "summary", "experience", "skills", "projects", "education",
+                        "achievements", "certifications", "publications", "activities"),
+    "job_match": ("experience", "skills", "projects", "summary", "education", "certifications", "header"),
+    "tailored_resume": ("experience", "skills", "summary", "projects", "header", "education", "certifications"),
+    "skill_gap": ("skills", "experience", "projects", "certifications", "education", "summary"),
+    "interview_questions": ("experience", "projects", "skills", "summary", "achievements", "education"),
+    "ats_compatibility": ("header", "summary", "skills", "experience", "education", "projects",
+                          "certifications", "achievements", "activities"),
+    "career_recommendations": ("summary", "experience", "skills", "projects", "education",
+                               "achievements", "certifications"),
+}
+# Sections whose lines are commonly "Label: items" ("Languages: Python, Java"); inside them
+# such a line is content, and only a full-line heading starts a new section
+LABELLED_SECTIONS = frozenset({"skills", "requirements", "preferred"})
+
+JOB_PRIORITIES = ("requirements", "responsibilities", "preferred", "header", "company", "benefits", "legal")
+
+# Budgets in estimated tokens, replacing the old 6000/5000/4000/3000 character slices
+RESUME_BUDGETS = {
+    "resume_analysis": 1500,
+    "ats_compatibility": 1250,
+}
+DEFAULT_RESUME_BUDGET = 1000
+JOB_DESCRIPTION_BUDGET = 750
+
+
+def count_tokens(text):
+    """Estimate the number of model tokens in ``text``"""
+    return sum((len(piece) + 3) // 4 for piece in _TOKEN_PATTERN.findall(text or ""))
+
+
+def _heading_lookup(aliases):
+    return {alias: name for name, names in aliases.items() for alias in names}
+
+
+_RESUME_HEADINGS = _heading_lookup(RESUME_SECTION_ALIASES)
+_JOB_HEADINGS = _heading_lookup(JOB_SECTION_ALIASES)
+
+
+def _normalize_heading(text):
+    cleaned = re.sub(r"[^\w\s'/&]", " ", text.replace("&", " and ")).lower()
+    return re.sub(r"\s+", " ", cleaned).strip()
+
+
+def _match_heading(line, headings, inline=True):
+    """Return the section name if ``line`` is a heading (or, with ``inline``, "Heading: content"), else None"""
+    stripped = line.strip()
+    if not stripped or len(stripped) > 60 and ":" not in stripped[:40]:
+        return None
+    name = headings.get(_normalize_heading(stripped))
+    if name is None and inline and ":" in stripped[:40]:
+        name = headings.get(_normalize_heading(stripped.split(":", 1)[0]))
+    return name
+
+
+def split_sections(text, aliases=RESUME_SECTION_ALIASES):
+    """Split ``text`` into [(section name, text)] in document order
+
+    Text before the first recognised heading is the ``header`` section.
+    Repeated headings of the same kind get merged into one section. Inside
+    a section of ``LABELLED_SECTIONS``, "Label: items" lines stay content:
+
+    >>> split_sections("SKILLS\\nLanguages: Python, Java\\nFrameworks: Django")
+    [('skills', 'SKILLS\\nLanguages: Python, Java\\nFrameworks: Django')]
+    >>> [name for name, _ in split_sections("EDUCATION\\nBSc Physics\\nLanguages: French, German")]
+    ['education', 'activities']
+    """
+    headings = _RESUME_HEADINGS if aliases is RESUME_SECTION_ALIASES else (
+        _JOB_HEADINGS if aliases is JOB_SECTION_ALIASES else _heading_lookup(aliases))
+    sections = []
+    current, lines = "header", []
+    for line in (text or "").splitlines():
+        name = _match_heading(line, headings, inline=current not in LABELLED_SECTIONS)
+        if name:
+            sections.append((current, lines))
+            current, lines = name, [line]
+        else:
+            lines.append(line)
+    sections.append((current, lines))
+
+    merged = {}
+    order = []
+    for name, section_lines in sections:
+        body = _collapse_whitespace("\n".join(section_lines))
+        if not body:
+            continue
+        if name in merged:
+            merged[name] += "\n" + body
+        else:
+            merged[name] = body
+            order.append(name)
+    return [(name, merged[name]) for name in order]
+
+
+def _collapse_whitespace(text):
+    lines = [re.sub(r"[^\S\n]+", " ", line).strip() for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def _truncate_to_tokens(text, budget):
+    """Keep whole lines (then whole words) of ``text`` up to ``budget`` tokens"""
+    kept, used = [], 0
+    for line in text.splitlines():
+        cost = count_tokens(line)
+        if used + cost <= budget:
+            kept.append(line)
+            used += cost
+            continue
+        words = []
+        for word in line.split():
+            word_cost = count_tokens(word)
+            if used + word_cost > budget:
+                break
+            words.append(word)
+            used += word_cost
+        if words:
+            kept.append(" ".join(words) + " …")
+        break
+    return "\n".join(kept)
+
+
+def fit_sections(sections, budget, priorities):
+    """Fill ``budget`` tokens with sections in ``priorities`` order; return the text in document order
+
+    Listed sections that fit whole are taken first, so one long experience
+    section cannot crowd out a short skills list; whatever budget is left is
+    then spent on truncated copies of the remaining sections.
+    """
+    rank = {name: i for i, name in enumerate(priorities)}
+    by_priority = sorted(range(len(sections)), key=lambda i: (rank.get(sections[i][0], len(rank)), i))
+
+    chosen = {}
+    remaining = budget
+    for i in by_priority:
+        cost = count_tokens(sections[i][1])
+        if sections[i][0] in rank and cost <= remaining:
+            chosen[i] = sections[i][1]
+            remaining -= cost
+
+    for i in by_priority:
+        if remaining <= 0:
+            break
+        if i in chosen:
+            continue
+        truncated = _truncate_to_tokens(sections[i][1], remaining)
+        # A heading with none of its content is not worth the tokens
+        if truncated and ("\n" in truncated or sections[i][0] == "header"):
+            chosen[i] = truncated
+            remaining -= count_tokens(truncated)
+    return "\n\n".join(chosen[i] for i in sorted(chosen))
+
+
+@lru_cache(maxsize=256)
+def fit_resume(resume_text, analysis, budget=None):
+    """Return the most relevant parts of a resume for ``analysis`` within its token budget"""
+    budget = budget or RESUME_BUDGETS.get(analysis, DEFAULT_RESUME_BUDGET)
+    priorities = RESUME_PRIORITIES.get(analysis, RESUME_PRIORITIES["resume_analysis"])
+    return fit_sections(split_sections(resume_text), budget, priorities)
+
+
+@lru_cache(maxsize=256)
+def fit_job_description(job_description, budget=JOB_DESCRIPTION_BUDGET):
+    """Return a job description trimmed to ``budget`` tokens, keeping requirements and duties first"""
+    return fit_sections(split_sections(job_description, JOB_SECTION_ALIASES), budget, JOB_PRIORITIES)